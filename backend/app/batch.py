@@ -0,0 +1,204 @@
+"""
+Batch scoring of stored interview answers.
+
+Input is JSONL of {"stage", "question", "response"} rows, optionally with
+"id" and "interview_id". Rows are scored with bounded concurrency and each
+result is appended to the output JSONL as soon as it is ready, so the output
+doubles as a checkpoint: re-running with the same output skips every row
+already scored. Rate-limit errors, an open circuit and a full scheduler
+queue pause all workers before the row is retried.
+
+    python -m app.batch score answers.jsonl scored.jsonl --concurrency 8
+    python -m app.batch reweight scored.jsonl reweighted.jsonl --weights weights.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set
+
+from .interview_bot import InterviewBot
+from .llm_policy import CircuitOpen, is_rate_limited
+from .llm_pool import LLMPoolSaturated
+from .metrics import RETRIES_TOTAL
+from .scoring import reweight
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def load_rows(lines: Iterable[str]) -> List[Dict]:
+    """Parse JSONL rows, giving each a stable id (its line number by default)"""
+    rows = []
+    for number, line in enumerate(lines):
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        for field in ("stage", "question", "response"):
+            if field not in row:
+                raise ValueError(f"Row {number + 1} is missing '{field}'")
+        row.setdefault("id", number)
+        rows.append(row)
+    return rows
+
+
+def completed_ids(output_path: str) -> Set[str]:
+    """Ids already scored in an existing output file; failed rows are retried"""
+    if not os.path.exists(output_path):
+        return set()
+    done = set()
+    with open(output_path) as handle:
+        for line in handle:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # A torn last line from an interrupted run
+                continue
+            if "error" not in result:
+                done.add(str(result["id"]))
+    return done
+
+
+class BatchScorer:
+    """Scores answers outside of any interview session"""
+
+    def __init__(self, llm=None, concurrency: int = 8, max_retries: int = 5,
+                 backoff_seconds: float = 1.0):
+        # A bot without session state supplies the scoring call and the LLM cache
+        self.bot = InterviewBot(llm=llm)
+        # Re-scoring only gets LLM capacity that live interviews leave over
+        self.bot.llm_priority = "batch"
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._resume_at = 0.0
+        self.rate_limited = 0
+
+    async def _wait_for_cooldown(self) -> None:
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def score_row(self, row: Dict) -> Dict:
+        for attempt in range(self.max_retries + 1):
+            await self._wait_for_cooldown()
+            try:
+                evaluation = await self.bot.ascore_answer(row["stage"], row["question"], row["response"])
+                break
+            except Exception as e:
+                # Transient upstream errors were already retried by the call
+                # policy; what's left here is rate limiting, an open circuit
+                # and the scheduler turning batch work away
+                if not (is_rate_limited(e) or isinstance(e, (CircuitOpen, LLMPoolSaturated))) \
+                        or attempt == self.max_retries:
+                    raise
+                # Back off every worker, not just this one
+                self.rate_limited += 1
+                RETRIES_TOTAL.inc(kind="evaluate", stage=row["stage"])
+                delay = self.backoff_seconds * 2 ** attempt * (1 + random.random() / 2)
+                delay = max(delay, getattr(e, "retry_after", 0.0))
+                self._resume_at = max(self._resume_at, time.monotonic() + delay)
+                logger.warning(f"Rate limited, retrying row {row['id']} in {delay:.1f}s")
+
+        evaluation["id"] = row["id"]
+        if "interview_id" in row:
+            evaluation["interview_id"] = row["interview_id"]
+        return evaluation
+
+    async def score(self, rows: List[Dict], skip: Optional[Set[str]] = None) -> AsyncIterator[Dict]:
+        """Yield one result per row in completion order; failures carry "error" """
+        skip = skip or set()
+        pending = [row for row in rows if str(row["id"]) not in skip]
+        queue: asyncio.Queue = asyncio.Queue()
+        results: asyncio.Queue = asyncio.Queue()
+        for row in pending:
+            queue.put_nowait(row)
+
+        async def worker():
+            while not queue.empty():
+                row = queue.get_nowait()
+                try:
+                    result = await self.score_row(row)
+                except Exception as e:
+                    logger.error(f"Error scoring row {row['id']}: {str(e)}")
+                    result = {"id": row["id"], "error": str(e)}
+                await results.put(result)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(pending)))]
+        try:
+            for _ in range(len(pending)):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def score_file(self, input_path: str, output_path: str) -> Dict[str, int]:
+        """Score input_path into output_path, resuming from whatever it already holds"""
+        with open(input_path) as handle:
+            rows = load_rows(handle)
+        done = completed_ids(output_path)
+        counts = {"rows": len(rows), "skipped": 0, "scored": 0, "failed": 0}
+        counts["skipped"] = sum(str(row["id"]) in done for row in rows)
+
+        with open(output_path, "a") as out:
+            async for result in self.score(rows, skip=done):
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+                counts["failed" if "error" in result else "scored"] += 1
+        return counts
+
+
+def reweight_file(input_path: str, output_path: str, weights: Optional[Dict] = None) -> Dict:
+    """Re-weight scored rows without LLM calls; returns per-interview totals"""
+    weights = weights or {}
+    with open(input_path) as handle:
+        rows = [json.loads(line) for line in handle if line.strip()]
+    rows = [row for row in rows if "error" not in row]
+
+    overall, interviews = reweight(
+        rows,
+        criteria_weights=weights.get("criteria_weights"),
+        stage_weights=weights.get("stage_weights")
+    )
+    with open(output_path, "w") as out:
+        for row, score in zip(rows, overall.tolist()):
+            row["overall_score"] = score
+            out.write(json.dumps(row) + "\n")
+    return interviews
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch scoring of interview answers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score_cmd = commands.add_parser("score", help="score answers with the LLM")
+    score_cmd.add_argument("input")
+    score_cmd.add_argument("output")
+    score_cmd.add_argument("--concurrency", type=int, default=int(os.getenv('BATCH_CONCURRENCY', '8')))
+    score_cmd.add_argument("--max-retries", type=int, default=5)
+
+    reweight_cmd = commands.add_parser("reweight", help="recompute scores under new weights")
+    reweight_cmd.add_argument("input")
+    reweight_cmd.add_argument("output")
+    reweight_cmd.add_argument("--weights", help='JSON file with "criteria_weights" and/or "stage_weights"')
+    args = parser.parse_args()
+
+    if args.command == "score":
+        from dotenv import load_dotenv
+        load_dotenv()
+        scorer = BatchScorer(concurrency=args.concurrency, max_retries=args.max_retries)
+        counts = asyncio.run(scorer.score_file(args.input, args.output))
+        print(json.dumps(counts))
+    else:
+        weights = None
+        if args.weights:
+            with open(args.weights) as handle:
+                weights = json.load(handle)
+        interviews = reweight_file(args.input, args.output, weights)
+        print(json.dumps(interviews, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,82 +1,232 @@
+import asyncio
+import json
 import os
-from typing import List, Dict, Tuple, Optional
-from langchain_community.document_loaders import PyPDFLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
-from langchain.memory import ConversationBufferMemory
-import google.generativeai as genai
+import re
+import time
+import uuid
+from typing import AsyncIterator, List, Dict, Tuple, Optional
+from pydantic import ValidationError
+from .llm_cache import get_llm_cache
+from .llm_policy import CallPolicy, LLMCallTimeout, get_call_policies, get_circuit_breaker
+from .llm_pool import get_llm
+from .llm_scheduler import PRIORITY_BY_KIND, get_scheduler
+from .memory import ConversationMemory
+from .metrics import span
+from .models import FusedTurn
+from .prompts import (
+    FUSED_NOTHING_TO_SCORE,
+    FUSED_SCORING_INSTRUCTIONS,
+    FUSED_TURN_PROMPT,
+    MEMORY_PROMPT,
+    OPENING_QUESTIONS_PROMPT,
+    QUESTION_PROMPTS,
+    SCORING_PROMPT,
+    STAGE_FOCUS,
+    SUMMARY_PROMPT,
+    TRANSITION_PROMPT,
+)
+from .resume_index import get_resume_index
+from .resume_ingest import extract_pdf_text
+from .score_store import get_score_store
+from .scoring import CRITERIA_WEIGHTS, SCORE_CRITERIA, STAGE_WEIGHTS, overall_score
+from .tokens import estimate_tokens
+from .transition import KeywordTransitionClassifier, log_llm_decision
 import logging
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+_LIST_MARKER = re.compile(r"^\s*(?:[-*\u2022]|\d+[.)])\s*")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _drop_drafts(tasks) -> None:
+    """Cancel unused drafts; one that already failed has its error consumed"""
+    for task in tasks:
+        if task.done():
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+
+
+def _question_lines(text: str) -> List[str]:
+    """One question per non-empty line, without list numbering or bullets"""
+    questions = [_LIST_MARKER.sub("", line).strip() for line in text.splitlines()]
+    return [q for q in questions if q]
+
+
 class InterviewBot:
-    def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-pro",
-            temperature=0.7,
-            google_api_key=os.getenv('GOOGLE_API_KEY')
-        )
-        
-        self.memory = ConversationBufferMemory(
-            memory_key="chat_history",
-            return_messages=True,
-            input_key="candidate_response"
-        )
-        
-        self.interview_stages = [
-            "introduction",
-            "technical",
-            "experience",
-            "behavioral",
-            "closing"
-        ]
+    # Shared, read-only configuration; instances only carry per-session state
+    interview_stages = [
+        "introduction",
+        "technical",
+        "experience",
+        "behavioral",
+        "closing"
+    ]
+    max_interactions_per_stage = 3
+    max_resume_pages = 20
+    # Resume excerpt retrieved per turn; a budget of None sends the full resume
+    resume_top_k = 4
+    resume_token_budget = 300
+    # Conversation history in question prompts: recent turns verbatim plus a
+    # rolling summary, never more than memory_token_budget tokens
+    memory_recent_turns = 3
+    memory_token_budget = 400
+    memory_summary_words = 120
+    # Criterion weights per stage for each answer; the stage weights for the
+    # summary are per session (see __init__). See app/scoring.py for the
+    # vectorized re-weighting pass
+    criteria_weights = CRITERIA_WEIGHTS
+
+    # Call kinds whose replies may be served from the LLM cache. Question
+    # generation is creative and is only cached when added here explicitly.
+    cached_call_kinds = frozenset({"transition", "evaluate", "warm_up"})
+    # Local transition classifier. In shadow mode it never decides: the LLM
+    # is always asked and agreement with confident predictions is logged and
+    # counted (see app/transition.py). With transition_shadow False the LLM
+    # is asked only when the confidence is below transition_confidence. Keep
+    # shadow mode until the rules have been checked against real decision
+    # logs. Set the classifier to None to skip it entirely.
+    transition_classifier = KeywordTransitionClassifier()
+    transition_confidence = 0.8
+    transition_shadow = True
+    # Stages whose opening question is drafted from the resume in the
+    # background at upload, so entering them needs no LLM call. Set to () to
+    # always generate the question when the stage begins.
+    warm_up_stages = ("technical", "experience")
+    warm_up_questions = 3
+    # Deadline, retry and hedging policy per call kind (see app/llm_policy.py);
+    # None uses the process-wide policies built from the environment
+    call_policies = None
+    # Scheduler class for every call this bot makes; None picks it from the
+    # call kind (see PRIORITY_BY_KIND in app/llm_scheduler.py)
+    llm_priority = None
+
+    def __init__(self, llm=None, llm_cache=None):
+        # The client is process-wide; see llm_pool
+        self.llm = llm or get_llm()
+        self.llm_cache = llm_cache if llm_cache is not None else get_llm_cache()
+        self.circuit_breaker = get_circuit_breaker()
+        self.scheduler = get_scheduler()
+        # Evaluations are also appended to the analytics store, under an id
+        # that is not the session id (which grants access to the session)
+        self.score_store = get_score_store()
+        self.interview_id = uuid.uuid4().hex
         
         self.current_stage = 0
+        self.resume_index = None
         self.current_resume = ""
         
-        self.interview_prompt = PromptTemplate(
-            input_variables=["resume_text", "stage", "candidate_response"],
-            template="""
-            You are an experienced HR interviewer conducting a technical interview. 
-            Current resume:
-            {resume_text}
-            
-            Current interview stage: {stage}
-            
-            Candidate's last response: {candidate_response}
-            
-            Based on the current stage and candidate's response, provide the next relevant question.
-            For technical questions, dive deeper if the candidate's response shows expertise.
-            If the response is unclear, ask for clarification.
-            Keep your responses conversational and professional.
-            """
-        )
-        
         self.stage_interaction_count = 0
-        self.max_interactions_per_stage = 3
-        self.response_scores = []
-        self.scoring_weights = {
-            "introduction": 0.15,
-            "technical": 0.35,
-            "experience": 0.25,
-            "behavioral": 0.20,
-            "closing": 0.05
-        }
+        # A copy, so re-weighting one session leaves the others alone
+        self.scoring_weights = dict(STAGE_WEIGHTS)
+        self._reset_scores()
         self.previous_question = None
+        self.memory = self._new_memory()
+        self._memory_task = None
+        # Drafted opening questions per stage (see start_warm_up)
+        self.question_pool = {}
+        self._warm_up_task = None
+        
+        # Evaluations may finish out of order when they run concurrently with
+        # question generation; each one reserves a slot so response_scores
+        # stays in the order the answers were given.
+        self._next_score_seq = 0
+        self._next_flush_seq = 0
+        self._pending_scores = {}
+        
+        # Generate the stay/advance questions alongside the transition check
+        # so the async path costs one LLM round-trip per turn
+        self.speculative_questions = True
+        
+        # Opt-in: ask for transition, question and scores in one JSON reply,
+        # falling back to the separate calls if the reply doesn't validate
+        self.fused_turn = False
+
+    @property
+    def current_resume(self) -> str:
+        return self._current_resume
+
+    @current_resume.setter
+    def current_resume(self, resume_text: str) -> None:
+        # Split and index the resume once, when it is loaded
+        self._current_resume = resume_text
+        self.resume_index = get_resume_index(resume_text) if resume_text else None
+
+    def _resume_excerpt(self, resume_text: str, candidate_response: str) -> str:
+        """The parts of the resume relevant to the candidate's last answer"""
+        if not resume_text or self.resume_token_budget is None:
+            return resume_text
+        index = self.resume_index
+        if index is None or index.text != resume_text:
+            index = get_resume_index(resume_text)
+        return index.excerpt(candidate_response, self.resume_top_k, self.resume_token_budget)
+
+    def to_state(self) -> Dict:
+        """
+        Compact, JSON-serialisable snapshot of the per-session state.
+        The resume is not included; session stores keep it by reference.
+        Evaluations are flattened to [stage index, question, scores, overall, feedback].
+        """
+        return {
+            "v": 1,
+            "id": self.interview_id,
+            "stage": self.current_stage,
+            "count": self.stage_interaction_count,
+            "prev": self.previous_question,
+            "scores": [
+                [
+                    self.interview_stages.index(r['stage']),
+                    r['question'],
+                    [r['detailed_scores'][k] for k in SCORE_CRITERIA],
+                    r['overall_score'],
+                    r['feedback']
+                ]
+                for r in self.response_scores
+            ],
+            "opts": [self.speculative_questions, self.fused_turn],
+            "sum": list(self._summary_cache) if self._summary_cache else None,
+            "mem": self.memory.to_state(),
+            "pool": self.question_pool or None,
+            "weights": self.scoring_weights if self.scoring_weights != STAGE_WEIGHTS else None
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict, resume_text: str = "", llm=None) -> "InterviewBot":
+        """Rebuild a session from to_state() output"""
+        bot = cls(llm=llm)
+        bot.current_resume = resume_text
+        bot.interview_id = state.get("id", bot.interview_id)
+        bot.current_stage = state["stage"]
+        bot.stage_interaction_count = state["count"]
+        bot.previous_question = state["prev"]
+        for stage, question, scores, overall, feedback in state["scores"]:
+            bot._append_score({
+                'stage': cls.interview_stages[stage],
+                'question': question,
+                'detailed_scores': dict(zip(SCORE_CRITERIA, scores)),
+                'overall_score': overall,
+                'feedback': feedback
+            })
+        if state.get("sum"):
+            bot._summary_cache = tuple(state["sum"])
+        bot._next_score_seq = bot._next_flush_seq = len(bot.response_scores)
+        bot.speculative_questions, bot.fused_turn = state["opts"]
+        if state.get("mem"):
+            bot.memory = ConversationMemory.from_state(state["mem"], **bot._memory_options())
+        bot.question_pool = dict(state.get("pool") or {})
+        bot.scoring_weights = dict(state.get("weights") or STAGE_WEIGHTS)
+        return bot
 
     def load_resume(self, file_path: str) -> str:
         """Load and extract text from resume"""
         try:
-            if file_path.endswith('.pdf'):
-                loader = PyPDFLoader(file_path)
-            else:
+            if not file_path.endswith('.pdf'):
                 raise ValueError("Unsupported file format. Please use PDF")
             
-            documents = loader.load()
-            return " ".join([doc.page_content for doc in documents])
+            with span("pdf_load"):
+                return extract_pdf_text(file_path, max_pages=self.max_resume_pages)
         except Exception as e:
             raise Exception(f"Error loading resume: {str(e)}")
 
@@ -89,249 +239,645 @@ class InterviewBot:
             "your background and what interests you about this position?"
         )
 
+    def _policy_for(self, kind: str) -> CallPolicy:
+        policies = self.call_policies or get_call_policies()
+        return policies.get(kind) or policies["default"]
+
+    def _priority_for(self, kind: str) -> str:
+        return self.llm_priority or PRIORITY_BY_KIND.get(kind, "background")
+
+    def _cache_for(self, kind: str):
+        return self.llm_cache if kind in self.cached_call_kinds else None
+
+    def _call_llm(self, kind: str, prompt: str, stage: str = "") -> str:
+        """Invoke the LLM for one call kind and return the reply text"""
+        with span(kind, stage) as call:
+            cache = self._cache_for(kind)
+            if cache is not None:
+                cached = cache.get(prompt)
+                if cached is not None:
+                    call.cache_hit = True
+                    return cached
+            # The slot is taken outside the policy so queueing doesn't count
+            # against the call deadline or the circuit breaker
+            with self.scheduler.slot(self._priority_for(kind), self.interview_id,
+                                     estimate_tokens(prompt)) as ticket:
+                message = self._policy_for(kind).call(
+                    lambda: self.llm.invoke(prompt), self.circuit_breaker, call
+                )
+                call.record_usage(prompt, message)
+                ticket.tokens_used = call.prompt_tokens + call.completion_tokens
+            if cache is not None:
+                cache.put(prompt, message.content)
+            return message.content
+
+    async def _acall_llm(self, kind: str, prompt: str, stage: str = "") -> str:
+        """Async variant of _call_llm"""
+        with span(kind, stage) as call:
+            cache = self._cache_for(kind)
+            if cache is not None:
+                cached = await cache.aget(prompt)
+                if cached is not None:
+                    call.cache_hit = True
+                    return cached
+            async with self.scheduler.aslot(self._priority_for(kind), self.interview_id,
+                                            estimate_tokens(prompt)) as ticket:
+                message = await self._policy_for(kind).acall(
+                    lambda: self.llm.ainvoke(prompt), self.circuit_breaker, call
+                )
+                call.record_usage(prompt, message)
+                ticket.tokens_used = call.prompt_tokens + call.completion_tokens
+            if cache is not None:
+                cache.put(prompt, message.content)
+            return message.content
+
+    def _classify_transition(self, current_stage: str, candidate_response: str) -> Optional[str]:
+        """'yes'/'no' from the local classifier, or None if it isn't confident"""
+        if self.transition_classifier is None or current_stage == "closing":
+            return None
+        decision = self.transition_classifier.predict(current_stage, candidate_response)
+        if decision is None or decision.confidence < self.transition_confidence:
+            return None
+        return "yes" if decision.should_transition else "no"
+
+    def _local_transition(self, current_stage: str, candidate_response: str) -> Optional[str]:
+        """The classifier's decision when it may replace the LLM call"""
+        if self.transition_shadow:
+            return None
+        return self._classify_transition(current_stage, candidate_response)
+
+    def _log_transition(self, current_stage: str, candidate_response: str,
+                        transition_text: str, start: float) -> None:
+        shadow = None
+        if self.transition_shadow:
+            shadow = self._classify_transition(current_stage, candidate_response)
+        log_llm_decision(current_stage, candidate_response, transition_text.strip().lower(),
+                         (time.perf_counter() - start) * 1000, shadow)
+
+    def _decide_transition(self, current_stage: str, candidate_response: str) -> str:
+        local = self._local_transition(current_stage, candidate_response)
+        if local is not None:
+            with span("transition", current_stage) as call:
+                call.outcome = "local"
+            return local
+        start = time.perf_counter()
+        transition_text = self._call_llm(
+            "transition", self._transition_prompt(current_stage, candidate_response), current_stage
+        )
+        self._log_transition(current_stage, candidate_response, transition_text, start)
+        return transition_text
+
+    async def _adecide_transition(self, current_stage: str, candidate_response: str) -> str:
+        local = self._local_transition(current_stage, candidate_response)
+        if local is not None:
+            with span("transition", current_stage) as call:
+                call.outcome = "local"
+            return local
+        start = time.perf_counter()
+        transition_text = await self._acall_llm(
+            "transition", self._transition_prompt(current_stage, candidate_response), current_stage
+        )
+        self._log_transition(current_stage, candidate_response, transition_text, start)
+        return transition_text
+
+    def _enter_stage_for_turn(self) -> str:
+        """Apply the local max-interaction cutoff and return the active stage"""
+        current_stage = self.interview_stages[self.current_stage]
+        
+        # Check if we've reached max interactions for current stage
+        if self.stage_interaction_count >= self.max_interactions_per_stage:
+            if current_stage != "closing":
+                self.current_stage += 1
+                self.stage_interaction_count = 0
+                current_stage = self.interview_stages[self.current_stage]
+                logger.debug(f"Moving to next stage due to max interactions: {current_stage}")
+        
+        return current_stage
+
+    def _apply_transition(self, current_stage: str, transition_text: str) -> str:
+        """Advance the stage if the transition check answered 'yes'"""
+        should_transition = transition_text.strip().lower() == 'yes'
+        
+        if should_transition and current_stage != "closing":
+            self.current_stage += 1
+            self.stage_interaction_count = 0
+            current_stage = self.interview_stages[self.current_stage]
+            logger.debug(f"Moving to next stage: {current_stage}")
+        
+        return current_stage
+
+    def _transition_prompt(self, current_stage: str, candidate_response: str) -> str:
+        return TRANSITION_PROMPT.render(
+            current_stage=current_stage,
+            candidate_response=candidate_response
+        )
+
+    def _question_prompt(self, current_stage: str, resume_text: str, candidate_response: str) -> str:
+        # Only the technical and experience prompts reference the resume
+        needs_resume = current_stage in ["technical", "experience"]
+        return QUESTION_PROMPTS[current_stage].render(
+            candidate_response=candidate_response,
+            resume_text=self._resume_excerpt(resume_text, candidate_response) if needs_resume else "",
+            history=self.memory.render()
+        )
+
+    def _memory_options(self) -> Dict:
+        return {
+            "recent_turns": self.memory_recent_turns,
+            "token_budget": self.memory_token_budget,
+            "summary_words": self.memory_summary_words
+        }
+
+    def _new_memory(self) -> ConversationMemory:
+        return ConversationMemory(**self._memory_options())
+
+    def _memory_prompt(self, turns) -> str:
+        return MEMORY_PROMPT.render(
+            max_words=self.memory_summary_words,
+            summary=self.memory.summary or "(none)",
+            turns="\n".join(turn.text() for turn in turns)
+        )
+
+    def _remember_turn(self, stage: str, question: Optional[str], candidate_response: str,
+                       background: bool = True) -> None:
+        """
+        Add a finished exchange to the conversation memory. Turns pushed out
+        of the verbatim window are summarised in a background task, which
+        runs while the candidate answers; sync callers (background=False)
+        summarise them inline, after the question has been produced.
+        """
+        if not candidate_response:
+            return
+        self.memory.add(stage, question, candidate_response)
+        if not self.memory.pending:
+            return
+        if not background:
+            self._compact_memory()
+            return
+        if self._memory_task and not self._memory_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._memory_task = loop.create_task(self._acompact_memory())
+
+    def _compact_memory(self) -> None:
+        while self.memory.pending:
+            folded = list(self.memory.pending)
+            try:
+                summary = self._call_llm("memory", self._memory_prompt(folded))
+            except Exception as e:
+                logger.warning(f"Conversation summary failed, keeping notes: {str(e)}")
+                return
+            self.memory.apply_summary(folded, summary)
+
+    async def _acompact_memory(self) -> None:
+        """Async variant of _compact_memory"""
+        while self.memory.pending:
+            folded = list(self.memory.pending)
+            try:
+                summary = await self._acall_llm("memory", self._memory_prompt(folded))
+            except Exception as e:
+                logger.warning(f"Conversation summary failed, keeping notes: {str(e)}")
+                return
+            self.memory.apply_summary(folded, summary)
+
+    def _warm_up_prompt(self, stage: str) -> str:
+        focus = STAGE_FOCUS[stage]
+        return OPENING_QUESTIONS_PROMPT.render(
+            stage=stage,
+            focus=focus,
+            count=self.warm_up_questions,
+            resume_text=self._resume_excerpt(self.current_resume, focus)
+        )
+
+    def start_warm_up(self) -> None:
+        """
+        Draft opening questions for warm_up_stages in the background, while
+        the candidate answers the greeting. Needs a running event loop.
+        """
+        if not self.warm_up_stages or not self.current_resume:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._warm_up_task = loop.create_task(self._awarm_up())
+
+    async def _awarm_up(self) -> None:
+        async def draft(stage: str) -> None:
+            try:
+                text = await self._acall_llm("warm_up", self._warm_up_prompt(stage), stage)
+            except Exception as e:
+                logger.warning(f"Question warm-up for {stage} failed: {str(e)}")
+                return
+            questions = _question_lines(text)
+            if questions:
+                self.question_pool[stage] = questions
+        
+        await asyncio.gather(*(draft(stage) for stage in self.warm_up_stages))
+
+    def _background_tasks(self) -> List[asyncio.Task]:
+        return [t for t in (self._memory_task, self._warm_up_task) if t is not None and not t.done()]
+
+    @property
+    def has_background_work(self) -> bool:
+        """Whether a memory summary or question warm-up is still running"""
+        return bool(self._background_tasks())
+
+    async def wait_for_background(self) -> None:
+        """Let the memory summary and question warm-up finish, e.g. before a snapshot"""
+        tasks = self._background_tasks()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def merge_question_pool(self, pool: Dict[str, List[str]]) -> None:
+        """Adopt drafts stored apart from the session for stages not yet begun"""
+        for stage, questions in pool.items():
+            if self.interview_stages.index(stage) > self.current_stage:
+                self.question_pool.setdefault(stage, questions)
+
+    def _opening_question(self, stage: str, candidate_response: str) -> Optional[str]:
+        """
+        A drafted question for a stage that is just beginning, if one is
+        ready: the one sharing most words with the candidate's last answer.
+        """
+        if stage not in self.warm_up_stages or not self.current_resume:
+            return None
+        questions = self.question_pool.get(stage)
+        if questions is None and self._warm_up_task is None:
+            # Rebuilt from a session store; the drafts may be in the LLM cache
+            cache = self._cache_for("warm_up")
+            cached = cache.get(self._warm_up_prompt(stage)) if cache is not None else None
+            if cached:
+                questions = _question_lines(cached)
+        if not questions:
+            return None
+        words = set(_WORD.findall(candidate_response.lower()))
+        question = max(questions, key=lambda q: len(words & set(_WORD.findall(q.lower()))))
+        with span("question", stage) as call:
+            call.outcome = "warm"
+        return question
+
+    def _cutoff_opening(self, stage: str, candidate_response: str) -> Optional[str]:
+        """
+        The drafted opening for a stage the max-interaction cutoff has just
+        entered. The transition check is skipped then, since it would only
+        ask whether an answer to the previous stage already covers this one.
+        """
+        if self.stage_interaction_count != 0:
+            return None
+        return self._opening_question(stage, candidate_response)
+
+    def _next_question_text(self, stage: str, resume_text: str, candidate_response: str) -> str:
+        if self.stage_interaction_count == 0:
+            opening = self._opening_question(stage, candidate_response)
+            if opening is not None:
+                return opening
+        return self._call_llm(
+            "question", self._question_prompt(stage, resume_text, candidate_response), stage
+        )
+
+    async def _anext_question_text(self, stage: str, resume_text: str, candidate_response: str,
+                                   entering: bool = False) -> str:
+        """
+        Async variant of _next_question_text; `entering` marks a draft for the
+        stage after the current one, which would begin with this question
+        """
+        if entering or self.stage_interaction_count == 0:
+            opening = self._opening_question(stage, candidate_response)
+            if opening is not None:
+                return opening
+        return await self._acall_llm(
+            "question", self._question_prompt(stage, resume_text, candidate_response), stage
+        )
+
+    def _record_question(self, current_stage: str, question_text: str) -> str:
+        question = question_text.strip()
+        
+        # Increment interaction count
+        self.stage_interaction_count += 1
+        # Drafted openings are only used as a stage begins
+        self.question_pool.pop(current_stage, None)
+        
+        logger.debug(f"Current stage: {current_stage}")
+        logger.debug(f"Generated question: {question}")
+        
+        return question
+
     def get_next_question(self, resume_text: str, candidate_response: str) -> str:
         """Get next question based on current stage and candidate response"""
         try:
-            current_stage = self.interview_stages[self.current_stage]
-            
-            # Check if we've reached max interactions for current stage
-            if self.stage_interaction_count >= self.max_interactions_per_stage:
-                if current_stage != "closing":
-                    self.current_stage += 1
-                    self.stage_interaction_count = 0
-                    current_stage = self.interview_stages[self.current_stage]
-                    logger.debug(f"Moving to next stage due to max interactions: {current_stage}")
+            current_stage = self._enter_stage_for_turn()
+            opening = self._cutoff_opening(current_stage, candidate_response)
+            if opening is not None:
+                return self._record_question(current_stage, opening)
             
             # Analyze if we should move to the next stage based on response
-            stage_transition_prompt = f"""
-            You are an AI analyzing interview responses.
-            Current stage: {current_stage}
-            Candidate's response: {candidate_response}
-            
-            Determine if we should move to the next stage based on:
-            - Introduction stage: Have they covered their background and education?
-            - Technical stage: Have they demonstrated their technical knowledge?
-            - Experience stage: Have they explained their project implementations?
-            - Behavioral stage: Have they shown their soft skills and problem-solving approach?
+            transition_text = self._decide_transition(current_stage, candidate_response)
+            current_stage = self._apply_transition(current_stage, transition_text)
             
-            Respond with ONLY 'yes' to move to next stage, or 'no' to continue current stage.
-            """
+            question_text = self._next_question_text(current_stage, resume_text, candidate_response)
+            return self._record_question(current_stage, question_text)
             
-            transition_response = self.llm.invoke(stage_transition_prompt)
-            should_transition = transition_response.content.strip().lower() == 'yes'
-            
-            if should_transition and current_stage != "closing":
-                self.current_stage += 1
-                self.stage_interaction_count = 0
-                current_stage = self.interview_stages[self.current_stage]
-                logger.debug(f"Moving to next stage: {current_stage}")
-
-            # Generate question based on current stage and previous response
-            stage_prompts = {
-                "introduction": """
-                You are an HR interviewer named Natasha conducting a professional interview.
-                Previous response: {candidate_response}
-                
-                Generate a natural follow-up question focusing on:
-                - Educational background
-                - Academic achievements
-                - General professional background
-                - Career journey and aspirations
-                
-                RULES:
-                - Keep questions professional and focused
-                - Make it conversational and natural
-                - Don't mention interview stages
-                - One clear question at a time
-                - Consider the candidate's previous response
-                
-                Respond with ONLY the question, nothing else.
-                """,
-                
-                "technical": """
-                You are a technical interviewer.
-                Resume: {resume_text}
-                Previous response: {candidate_response}
-                
-                Generate a technical follow-up question that:
-                - Builds upon their previous response
-                - Assesses specific technical skills mentioned in their resume
-                - Tests depth of technical knowledge
-                - Focuses on core technologies they've worked with
-                
-                Keep questions specific and technical.
-                Respond with ONLY the question, nothing else.
-                """,
-                
-                "experience": """
-                You are a technical interviewer.
-                Resume: {resume_text}
-                Previous response: {candidate_response}
-                
-                Generate a follow-up question about:
-                - Specific projects they've mentioned
-                - Technical challenges and solutions
-                - Implementation details
-                - Real-world application of their skills
-                - Impact and results of their work
-                
-                Focus on practical experience and implementation.
-                Respond with ONLY the question, nothing else.
-                """,
-                
-                "behavioral": """
-                You are an HR interviewer.
-                Previous response: {candidate_response}
-                
-                Generate a natural follow-up behavioral question that assesses:
-                - Problem-solving approach
-                - Team collaboration
-                - Handling challenges
-                - Leadership qualities
-                - Conflict resolution
-                
-                Use STAR (Situation, Task, Action, Result) format.
-                Consider their previous response for context.
-                Respond with ONLY the question, nothing else.
-                """,
-                
-                "closing": """
-                You are an HR interviewer wrapping up the interview.
-                Previous response: {candidate_response}
-                
-                Generate a closing question about:
-                - Role clarification
-                - Company culture
-                - Next steps
-                - Start date availability
-                - Any final questions
-                
-                Keep it professional and welcoming.
-                Respond with ONLY the question, nothing else.
-                """
-            }
+        except Exception as e:
+            logger.error(f"Error in get_next_question: {str(e)}")
+            raise 
 
-            # Format the prompt with the candidate's response and resume
-            prompt = stage_prompts[current_stage].format(
-                candidate_response=candidate_response,
-                resume_text=resume_text if current_stage in ["technical", "experience"] else ""
-            )
+    async def aget_next_question(self, resume_text: str, candidate_response: str) -> str:
+        """Async variant of get_next_question that never blocks the event loop"""
+        try:
+            current_stage = self._enter_stage_for_turn()
+            opening = self._cutoff_opening(current_stage, candidate_response)
+            if opening is not None:
+                return self._record_question(current_stage, opening)
             
-            response = self.llm.invoke(prompt)
-            question = response.content.strip()
+            if current_stage == "closing":
+                # The closing stage never transitions, so skip the check
+                question_text = await self._acall_llm(
+                    "question", self._question_prompt(current_stage, resume_text, candidate_response), current_stage
+                )
+                return self._record_question(current_stage, question_text)
             
-            # Increment interaction count
-            self.stage_interaction_count += 1
+            # Speculation only pays off while the transition needs the LLM
+            if (not self.speculative_questions
+                    or self._local_transition(current_stage, candidate_response) is not None):
+                transition_text = await self._adecide_transition(current_stage, candidate_response)
+                current_stage = self._apply_transition(current_stage, transition_text)
+                
+                question_text = await self._anext_question_text(current_stage, resume_text, candidate_response)
+                return self._record_question(current_stage, question_text)
             
-            logger.debug(f"Current stage: {current_stage}")
-            logger.debug(f"Generated question: {question}")
+            # Speculatively draft the question for both outcomes of the
+            # transition check; the unused draft is cancelled, not awaited
+            next_stage = self.interview_stages[self.current_stage + 1]
+            drafts = {
+                current_stage: asyncio.create_task(
+                    self._anext_question_text(current_stage, resume_text, candidate_response)
+                ),
+                next_stage: asyncio.create_task(
+                    self._anext_question_text(next_stage, resume_text, candidate_response, entering=True)
+                ),
+            }
+            try:
+                transition_text = await self._adecide_transition(current_stage, candidate_response)
+                new_stage = self._apply_transition(current_stage, transition_text)
+            except BaseException:
+                _drop_drafts(drafts.values())
+                raise
             
-            return question
+            _drop_drafts(task for stage, task in drafts.items() if stage != new_stage)
+            question_text = await drafts[new_stage]
+            return self._record_question(new_stage, question_text)
             
         except Exception as e:
-            logger.error(f"Error in get_next_question: {str(e)}")
+            logger.error(f"Error in aget_next_question: {str(e)}")
             raise 
 
-    def evaluate_response(self, candidate_response: str, question: str) -> Dict:
+    def _scoring_prompt(self, current_stage: str, candidate_response: str, question: str) -> str:
+        return SCORING_PROMPT.render(
+            current_stage=current_stage,
+            question=question,
+            candidate_response=candidate_response
+        )
+
+    def _parse_evaluation(self, current_stage: str, question: str, eval_content: str) -> Dict:
+        eval_text = eval_content.strip().split('\n')
+        
+        scores = {}
+        feedback = ""
+        
+        for line in eval_text:
+            if ':' in line:
+                key, value = line.split(':', 1)
+                key = key.strip()
+                value = value.strip()
+                
+                if key == 'FEEDBACK':
+                    feedback = value
+                else:
+                    # Convert N/A or any non-numeric value to 0
+                    try:
+                        score = float(value)
+                        # Ensure score is between 0 and 10
+                        score = max(0, min(10, score))
+                    except (ValueError, TypeError):
+                        score = 0.0
+                    scores[key.lower().replace('_score', '')] = score
+        
+        return self._build_evaluation(current_stage, question, scores, feedback)
+
+    def _build_evaluation(self, current_stage: str, question: str,
+                          scores: Dict[str, float], feedback: str) -> Dict:
+        # Ensure all required scores exist
+        for score_key in SCORE_CRITERIA:
+            if score_key not in scores:
+                scores[score_key] = 0.0
+        
+        return {
+            'stage': current_stage,
+            'question': question,
+            'detailed_scores': scores,
+            'overall_score': overall_score(current_stage, scores, self.criteria_weights),
+            'feedback': feedback or "No feedback provided"
+        }
+
+    def _default_evaluation(self, current_stage: str, question: str, error: Exception) -> Dict:
+        logger.error(f"Error in evaluate_response: {str(error)}")
+        # Return a default evaluation in case of error
+        default_scores = {
+            'relevance': 0.0,
+            'depth': 0.0,
+            'clarity': 0.0,
+            'technical': 0.0
+        }
+        return {
+            'stage': current_stage,
+            'question': question,
+            'detailed_scores': default_scores,
+            'overall_score': 0.0,
+            'feedback': f"Error evaluating response: {str(error)}",
+            # Not a real zero: the answer was left out of the summary
+            'scoring_failed': True
+        }
+
+    def _reserve_score_slot(self) -> int:
+        seq = self._next_score_seq
+        self._next_score_seq += 1
+        return seq
+
+    def _record_evaluation(self, seq: int, evaluation: Optional[Dict]) -> None:
+        """Store an evaluation in its slot and flush every completed slot in order"""
+        self._pending_scores[seq] = evaluation
+        while self._next_flush_seq in self._pending_scores:
+            ready = self._pending_scores.pop(self._next_flush_seq)
+            # Failed evaluations hold their slot but are not scored
+            if ready is not None:
+                self._append_score(ready)
+                if self.score_store is not None:
+                    self.score_store.record(self.interview_id, ready)
+            self._next_flush_seq += 1
+
+    def _append_score(self, evaluation: Dict) -> None:
+        """Add a scored answer, keeping the per-stage running aggregates current"""
+        self.response_scores.append(evaluation)
+        self._stage_totals[evaluation['stage']] += evaluation['overall_score']
+        self._stage_counts[evaluation['stage']] += 1
+        # Any cached summary is for an older version from here on
+        self.scores_version += 1
+
+    def _reset_scores(self) -> None:
+        self.response_scores = []
+        self._stage_totals = dict.fromkeys(self.interview_stages, 0)
+        self._stage_counts = dict.fromkeys(self.interview_stages, 0)
+        self.scores_version = 0
+        # (version, narrative) of the last generated summary
+        self._summary_cache = None
+        self._summary_inflight = None
+
+    def evaluate_response(self, candidate_response: str, question: str,
+                          stage: Optional[str] = None) -> Dict:
         """
         Evaluate candidate response and return scoring details
         """
-        current_stage = self.interview_stages[self.current_stage]
-        
-        scoring_prompt = f"""
-        You are an expert interview evaluator. Evaluate the following candidate response:
-        
-        Stage: {current_stage}
-        Question Asked: {question}
-        Candidate Response: {candidate_response}
-        
-        Score the response on these criteria (0-10 scale, use 0 if not applicable):
-        1. Relevance: How directly does it answer the question?
-        2. Depth: How detailed and thorough is the response?
-        3. Clarity: How well-structured and clear is the communication?
-        4. Technical Accuracy: How technically sound is the response? (use 0 for non-technical questions)
-        
-        Provide your evaluation in the following format ONLY:
-        RELEVANCE_SCORE: [number between 0-10]
-        DEPTH_SCORE: [number between 0-10]
-        CLARITY_SCORE: [number between 0-10]
-        TECHNICAL_SCORE: [number between 0-10]
-        FEEDBACK: [Brief 1-2 sentence feedback]
-        """
+        current_stage = stage or self.interview_stages[self.current_stage]
+        seq = self._reserve_score_slot()
         
         try:
-            response = self.llm.invoke(scoring_prompt)
-            eval_text = response.content.strip().split('\n')
-            
-            scores = {}
-            feedback = ""
-            
-            for line in eval_text:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if key == 'FEEDBACK':
-                        feedback = value
-                    else:
-                        # Convert N/A or any non-numeric value to 0
-                        try:
-                            score = float(value)
-                            # Ensure score is between 0 and 10
-                            score = max(0, min(10, score))
-                        except (ValueError, TypeError):
-                            score = 0.0
-                        scores[key.lower().replace('_score', '')] = score
-            
-            # Ensure all required scores exist
-            required_scores = ['relevance', 'depth', 'clarity', 'technical']
-            for score_key in required_scores:
-                if score_key not in scores:
-                    scores[score_key] = 0.0
-            
-            # Calculate weighted score based on stage
-            if current_stage == 'technical':
-                weights = {'relevance': 0.25, 'depth': 0.3, 'clarity': 0.15, 'technical': 0.3}
-            elif current_stage == 'experience':
-                weights = {'relevance': 0.3, 'depth': 0.3, 'clarity': 0.2, 'technical': 0.2}
-            else:
-                weights = {'relevance': 0.4, 'depth': 0.3, 'clarity': 0.3, 'technical': 0.0}
+            eval_text = self._call_llm(
+                "evaluate", self._scoring_prompt(current_stage, candidate_response, question), current_stage
+            )
+            evaluation = self._parse_evaluation(current_stage, question, eval_text)
             
-            total_score = sum(scores[k] * v for k, v in weights.items())
+            self._record_evaluation(seq, evaluation)
+            logger.debug(f"Evaluation completed: {evaluation}")
+            return evaluation
             
-            evaluation = {
-                'stage': current_stage,
-                'question': question,
-                'detailed_scores': scores,
-                'overall_score': round(total_score, 2),
-                'feedback': feedback or "No feedback provided"
-            }
+        except Exception as e:
+            self._record_evaluation(seq, None)
+            return self._default_evaluation(current_stage, question, e)
+
+    async def ascore_answer(self, stage: str, question: str, candidate_response: str) -> Dict:
+        """
+        Score one answer without recording it on this session. Unlike
+        aevaluate_response, LLM errors are raised to the caller.
+        """
+        eval_text = await self._acall_llm(
+            "evaluate", self._scoring_prompt(stage, candidate_response, question), stage
+        )
+        return self._parse_evaluation(stage, question, eval_text)
+
+    async def aevaluate_response(self, candidate_response: str, question: str,
+                                 stage: Optional[str] = None) -> Dict:
+        """
+        Async variant of evaluate_response
+        """
+        current_stage = stage or self.interview_stages[self.current_stage]
+        seq = self._reserve_score_slot()
+        
+        try:
+            evaluation = await self.ascore_answer(current_stage, question, candidate_response)
             
-            self.response_scores.append(evaluation)
+            self._record_evaluation(seq, evaluation)
             logger.debug(f"Evaluation completed: {evaluation}")
             return evaluation
             
+        except asyncio.CancelledError:
+            # Free the slot so later evaluations still flush
+            self._record_evaluation(seq, None)
+            raise
         except Exception as e:
-            logger.error(f"Error in evaluate_response: {str(e)}")
-            # Return a default evaluation in case of error
-            default_scores = {
-                'relevance': 0.0,
-                'depth': 0.0,
-                'clarity': 0.0,
-                'technical': 0.0
-            }
+            self._record_evaluation(seq, None)
+            return self._default_evaluation(current_stage, question, e)
+
+    def _stage_scores(self) -> Tuple[Dict[str, float], float]:
+        # Stage averages come from the running totals kept by _append_score
+        stage_scores = {}
+        for stage in self.interview_stages:
+            count = self._stage_counts[stage]
+            stage_scores[stage] = round(self._stage_totals[stage] / count, 2) if count else 0
+        
+        # Calculate weighted total score
+        total_score = sum(
+            stage_scores[stage] * self.scoring_weights[stage]
+            for stage in self.interview_stages
+        )
+        return stage_scores, total_score
+
+    def _summary_prompt(self, stage_scores: Dict[str, float], total_score: float) -> str:
+        return SUMMARY_PROMPT.render(
+            stage_lines="\n".join(f"{stage.capitalize()}: {score}/10" for stage, score in stage_scores.items()),
+            overall_score=round(total_score, 2)
+        )
+
+    def _build_summary(self, stage_scores: Dict[str, float], total_score: float,
+                       summary: str, early_termination: bool) -> Dict:
+        result = {
+            "overall_score": round(total_score, 2),
+            "stage_scores": stage_scores,
+            "detailed_scores": self.response_scores,
+            "summary": summary
+        }
+        if early_termination:
+            result["early_termination"] = True
+        return result
+
+    def _cached_narrative(self) -> Optional[str]:
+        if self._summary_cache and self._summary_cache[0] == self.scores_version:
+            return self._summary_cache[1]
+        return None
+
+    @property
+    def summary_narrative(self) -> Optional[Tuple[int, str]]:
+        """(score version, narrative) of the last generated summary, if any"""
+        return self._summary_cache
+
+    def merge_summary_narrative(self, version: int, narrative: str) -> None:
+        """Adopt a narrative stored apart from the session if it is newer than ours"""
+        if not self._summary_cache or version > self._summary_cache[0]:
+            self._summary_cache = (version, narrative)
+
+    def get_interview_summary(self, early_termination: bool = False) -> Dict:
+        """
+        Generate comprehensive interview summary with scores.
+        The LLM narrative is generated once per version of the score list.
+        """
+        if not self.response_scores:
             return {
-                'stage': current_stage,
-                'question': question,
-                'detailed_scores': default_scores,
-                'overall_score': 0.0,
-                'feedback': f"Error evaluating response: {str(e)}"
+                "overall_score": 0,
+                "stage_scores": {},
+                "summary": "No responses to evaluate"
             }
+        
+        stage_scores, total_score = self._stage_scores()
+        
+        summary = self._cached_narrative()
+        if summary is None:
+            version = self.scores_version
+            try:
+                summary = self._call_llm(
+                    "summary", self._summary_prompt(stage_scores, total_score)
+                ).strip()
+                self._summary_cache = (version, summary)
+            except Exception as e:
+                logger.error(f"Error generating interview summary: {str(e)}")
+                summary = "Error generating summary"
+        
+        return self._build_summary(stage_scores, total_score, summary, early_termination)
+
+    async def _agenerate_narrative(self, stage_scores: Dict[str, float], total_score: float) -> str:
+        version = self.scores_version
+        summary = (await self._acall_llm(
+            "summary", self._summary_prompt(stage_scores, total_score)
+        )).strip()
+        self._summary_cache = (version, summary)
+        return summary
 
-    def get_interview_summary(self) -> Dict:
+    async def aget_interview_summary(self, early_termination: bool = False) -> Dict:
         """
-        Generate comprehensive interview summary with scores
+        Async variant of get_interview_summary. Concurrent callers for the
+        same score version share a single LLM call.
         """
         if not self.response_scores:
             return {
@@ -340,68 +886,139 @@ class InterviewBot:
                 "summary": "No responses to evaluate"
             }
         
-        # Calculate stage averages
-        stage_scores = {}
-        for stage in self.interview_stages:
-            stage_responses = [r for r in self.response_scores if r['stage'] == stage]
-            if stage_responses:
-                stage_scores[stage] = round(
-                    sum(r['overall_score'] for r in stage_responses) / len(stage_responses),
-                    2
+        stage_scores, total_score = self._stage_scores()
+        
+        summary = self._cached_narrative()
+        if summary is None:
+            if not self._summary_inflight or self._summary_inflight[0] != self.scores_version:
+                self._summary_inflight = (
+                    self.scores_version,
+                    asyncio.ensure_future(self._agenerate_narrative(stage_scores, total_score))
                 )
-            else:
-                stage_scores[stage] = 0
+            task = self._summary_inflight[1]
+            try:
+                summary = await asyncio.shield(task)
+            except Exception as e:
+                logger.error(f"Error generating interview summary: {str(e)}")
+                summary = "Error generating summary"
+            finally:
+                if self._summary_inflight and self._summary_inflight[1] is task:
+                    self._summary_inflight = None
         
-        # Calculate weighted total score
-        total_score = sum(
-            stage_scores[stage] * self.scoring_weights[stage]
-            for stage in self.interview_stages
+        return self._build_summary(stage_scores, total_score, summary, early_termination)
+
+    def _fused_turn_prompt(self, current_stage: str, resume_text: str,
+                           candidate_response: str, question_asked: Optional[str]) -> str:
+        is_closing = current_stage == "closing"
+        next_stage = current_stage if is_closing else self.interview_stages[self.current_stage + 1]
+        needs_resume = current_stage in ["technical", "experience"] or next_stage in ["technical", "experience"]
+        
+        return FUSED_TURN_PROMPT.render(
+            current_stage=current_stage,
+            current_focus=STAGE_FOCUS[current_stage],
+            next_stage=next_stage,
+            next_focus=STAGE_FOCUS[next_stage],
+            resume_text=self._resume_excerpt(resume_text, candidate_response) if needs_resume else "",
+            candidate_response=candidate_response,
+            history=self.memory.render(),
+            scoring_instructions=(
+                FUSED_SCORING_INSTRUCTIONS.format(question=question_asked)
+                if question_asked else FUSED_NOTHING_TO_SCORE
+            )
         )
+
+    def _parse_fused_turn(self, content: str, question_asked: Optional[str]) -> FusedTurn:
+        # Models often wrap JSON in a markdown code fence
+        text = re.sub(r"^```(?:json)?\s*|\s*```$", "", content.strip())
+        turn = FusedTurn.model_validate(json.loads(text))
+        if question_asked and turn.scores is None:
+            raise ValueError("Fused reply is missing scores")
+        return turn
+
+    def _apply_fused_turn(self, turn: FusedTurn, current_stage: str, eval_stage: str,
+                          question_asked: Optional[str], candidate_response: str,
+                          background: bool = True) -> Dict:
+        evaluation = None
+        if question_asked and candidate_response:
+            evaluation = self._build_evaluation(
+                eval_stage,
+                question_asked,
+                turn.scores.model_dump(),
+                turn.feedback or ""
+            )
+            self._record_evaluation(self._reserve_score_slot(), evaluation)
+            logger.debug(f"Evaluation completed: {evaluation}")
         
-        summary_prompt = f"""
-        Generate a brief interview summary based on these scores:
+        current_stage = self._apply_transition(
+            current_stage, "yes" if turn.move_to_next_stage else "no"
+        )
+        next_question = self._record_question(current_stage, turn.question)
+        self._remember_turn(eval_stage, question_asked, candidate_response, background)
+        self.previous_question = next_question
         
-        Stage Scores:
-        {chr(10).join(f"{stage.capitalize()}: {score}/10" for stage, score in stage_scores.items())}
+        return {
+            "question": next_question,
+            "evaluation": evaluation,
+            "stage": self.interview_stages[self.current_stage]
+        }
+
+    def _fused_process_response(self, resume_text: str, candidate_response: str) -> Optional[Dict]:
+        """Run a fused turn, returning None if the reply couldn't be used"""
+        question_asked = self.previous_question
+        eval_stage = self.interview_stages[self.current_stage]
+        saved_position = (self.current_stage, self.stage_interaction_count)
+        current_stage = self._enter_stage_for_turn()
         
-        Overall Score: {round(total_score, 2)}/10
+        try:
+            fused_text = self._call_llm("fused", self._fused_turn_prompt(
+                current_stage, resume_text, candidate_response, question_asked
+            ), current_stage)
+            turn = self._parse_fused_turn(fused_text, question_asked)
+        except (ValueError, ValidationError) as e:
+            logger.warning(f"Fused turn reply rejected, falling back: {str(e)}")
+            self.current_stage, self.stage_interaction_count = saved_position
+            return None
         
-        Provide a concise summary with:
-        1. Overall assessment (2-3 sentences)
-        2. Key strengths (2-3 bullet points)
-        3. Areas for improvement (1-2 bullet points)
-        """
+        return self._apply_fused_turn(turn, current_stage, eval_stage, question_asked, candidate_response,
+                                      background=False)
+
+    async def _afused_process_response(self, resume_text: str, candidate_response: str) -> Optional[Dict]:
+        """Async variant of _fused_process_response"""
+        question_asked = self.previous_question
+        eval_stage = self.interview_stages[self.current_stage]
+        saved_position = (self.current_stage, self.stage_interaction_count)
+        current_stage = self._enter_stage_for_turn()
         
         try:
-            response = self.llm.invoke(summary_prompt)
-            
-            return {
-                "overall_score": round(total_score, 2),
-                "stage_scores": stage_scores,
-                "detailed_scores": self.response_scores,
-                "summary": response.content.strip()
-            }
-            
-        except Exception as e:
-            logger.error(f"Error generating interview summary: {str(e)}")
-            return {
-                "overall_score": round(total_score, 2),
-                "stage_scores": stage_scores,
-                "detailed_scores": self.response_scores,
-                "summary": "Error generating summary"
-            }
+            fused_text = await self._acall_llm("fused", self._fused_turn_prompt(
+                current_stage, resume_text, candidate_response, question_asked
+            ), current_stage)
+            turn = self._parse_fused_turn(fused_text, question_asked)
+        except (ValueError, ValidationError) as e:
+            logger.warning(f"Fused turn reply rejected, falling back: {str(e)}")
+            self.current_stage, self.stage_interaction_count = saved_position
+            return None
+        
+        return self._apply_fused_turn(turn, current_stage, eval_stage, question_asked, candidate_response)
 
     def process_response(self, resume_text: str, candidate_response: str) -> Dict:
         """
         Process candidate response and return next question with evaluation
         """
+        if self.fused_turn:
+            result = self._fused_process_response(resume_text, candidate_response)
+            if result is not None:
+                return result
+        
         # Evaluate previous response if there was a question
         evaluation = None
+        answered_stage = self.interview_stages[self.current_stage]
         if self.previous_question and candidate_response:
             evaluation = self.evaluate_response(candidate_response, self.previous_question)
         
         # Get next question
         next_question = self.get_next_question(resume_text, candidate_response)
+        self._remember_turn(answered_stage, self.previous_question, candidate_response, background=False)
         
         # Store question for next evaluation
         self.previous_question = next_question
@@ -410,4 +1027,211 @@ class InterviewBot:
             "question": next_question,
             "evaluation": evaluation,
             "stage": self.interview_stages[self.current_stage]
-        } 
\ No newline at end of file
+        }
+
+    async def aprocess_response(self, resume_text: str, candidate_response: str) -> Dict:
+        """
+        Async variant of process_response, used by the API routes.
+        Scoring the previous answer runs concurrently with generating the next
+        question, since the question does not depend on the score.
+        """
+        if self.fused_turn:
+            result = await self._afused_process_response(resume_text, candidate_response)
+            if result is not None:
+                return result
+        
+        evaluation_task = None
+        # Capture the stage now; question generation may advance it
+        answered_stage = self.interview_stages[self.current_stage]
+        if self.previous_question and candidate_response:
+            evaluation_task = asyncio.create_task(self.aevaluate_response(
+                candidate_response,
+                self.previous_question,
+                stage=answered_stage
+            ))
+        
+        try:
+            next_question = await self.aget_next_question(resume_text, candidate_response)
+        except Exception:
+            if evaluation_task:
+                # Let the score land in its slot even though the turn failed
+                await evaluation_task
+            raise
+        
+        self._remember_turn(answered_stage, self.previous_question, candidate_response)
+        self.previous_question = next_question
+        evaluation = await evaluation_task if evaluation_task else None
+        
+        return {
+            "question": next_question,
+            "evaluation": evaluation,
+            "stage": self.interview_stages[self.current_stage]
+        }
+
+
+    def _start_question_stream(self, prompt: str, stage: str) -> Tuple[asyncio.Task, asyncio.Queue]:
+        """Stream a question into a queue; ends with None or the raised exception"""
+        queue = asyncio.Queue()
+        
+        async def stream_once(chunks: List[str]) -> None:
+            async for chunk in self.llm.astream(prompt):
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    queue.put_nowait(chunk.content)
+        
+        async def pump():
+            policy = self._policy_for("question")
+            try:
+                with span("question", stage) as call:
+                    async with self.scheduler.aslot(self._priority_for("question"), self.interview_id,
+                                                    estimate_tokens(prompt)) as ticket:
+                        chunks = []
+                        attempt = 0
+                        while True:
+                            self.circuit_breaker.before_call()
+                            try:
+                                await asyncio.wait_for(stream_once(chunks), policy.timeout)
+                                break
+                            except asyncio.TimeoutError:
+                                error = LLMCallTimeout(f"LLM call exceeded {policy.timeout}s")
+                            except asyncio.CancelledError:
+                                # Unused speculative draft
+                                self.circuit_breaker.release()
+                                raise
+                            except Exception as e:
+                                error = e
+                            # Once tokens reached the client a retry would repeat
+                            # them, so treat the attempt as the last one
+                            last = policy.max_retries if chunks else attempt
+                            await asyncio.sleep(policy.on_failure(error, last, self.circuit_breaker, call))
+                            attempt += 1
+                        self.circuit_breaker.record_success()
+                        call.prompt_tokens = estimate_tokens(prompt)
+                        call.completion_tokens = estimate_tokens("".join(chunks))
+                        ticket.tokens_used = call.prompt_tokens + call.completion_tokens
+                queue.put_nowait(None)
+            except Exception as e:
+                queue.put_nowait(e)
+        
+        return asyncio.create_task(pump()), queue
+
+    def _ready_draft(self, text: str) -> Tuple[asyncio.Future, asyncio.Queue]:
+        """A finished draft holding `text` as its single chunk"""
+        queue = asyncio.Queue()
+        queue.put_nowait(text)
+        queue.put_nowait(None)
+        done = asyncio.get_running_loop().create_future()
+        done.set_result(None)
+        return done, queue
+
+    def _start_question_draft(self, stage: str, resume_text: str, candidate_response: str,
+                              entering: bool = False) -> Tuple[asyncio.Future, asyncio.Queue]:
+        """_start_question_stream for a stage, or its drafted opening as a single chunk"""
+        if entering or self.stage_interaction_count == 0:
+            opening = self._opening_question(stage, candidate_response)
+            if opening is not None:
+                return self._ready_draft(opening)
+        return self._start_question_stream(
+            self._question_prompt(stage, resume_text, candidate_response), stage
+        )
+
+    async def astream_response(self, resume_text: str,
+                               candidate_response: str) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Streaming variant of aprocess_response. Yields (event, data) pairs:
+        'stage' once the transition is decided, 'token' for each chunk of the
+        next question, 'question' with the full text, 'evaluation' when scoring
+        of the previous answer completes and a final 'done' with timings.
+        """
+        start = time.perf_counter()
+        first_token_at = None
+        
+        evaluation_task = None
+        answered_stage = self.interview_stages[self.current_stage]
+        if self.previous_question and candidate_response:
+            evaluation_task = asyncio.create_task(self.aevaluate_response(
+                candidate_response,
+                self.previous_question,
+                stage=answered_stage
+            ))
+        
+        drafts = {}
+        # The stage moves as soon as the transition is decided, but the turn
+        # only counts once the whole question has been produced
+        saved_position = (self.current_stage, self.stage_interaction_count)
+        committed = False
+        try:
+            current_stage = self._enter_stage_for_turn()
+            opening = self._cutoff_opening(current_stage, candidate_response)
+            if opening is not None:
+                drafts[current_stage] = self._ready_draft(opening)
+            elif current_stage == "closing":
+                drafts[current_stage] = self._start_question_stream(
+                    self._question_prompt(current_stage, resume_text, candidate_response), current_stage
+                )
+            else:
+                # When the local classifier decides, only the chosen stage
+                # needs a question, started right after the decision below
+                candidate_stages = []
+                if self._local_transition(current_stage, candidate_response) is None:
+                    candidate_stages.append(current_stage)
+                if candidate_stages and self.speculative_questions:
+                    # Start streaming both possible questions while the
+                    # transition check runs; the unused draft is cancelled
+                    candidate_stages.append(self.interview_stages[self.current_stage + 1])
+                for stage in candidate_stages:
+                    drafts[stage] = self._start_question_draft(
+                        stage, resume_text, candidate_response, entering=stage != current_stage
+                    )
+                
+                transition_text = await self._adecide_transition(current_stage, candidate_response)
+                current_stage = self._apply_transition(current_stage, transition_text)
+                if current_stage not in drafts:
+                    drafts[current_stage] = self._start_question_draft(current_stage, resume_text, candidate_response)
+            yield "stage", {"stage": current_stage}
+            
+            for stage, (task, _) in drafts.items():
+                if stage != current_stage:
+                    task.cancel()
+            
+            _, queue = drafts[current_stage]
+            chunks = []
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                chunks.append(item)
+                yield "token", {"text": item}
+            
+            next_question = self._record_question(current_stage, "".join(chunks))
+            self._remember_turn(answered_stage, self.previous_question, candidate_response)
+            self.previous_question = next_question
+            committed = True
+            yield "question", {"question": next_question}
+        except Exception as e:
+            logger.error(f"Error in astream_response: {str(e)}")
+            if evaluation_task:
+                # Let the score land in its slot even though the turn failed
+                await evaluation_task
+            raise
+        finally:
+            # Also runs when the client disconnects and the generator is closed
+            for task, _ in drafts.values():
+                task.cancel()
+            if not committed:
+                self.current_stage, self.stage_interaction_count = saved_position
+                if evaluation_task:
+                    evaluation_task.cancel()
+        
+        evaluation = await evaluation_task if evaluation_task else None
+        yield "evaluation", {"evaluation": evaluation}
+        
+        end = time.perf_counter()
+        yield "done", {
+            "ttft_ms": round((first_token_at - start) * 1000, 1) if first_token_at else None,
+            "total_ms": round((end - start) * 1000, 1)
+        }
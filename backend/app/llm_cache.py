@@ -0,0 +1,194 @@
+"""
+Response-level cache in front of LLM calls.
+
+Keys are a hash of the normalized prompt (case and whitespace folded,
+punctuation ending a line dropped), so near-duplicate answers such as "Yes."
+and "yes" share an entry. Other punctuation is kept: "C++" and "C", or "5.0"
+and "50", are different answers and must not share scores.
+Entries live in an in-process LRU with a TTL and, optionally, in a SQLite
+file that survives restarts. The async API never touches SQLite on the event
+loop: disk lookups run in the default executor, and all writes go through one
+writer thread that commits them in batches.
+"""
+import asyncio
+import hashlib
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+_TRAILING_PUNCTUATION = re.compile(r"[.,;:!?]+$")
+
+# Most rows committed in one transaction by the writer thread
+WRITE_BATCH = 256
+
+
+def normalize_prompt(prompt: str) -> str:
+    lines = (" ".join(line.split()) for line in prompt.lower().splitlines())
+    return "\n".join(_TRAILING_PUNCTUATION.sub("", line) for line in lines if line)
+
+
+def prompt_key(prompt: str) -> str:
+    return hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 86400,
+                 sqlite_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        # Serializes the connection between lookups and the writer thread
+        self._db_lock = threading.Lock()
+        self._writes = queue.Queue()
+        self._writer = None
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def _remember(self, key: str, value: str, created: float) -> None:
+        self._entries[key] = (created, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _memory_get(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created, value = entry
+            if now - created < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+            return None
+
+    def _disk_get(self, key: str, now: float) -> Optional[str]:
+        row = None
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT value, created FROM llm_cache WHERE key = ? AND created > ?",
+                    (key, now - self.ttl_seconds)
+                ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self._remember(key, row[0], row[1])
+            self.hits += 1
+            self.disk_hits += 1
+            return row[0]
+
+    def get(self, prompt: str) -> Optional[str]:
+        key = prompt_key(prompt)
+        now = time.time()
+        value = self._memory_get(key, now)
+        if value is not None:
+            return value
+        return self._disk_get(key, now)
+
+    async def aget(self, prompt: str) -> Optional[str]:
+        """Async variant of get; a disk lookup runs off the event loop"""
+        key = prompt_key(prompt)
+        now = time.time()
+        value = self._memory_get(key, now)
+        if value is not None:
+            return value
+        if self._db is None:
+            return self._disk_get(key, now)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._disk_get, key, now)
+
+    def put(self, prompt: str, value: str) -> None:
+        """Store a reply; the disk write is queued for the writer thread"""
+        key = prompt_key(prompt)
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            if self._db is None:
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="llm-cache-writer", daemon=True)
+                self._writer.start()
+        self._writes.put((key, value, now))
+
+    def _write_loop(self) -> None:
+        while True:
+            rows = [self._writes.get()]
+            while len(rows) < WRITE_BATCH:
+                try:
+                    rows.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._db_lock:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO llm_cache (key, value, created) VALUES (?, ?, ?)", rows
+                    )
+                    self._db.commit()
+            except sqlite3.Error:
+                logger.exception("Failed to write %d LLM cache entries", len(rows))
+            finally:
+                for _ in rows:
+                    self._writes.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued disk write is committed"""
+        self._writes.join()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Process-wide cache configured from the environment (None when disabled)"""
+    global _cache
+    if os.getenv('LLM_CACHE_ENABLED', 'true').lower() in ('0', 'false', 'no'):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMCache(
+                    max_entries=int(os.getenv('LLM_CACHE_SIZE', '10000')),
+                    ttl_seconds=float(os.getenv('LLM_CACHE_TTL_SECONDS', '86400')),
+                    sqlite_path=os.getenv('LLM_CACHE_SQLITE_PATH') or None
+                )
+    return _cache
+
+
+def flush_llm_cache() -> None:
+    """Commit disk writes still queued by the process-wide cache"""
+    with _cache_lock:
+        if _cache is not None:
+            _cache.flush()
@@ -0,0 +1,295 @@
+"""
+Deadlines, retries, circuit breaking and hedging around LLM calls.
+
+Every LLM request made by InterviewBot goes through a CallPolicy for its call
+kind. Each attempt has a deadline, and transient failures (timeouts, 429s,
+5xx) are retried with jittered exponential backoff. The async path can also
+hedge: if the first attempt has not answered after ``hedge_after`` seconds,
+a duplicate is sent and whichever finishes first wins. A process-wide
+CircuitBreaker stops sending requests for a while after repeated transient
+failures, so callers fail fast instead of queueing behind a dead upstream.
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable, Dict, Optional
+
+from .llm_pool import LLMPoolSaturated
+import logging
+
+logger = logging.getLogger(__name__)
+
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+TRANSIENT_ERROR_NAMES = {
+    "ResourceExhausted", "ServiceUnavailable", "InternalServerError",
+    "DeadlineExceeded", "TooManyRequests", "GatewayTimeout",
+}
+
+
+class LLMCallTimeout(TimeoutError):
+    """Raised when an LLM call misses its deadline"""
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling the LLM while the circuit breaker is open"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"LLM circuit open, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    for attr in ("code", "status_code"):
+        code = getattr(error, attr, None)
+        if callable(code):
+            try:
+                code = code()
+            except Exception:
+                code = None
+        if isinstance(code, int):
+            return code
+    return None
+
+
+def is_rate_limited(error: Exception) -> bool:
+    if isinstance(error, LLMPoolSaturated):
+        return True
+    return _status_code(error) == 429 or "ResourceExhausted" in type(error).__name__ or "429" in str(error)
+
+
+def is_transient(error: Exception) -> bool:
+    """Whether retrying the same request could succeed"""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    if isinstance(error, (LLMPoolSaturated, CircuitOpen)):
+        # Local back-pressure: retrying here would only queue deeper
+        return False
+    if _status_code(error) in TRANSIENT_STATUS_CODES:
+        return True
+    return type(error).__name__ in TRANSIENT_ERROR_NAMES or is_rate_limited(error)
+
+
+class CircuitBreaker:
+    """
+    Opens after ``failure_threshold`` consecutive transient failures. While
+    open every call fails with CircuitOpen; after ``reset_seconds`` a single
+    probe is let through and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self.opened_at >= self.reset_seconds else "open"
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.reset_seconds - (time.monotonic() - self.opened_at)
+            if remaining > 0 or self._probing:
+                raise CircuitOpen(max(remaining, 0.0))
+            self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning(f"LLM circuit opened after {self.failures} failures")
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+    def release(self) -> None:
+        """End a probe whose failure says nothing about upstream health"""
+        with self._lock:
+            self._probing = False
+
+
+# Sync calls run here so a deadline can be enforced; a timed-out call keeps
+# its thread until the client gives up, but the caller is released. Built on
+# first use so LLM_SYNC_THREADS can come from a .env loaded after import.
+_sync_executor: Optional[ThreadPoolExecutor] = None
+_sync_executor_lock = threading.Lock()
+
+
+def _get_sync_executor() -> ThreadPoolExecutor:
+    global _sync_executor
+    if _sync_executor is None:
+        with _sync_executor_lock:
+            if _sync_executor is None:
+                _sync_executor = ThreadPoolExecutor(
+                    max_workers=int(os.getenv('LLM_SYNC_THREADS', '32')), thread_name_prefix="llm-call"
+                )
+    return _sync_executor
+
+
+class CallPolicy:
+    """Retry and hedging settings for one call kind; a timeout of None means no deadline"""
+
+    def __init__(self, timeout: Optional[float] = 20.0, max_retries: int = 2, backoff_base: float = 0.5,
+                 backoff_max: float = 8.0, hedge_after: Optional[float] = None):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge_after = hedge_after
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter in [50%, 100%] of the step"""
+        return min(self.backoff_max, self.backoff_base * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+    def on_failure(self, error: Exception, attempt: int, breaker: CircuitBreaker, span=None) -> float:
+        """
+        Record a failed attempt and return the backoff before the next one;
+        re-raise the error unless it should be retried. call() and acall()
+        use this, as do callers that run the attempts themselves (streaming).
+        """
+        if not is_transient(error):
+            breaker.release()
+            raise error
+        breaker.record_failure()
+        if attempt >= self.max_retries:
+            raise error
+        if span is not None:
+            span.retries += 1
+        delay = self.backoff(attempt)
+        logger.warning(f"LLM call failed ({type(error).__name__}: {error}), retrying in {delay:.2f}s")
+        return delay
+
+    def call(self, make_call: Callable, breaker: CircuitBreaker, span=None):
+        """Run a blocking call under this policy (no hedging)"""
+        attempt = 0
+        while True:
+            breaker.before_call()
+            future = _get_sync_executor().submit(make_call)
+            try:
+                result = future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                future.cancel()
+                error = LLMCallTimeout(f"LLM call exceeded {self.timeout}s")
+                time.sleep(self.on_failure(error, attempt, breaker, span))
+            except Exception as e:
+                time.sleep(self.on_failure(e, attempt, breaker, span))
+            else:
+                breaker.record_success()
+                return result
+            attempt += 1
+
+    async def acall(self, make_call: Callable[[], Awaitable], breaker: CircuitBreaker, span=None):
+        """Run an async call under this policy, hedging it when configured"""
+        attempt = 0
+        while True:
+            breaker.before_call()
+            try:
+                result = await asyncio.wait_for(self._attempt(make_call, span), self.timeout)
+            except asyncio.TimeoutError:
+                error = LLMCallTimeout(f"LLM call exceeded {self.timeout}s")
+                await asyncio.sleep(self.on_failure(error, attempt, breaker, span))
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception as e:
+                await asyncio.sleep(self.on_failure(e, attempt, breaker, span))
+            else:
+                breaker.record_success()
+                return result
+            attempt += 1
+
+    async def _attempt(self, make_call: Callable[[], Awaitable], span):
+        if self.hedge_after is None:
+            return await make_call()
+
+        tasks = {asyncio.ensure_future(make_call())}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_after)
+            if not done:
+                # Slow first attempt: race a duplicate against it
+                if span is not None:
+                    span.hedges += 1
+                tasks.add(asyncio.ensure_future(make_call()))
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def _env_float(name: str, default: Optional[float]) -> Optional[float]:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return float(value) if value.strip().lower() not in ("", "0", "none") else None
+
+
+def default_call_policies() -> Dict[str, CallPolicy]:
+    """
+    Per call kind policies; LLM_TIMEOUT_SECONDS etc. override the defaults.
+    LLM_TIMEOUT_SECONDS=0 (or none) removes the deadline for every kind.
+    """
+    timeout = _env_float('LLM_TIMEOUT_SECONDS', 20.0)
+    retries = int(os.getenv('LLM_MAX_RETRIES', '2'))
+    # The transition check and the question decide when the candidate sees
+    # the next question, so only they hedge; scoring is not worth doubling
+    hedge_after = _env_float('LLM_HEDGE_AFTER_SECONDS', 4.0)
+    transition_timeout = None if timeout is None else min(timeout, 10.0)
+    summary_timeout = None if timeout is None else timeout * 1.5
+    return {
+        "default": CallPolicy(timeout=timeout, max_retries=retries),
+        "transition": CallPolicy(timeout=transition_timeout, max_retries=retries, hedge_after=hedge_after),
+        "question": CallPolicy(timeout=timeout, max_retries=retries, hedge_after=hedge_after),
+        "evaluate": CallPolicy(timeout=timeout, max_retries=retries + 1),
+        "summary": CallPolicy(timeout=summary_timeout, max_retries=retries),
+        "fused": CallPolicy(timeout=timeout, max_retries=1),
+    }
+
+
+_policies: Optional[Dict[str, CallPolicy]] = None
+_breaker: Optional[CircuitBreaker] = None
+_breaker_lock = threading.Lock()
+
+
+def get_call_policies() -> Dict[str, CallPolicy]:
+    """Process-wide default_call_policies(), read from the environment on first use"""
+    global _policies
+    if _policies is None:
+        with _breaker_lock:
+            if _policies is None:
+                _policies = default_call_policies()
+    return _policies
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Process-wide breaker, shared like the pooled LLM client it protects"""
+    global _breaker
+    if _breaker is None:
+        with _breaker_lock:
+            if _breaker is None:
+                _breaker = CircuitBreaker(
+                    failure_threshold=int(os.getenv('LLM_BREAKER_FAILURES', '5')),
+                    reset_seconds=float(os.getenv('LLM_BREAKER_RESET_SECONDS', '30'))
+                )
+    return _breaker
@@ -0,0 +1,169 @@
+"""
+Process-wide LLM clients shared by every interview session.
+
+One ChatGoogleGenerativeAI per (model, temperature) is created lazily and
+reused, so sessions share its HTTP/gRPC connections instead of opening their
+own. Calls go through a PooledLLM that caps in-flight requests per process
+and rejects work once too many callers are already waiting. The Gemini
+client library is imported with the first client, not with the app.
+"""
+import asyncio
+import os
+import threading
+import weakref
+from typing import Callable, Dict, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gemini-pro"
+DEFAULT_TEMPERATURE = 0.7
+
+
+class LLMPoolSaturated(Exception):
+    """Raised when the LLM wait queue is full"""
+
+
+def _default_factory(model: str, temperature: float):
+    # Importing the client costs over a second; keep it off the startup path
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        google_api_key=os.getenv('GOOGLE_API_KEY')
+    )
+
+
+class PooledLLM:
+    """Shared LLM client with a concurrency cap and bounded wait queue"""
+
+    def __init__(self, client, max_concurrency: int, max_queue: int):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.waiting = 0
+        self._lock = threading.Lock()
+        self._thread_slots = threading.BoundedSemaphore(max_concurrency)
+        # asyncio primitives are bound to one event loop, so keep one per loop
+        self._loop_slots = weakref.WeakKeyDictionary()
+
+    @property
+    def saturated(self) -> bool:
+        """True while new calls would be rejected"""
+        return self.waiting >= self.max_queue
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue
+            }
+
+    def _enqueue(self) -> None:
+        with self._lock:
+            if self.waiting >= self.max_queue:
+                raise LLMPoolSaturated(
+                    f"LLM pool saturated ({self.in_flight} in flight, {self.waiting} waiting)"
+                )
+            self.waiting += 1
+
+    def _started(self) -> None:
+        with self._lock:
+            self.waiting -= 1
+            self.in_flight += 1
+
+    def _finished(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def _async_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._loop_slots.get(loop)
+        if slots is None:
+            slots = self._loop_slots[loop] = asyncio.Semaphore(self.max_concurrency)
+        return slots
+
+    def invoke(self, prompt, **kwargs):
+        self._enqueue()
+        with self._thread_slots:
+            self._started()
+            try:
+                return self.client.invoke(prompt, **kwargs)
+            finally:
+                self._finished()
+
+    async def ainvoke(self, prompt, **kwargs):
+        self._enqueue()
+        try:
+            slots = self._async_slots()
+            await slots.acquire()
+        except BaseException:
+            with self._lock:
+                self.waiting -= 1
+            raise
+        self._started()
+        try:
+            return await self.client.ainvoke(prompt, **kwargs)
+        finally:
+            self._finished()
+            slots.release()
+
+    async def astream(self, prompt, **kwargs):
+        self._enqueue()
+        try:
+            slots = self._async_slots()
+            await slots.acquire()
+        except BaseException:
+            with self._lock:
+                self.waiting -= 1
+            raise
+        self._started()
+        try:
+            async for chunk in self.client.astream(prompt, **kwargs):
+                yield chunk
+        finally:
+            self._finished()
+            slots.release()
+
+
+_registry: Dict[Tuple[str, float], PooledLLM] = {}
+_registry_lock = threading.Lock()
+_factory: Callable = _default_factory
+
+
+def get_llm(model: str = DEFAULT_MODEL, temperature: float = DEFAULT_TEMPERATURE) -> PooledLLM:
+    """Return the shared client for this model and temperature, creating it once"""
+    key = (model, temperature)
+    pooled = _registry.get(key)
+    if pooled is None:
+        with _registry_lock:
+            pooled = _registry.get(key)
+            if pooled is None:
+                pooled = PooledLLM(
+                    _factory(model, temperature),
+                    max_concurrency=int(os.getenv('LLM_MAX_CONCURRENCY', '64')),
+                    max_queue=int(os.getenv('LLM_MAX_QUEUE', '1024'))
+                )
+                _registry[key] = pooled
+                logger.info(f"Created shared LLM client for {model} at temperature {temperature}")
+    return pooled
+
+
+def pool_stats() -> Dict[str, Dict]:
+    """Load of every shared client, keyed by model@temperature"""
+    with _registry_lock:
+        pools = list(_registry.items())
+    return {f"{model}@{temperature}": dict(pooled.stats(), saturated=pooled.saturated)
+            for (model, temperature), pooled in pools}
+
+
+def set_client_factory(factory: Callable) -> None:
+    """Replace how clients are built (e.g. with a local fake) and drop existing ones"""
+    global _factory
+    with _registry_lock:
+        _factory = factory
+        _registry.clear()
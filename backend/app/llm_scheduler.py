@@ -0,0 +1,341 @@
+"""
+Central scheduler for LLM calls: priority classes, per-session fairness and
+quota.
+
+Every LLM call made by InterviewBot first takes a slot here. Waiting calls
+are queued by priority class: interactive (transition checks and questions),
+then evaluation, then background summaries, then batch re-scoring. Within a
+class, sessions take turns, so one session's burst of calls can't starve the
+others. A slot is granted when fewer than max_concurrency calls are in
+flight and the request and token buckets (the configured per-minute quota)
+allow it. The highest-priority waiter always goes first, and background
+and batch calls leave some slots and some of the quota burst unused, so an
+interactive call arriving behind a backlog starts almost at once.
+
+Admission control sits in front of the queue. Background and batch calls
+are refused with LLMPoolSaturated once their share of the queue is full.
+Evaluations are never refused: a score can wait behind interactive work,
+and there is at most one per answered turn. They still count towards
+admitting new sessions, which are refused with SchedulerSaturated and a
+Retry-After estimate when the queue is full or an interactive call would
+wait longer than admission_wait.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, AsyncIterator
+
+from .llm_pool import LLMPoolSaturated
+from .metrics import REGISTRY
+import logging
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = ("interactive", "evaluation", "background", "batch")
+PRIORITY_BY_KIND = {
+    "transition": "interactive",
+    "question": "interactive",
+    "fused": "interactive",
+    "evaluate": "evaluation",
+    "summary": "background",
+    "memory": "background",
+    "warm_up": "background",
+}
+# Share of max_queue that may be waiting when a call of each class arrives;
+# None queues the call whatever the backlog (deferred evaluations are not
+# counted against the other classes either)
+QUEUE_SHARE = {"interactive": 1.0, "evaluation": None, "background": 0.5, "batch": 0.25}
+# Share of the slots and of the quota burst kept free for higher classes, so
+# an interactive call arriving behind a batch backlog doesn't wait for one
+# to finish or for the bucket to refill
+HEADROOM = {"interactive": 0.0, "evaluation": 0.0, "background": 0.25, "batch": 0.5}
+
+QUEUE_DEPTH = REGISTRY.gauge(
+    "llm_scheduler_queue_depth", "LLM calls waiting for a slot", ("priority",)
+)
+IN_FLIGHT = REGISTRY.gauge("llm_scheduler_in_flight", "LLM calls holding a slot")
+QUEUE_WAIT = REGISTRY.histogram(
+    "llm_scheduler_wait_seconds", "Time LLM calls spent queued", ("priority",)
+)
+REJECTED = REGISTRY.counter(
+    "llm_scheduler_rejected_total", "Calls and new sessions refused by admission control", ("priority",)
+)
+
+
+class SchedulerSaturated(Exception):
+    """Raised instead of admitting a new session while the scheduler is saturated"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Interview capacity exhausted, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Refills at `rate` per second up to `capacity`; charges may overdraw it"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.level = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` can be taken (anything above capacity needs a full bucket)"""
+        self._refill(now)
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= amount
+
+
+class Ticket:
+    """One queued or running call. Set tokens_used to charge the actual size"""
+
+    __slots__ = ("priority", "session", "tokens", "tokens_used", "granted", "enqueued", "notify")
+
+    def __init__(self, priority: str, session: str, tokens: int, notify: Callable[[], None]):
+        self.priority = priority
+        self.session = session
+        self.tokens = tokens
+        self.tokens_used = tokens
+        self.granted = False
+        self.enqueued = time.monotonic()
+        self.notify = notify
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class LLMScheduler:
+    def __init__(self, max_concurrency: int = 64, max_queue: int = 1024,
+                 requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 burst_seconds: float = 5.0, admission_wait: float = 5.0):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.admission_wait = admission_wait
+        self.in_flight = 0
+        self.waiting = dict.fromkeys(PRIORITIES, 0)
+        # Moving averages behind the Retry-After estimate
+        self.service_seconds = 1.0
+        self.average_tokens = 500.0
+        self._requests = TokenBucket(requests_per_minute / 60, max(1.0, requests_per_minute / 60 * burst_seconds)) \
+            if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute / 60, tokens_per_minute / 60 * burst_seconds) \
+            if tokens_per_minute else None
+        # priority -> session -> that session's waiting tickets, in arrival order
+        self._queues: Dict[str, OrderedDict] = {p: OrderedDict() for p in PRIORITIES}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def _quota_wait(self, tokens: int, headroom: float, now: float) -> float:
+        wait = 0.0
+        if self._requests is not None:
+            wait = self._requests.wait_time(1 + headroom * self._requests.capacity, now)
+        if self._tokens is not None:
+            wait = max(wait, self._tokens.wait_time(tokens + headroom * self._tokens.capacity, now))
+        return wait
+
+    def _dispatch(self) -> List[Ticket]:
+        """Grant slots to waiters in priority order; call with the lock held"""
+        granted = []
+        now = time.monotonic()
+        while self.in_flight < self.max_concurrency:
+            priority = next((p for p in PRIORITIES if self.waiting[p]), None)
+            if priority is None:
+                break
+            sessions = self._queues[priority]
+            session, tickets = next(iter(sessions.items()))
+            ticket = tickets[0]
+            headroom = HEADROOM[priority]
+            if self.in_flight >= self.max_concurrency * (1 - headroom):
+                # Lower classes can't use the slots this one leaves free
+                break
+            delay = self._quota_wait(ticket.tokens, headroom, now)
+            if delay > 0:
+                self._retry_after(delay)
+                break
+            tickets.popleft()
+            if tickets:
+                # Round robin: this session goes behind the others in its class
+                sessions.move_to_end(session)
+            else:
+                del sessions[session]
+            self.waiting[priority] -= 1
+            if self._requests is not None:
+                self._requests.take(1, now)
+            if self._tokens is not None:
+                self._tokens.take(ticket.tokens, now)
+            self.in_flight += 1
+            ticket.granted = True
+            granted.append(ticket)
+        self._publish()
+        return granted
+
+    def _retry_after(self, delay: float) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(delay, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            granted = self._dispatch()
+        for ticket in granted:
+            ticket.notify()
+
+    def _publish(self) -> None:
+        for priority in PRIORITIES:
+            QUEUE_DEPTH.set_key((priority,), self.waiting[priority])
+        IN_FLIGHT.set_key((), self.in_flight)
+
+    def _enqueue(self, ticket: Ticket) -> None:
+        with self._lock:
+            share = QUEUE_SHARE[ticket.priority]
+            queued = sum(self.waiting[p] for p in PRIORITIES if QUEUE_SHARE[p] is not None)
+            if share is not None and queued >= self.max_queue * share:
+                REJECTED.inc_key((ticket.priority,))
+                raise LLMPoolSaturated(
+                    f"LLM scheduler saturated ({self.in_flight} in flight, "
+                    f"{sum(self.waiting.values())} waiting, {ticket.priority} refused)"
+                )
+            self._queues[ticket.priority].setdefault(ticket.session, deque()).append(ticket)
+            self.waiting[ticket.priority] += 1
+            granted = self._dispatch()
+        for waiter in granted:
+            waiter.notify()
+
+    def _withdraw(self, ticket: Ticket) -> bool:
+        """Remove a ticket that's no longer wanted; True if it already holds a slot"""
+        with self._lock:
+            if ticket.granted:
+                return True
+            sessions = self._queues[ticket.priority]
+            tickets = sessions.get(ticket.session)
+            if tickets is not None and ticket in tickets:
+                tickets.remove(ticket)
+                if not tickets:
+                    del sessions[ticket.session]
+                self.waiting[ticket.priority] -= 1
+                self._publish()
+            return False
+
+    def _release(self, ticket: Ticket, held: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.service_seconds += 0.1 * (held - self.service_seconds)
+            self.average_tokens += 0.1 * (ticket.tokens_used - self.average_tokens)
+            if self._tokens is not None and ticket.tokens_used > ticket.tokens:
+                # The reply was bigger than estimated; later calls pay for it
+                self._tokens.take(ticket.tokens_used - ticket.tokens, time.monotonic())
+            granted = self._dispatch()
+        for waiter in granted:
+            waiter.notify()
+
+    @asynccontextmanager
+    async def aslot(self, priority: str, session: str, tokens: int = 0) -> AsyncIterator[Ticket]:
+        """Hold a slot for the duration of one async LLM call"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        ticket = Ticket(priority, session, tokens, lambda: loop.call_soon_threadsafe(_resolve, future))
+        self._enqueue(ticket)
+        if not ticket.granted:
+            try:
+                await future
+            except BaseException:
+                if self._withdraw(ticket):
+                    self._release(ticket, 0.0)
+                raise
+        started = time.monotonic()
+        QUEUE_WAIT.observe_key((priority,), started - ticket.enqueued)
+        try:
+            yield ticket
+        finally:
+            self._release(ticket, time.monotonic() - started)
+
+    @contextmanager
+    def slot(self, priority: str, session: str, tokens: int = 0) -> Iterator[Ticket]:
+        """Blocking variant of aslot for the sync call path"""
+        event = threading.Event()
+        ticket = Ticket(priority, session, tokens, event.set)
+        self._enqueue(ticket)
+        event.wait()
+        started = time.monotonic()
+        QUEUE_WAIT.observe_key((priority,), started - ticket.enqueued)
+        try:
+            yield ticket
+        finally:
+            self._release(ticket, time.monotonic() - started)
+
+    def estimated_wait(self, priority: str = "interactive") -> float:
+        """Rough seconds a new call of this class would queue for"""
+        with self._lock:
+            ahead = sum(self.waiting[p] for p in PRIORITIES[:PRIORITIES.index(priority) + 1])
+            busy = max(0, self.in_flight + ahead + 1 - self.max_concurrency)
+            wait = busy / self.max_concurrency * self.service_seconds
+            now = time.monotonic()
+            if self._requests is not None:
+                wait = max(wait, self._requests.wait_time(ahead + 1, now))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.wait_time(self.average_tokens * (ahead + 1), now))
+            return wait
+
+    def saturation(self) -> Optional[float]:
+        """Retry-After for a new interview, or None while one would be admitted"""
+        wait = self.estimated_wait("interactive")
+        if wait > self.admission_wait or sum(self.waiting.values()) >= self.max_queue:
+            return max(1.0, wait)
+        return None
+
+    def admit_session(self) -> None:
+        """Refuse a new interview, with a retry estimate, while existing ones would suffer"""
+        retry_after = self.saturation()
+        if retry_after is not None:
+            REJECTED.inc_key(("new_session",))
+            raise SchedulerSaturated(retry_after)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "waiting": dict(self.waiting),
+                "service_seconds": round(self.service_seconds, 3),
+            }
+
+
+def _env_number(name: str) -> Optional[float]:
+    value = os.getenv(name, "").strip()
+    return float(value) if value and float(value) > 0 else None
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    """Process-wide scheduler; LLM_RPM and LLM_TPM set the quota (unset means none)"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                # Defaults to the client pool's limits, so the pool never queues
+                concurrency = os.getenv('LLM_SCHEDULER_CONCURRENCY') or os.getenv('LLM_MAX_CONCURRENCY', '64')
+                _scheduler = LLMScheduler(
+                    max_concurrency=int(concurrency),
+                    max_queue=int(os.getenv('LLM_SCHEDULER_QUEUE', '1024')),
+                    requests_per_minute=_env_number('LLM_RPM'),
+                    tokens_per_minute=_env_number('LLM_TPM'),
+                    burst_seconds=float(os.getenv('LLM_QUOTA_BURST_SECONDS', '5')),
+                    admission_wait=float(os.getenv('LLM_ADMISSION_WAIT_SECONDS', '5'))
+                )
+    return _scheduler
@@ -0,0 +1,118 @@
+"""
+Token-budgeted conversation memory for question prompts.
+
+The last ``recent_turns`` exchanges are kept verbatim. Older exchanges are
+folded into a rolling summary by an LLM call that the bot runs in the
+background after a turn completes, so it never delays a question. Until
+that summary lands, evicted turns are shown as they were said, or as short
+extractive notes once the budget runs low. render() never exceeds
+``token_budget`` estimated tokens, whatever the interview length.
+"""
+from typing import List, NamedTuple
+
+from .tokens import estimate_tokens
+
+# Words kept from an answer when it is shown as an extractive note
+NOTE_WORDS = 20
+
+
+class Turn(NamedTuple):
+    stage: str
+    question: str
+    answer: str
+
+    def text(self) -> str:
+        if not self.question:
+            return f"Candidate: {self.answer}"
+        return f"Interviewer: {self.question}\nCandidate: {self.answer}"
+
+
+def _clip(text: str, words: int) -> str:
+    parts = text.split()
+    return " ".join(parts[:words]) + (" ..." if len(parts) > words else "")
+
+
+class ConversationMemory:
+    def __init__(self, recent_turns: int = 3, token_budget: int = 400, summary_words: int = 120):
+        self.recent_turns = recent_turns
+        self.token_budget = token_budget
+        self.summary_words = summary_words
+        self.recent: List[Turn] = []
+        # Evicted from recent but not yet folded into the summary
+        self.pending: List[Turn] = []
+        self.summary = ""
+        # Turns covered by the summary since the interview began
+        self.folded = 0
+
+    def __len__(self) -> int:
+        return len(self.recent) + len(self.pending)
+
+    def add(self, stage: str, question: str, answer: str) -> None:
+        self.recent.append(Turn(stage, question or "", answer))
+        while len(self.recent) > self.recent_turns:
+            self.pending.append(self.recent.pop(0))
+
+    def apply_summary(self, folded: List[Turn], summary: str) -> None:
+        """Install a summary covering the existing summary plus `folded`"""
+        # The prompt asks for summary_words; clip in case the model ignores it
+        self.summary = _clip(summary.strip(), self.summary_words)
+        # Turns evicted while the summary was being written stay pending
+        self.pending = self.pending[len(folded):]
+        self.folded += len(folded)
+
+    def merge_summary(self, summary: str, folded: int) -> None:
+        """Adopt a summary written elsewhere if it covers more turns than ours"""
+        if folded <= self.folded:
+            return
+        self.pending = self.pending[folded - self.folded:]
+        self.summary = summary
+        self.folded = folded
+
+    def render(self) -> str:
+        """History for the question prompt, newest turns verbatim, within budget"""
+        if not self.recent and not self.pending and not self.summary:
+            return "(none yet)"
+
+        used = 0
+        sections = []
+        if self.summary:
+            sections.append(f"Earlier in the interview: {self.summary}")
+            used += estimate_tokens(sections[0])
+
+        # Walk newest to oldest: verbatim while the budget allows, then notes
+        verbatim, notes = [], []
+        for turn in reversed(self.pending + self.recent):
+            text = turn.text()
+            cost = estimate_tokens(text)
+            if not notes and used + cost <= self.token_budget:
+                verbatim.append(text)
+                used += cost
+            else:
+                notes.append(turn)
+
+        note_lines = []
+        for turn in notes:
+            line = f"- Answered: {_clip(turn.answer, NOTE_WORDS)}"
+            if turn.question:
+                line = f"- Asked: {_clip(turn.question, NOTE_WORDS)} Answered: {_clip(turn.answer, NOTE_WORDS)}"
+            cost = estimate_tokens(line)
+            if used + cost > self.token_budget:
+                break
+            note_lines.append(line)
+            used += cost
+
+        sections.extend(reversed(note_lines))
+        sections.extend(reversed(verbatim))
+        return "\n".join(sections)
+
+    def to_state(self) -> List:
+        return [self.summary, [list(t) for t in self.recent], [list(t) for t in self.pending], self.folded]
+
+    @classmethod
+    def from_state(cls, state: List, **options) -> "ConversationMemory":
+        memory = cls(**options)
+        memory.summary = state[0]
+        memory.recent = [Turn(*t) for t in state[1]]
+        memory.pending = [Turn(*t) for t in state[2]]
+        memory.folded = state[3] if len(state) > 3 else 0
+        return memory
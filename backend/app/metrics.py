@@ -0,0 +1,252 @@
+"""
+Per-call spans and Prometheus-style metrics.
+
+Every LLM call (transition, question, evaluate, summary, fused) and every
+resume load runs inside a span that records wall time, prompt/completion
+tokens, retries, hedges, cache hits and the outcome. Spans feed the counters and
+histograms below, labelled by call kind and interview stage, and are
+rendered in the Prometheus text format by the /metrics endpoint.
+"""
+import asyncio
+import threading
+from bisect import bisect_left
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .tokens import estimate_tokens
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+INF_BUCKET = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        self.inc_key(tuple(str(labels.get(name, "")) for name in self.labelnames), amount)
+
+    def inc_key(self, key: Tuple[str, ...], amount: float = 1) -> None:
+        """inc() with label values already ordered like labelnames"""
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(str(labels.get(name, "")) for name in self.labelnames), 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_label_text(self.labelnames, key)} {value:g}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # key -> (per-bucket counts, sum, count)
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        self.observe_key(tuple(str(labels.get(name, "")) for name in self.labelnames), value)
+
+    def observe_key(self, key: Tuple[str, ...], value: float) -> None:
+        """observe() with label values already ordered like labelnames"""
+        # Index len(buckets) is the +Inf overflow slot
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels) -> int:
+        series = self._series.get(tuple(str(labels.get(name, "")) for name in self.labelnames))
+        return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (bucket_counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, bucket_counts):
+                    cumulative += bucket_count
+                    labels = _label_text(self.labelnames, key, f'le="{bound:g}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                lines.append(f"{self.name}_bucket{_label_text(self.labelnames, key, INF_BUCKET)} {count}")
+                lines.append(f"{self.name}_sum{_label_text(self.labelnames, key)} {total:.6f}")
+                lines.append(f"{self.name}_count{_label_text(self.labelnames, key)} {count}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, **labels) -> None:
+        self.set_key(tuple(str(labels.get(name, "")) for name in self.labelnames), value)
+
+    def set_key(self, key: Tuple[str, ...], value: float) -> None:
+        """set() with label values already ordered like labelnames"""
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(str(labels.get(name, "")) for name in self.labelnames), 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_label_text(self.labelnames, key)} {value:g}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        metric = Gauge(name, documentation, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+SPAN_SECONDS = REGISTRY.histogram(
+    "interview_span_seconds", "Wall time of instrumented calls", ("kind", "stage")
+)
+SPANS_TOTAL = REGISTRY.counter(
+    "interview_spans_total", "Instrumented calls by outcome (ok, cache_hit, local, warm, error, cancelled)",
+    ("kind", "stage", "outcome")
+)
+TOKENS_TOTAL = REGISTRY.counter(
+    "interview_tokens_total", "LLM tokens by direction (prompt, completion)", ("kind", "stage", "direction")
+)
+RETRIES_TOTAL = REGISTRY.counter(
+    "interview_retries_total", "Retried attempts inside instrumented calls", ("kind", "stage")
+)
+HEDGES_TOTAL = REGISTRY.counter(
+    "interview_hedges_total", "Duplicate requests sent for slow calls", ("kind", "stage")
+)
+
+
+class Span:
+    """Mutable record of one call; filled in by the caller inside span()"""
+
+    __slots__ = ("kind", "stage", "started", "prompt_tokens", "completion_tokens",
+                 "retries", "hedges", "cache_hit", "outcome", "seconds")
+
+    def __init__(self, kind: str, stage: str):
+        self.kind = kind
+        self.stage = stage
+        self.started = time.perf_counter()
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.retries = 0
+        self.hedges = 0
+        self.cache_hit = False
+        self.outcome = "ok"
+        self.seconds = 0.0
+
+    def record_usage(self, prompt: str, message) -> None:
+        """Take token counts from the reply's usage metadata, else estimate them"""
+        usage = getattr(message, "usage_metadata", None)
+        if usage:
+            self.prompt_tokens += usage.get("input_tokens", 0)
+            self.completion_tokens += usage.get("output_tokens", 0)
+        else:
+            self.prompt_tokens += estimate_tokens(prompt)
+            self.completion_tokens += estimate_tokens(getattr(message, "content", "") or "")
+
+
+@contextmanager
+def span(kind: str, stage: Optional[str] = "") -> Iterator[Span]:
+    current = Span(kind, stage or "")
+    try:
+        yield current
+    except asyncio.CancelledError:
+        current.outcome = "cancelled"
+        raise
+    except Exception:
+        current.outcome = "error"
+        raise
+    finally:
+        current.seconds = time.perf_counter() - current.started
+        if current.cache_hit and current.outcome == "ok":
+            current.outcome = "cache_hit"
+        _record(current)
+
+
+def _record(current: Span) -> None:
+    kind, stage = current.kind, current.stage
+    SPAN_SECONDS.observe_key((kind, stage), current.seconds)
+    SPANS_TOTAL.inc_key((kind, stage, current.outcome))
+    if current.prompt_tokens:
+        TOKENS_TOTAL.inc_key((kind, stage, "prompt"), current.prompt_tokens)
+    if current.completion_tokens:
+        TOKENS_TOTAL.inc_key((kind, stage, "completion"), current.completion_tokens)
+    if current.retries:
+        RETRIES_TOTAL.inc_key((kind, stage), current.retries)
+    if current.hedges:
+        HEDGES_TOTAL.inc_key((kind, stage), current.hedges)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"span kind={current.kind} stage={current.stage} outcome={current.outcome} "
+            f"ms={current.seconds * 1000:.1f} prompt_tokens={current.prompt_tokens} "
+            f"completion_tokens={current.completion_tokens} retries={current.retries} "
+            f"hedges={current.hedges}"
+        )
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
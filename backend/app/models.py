@@ -1,6 +1,20 @@
-from pydantic import BaseModel
+from typing import Optional
+from pydantic import BaseModel, Field
 
 class Item(BaseModel):
     id: int
     name: str
-    description: str | None = None 
\ No newline at end of file
+    description: str | None = None
+
+class FusedScores(BaseModel):
+    relevance: float = Field(ge=0, le=10)
+    depth: float = Field(ge=0, le=10)
+    clarity: float = Field(ge=0, le=10)
+    technical: float = Field(ge=0, le=10)
+
+class FusedTurn(BaseModel):
+    """Schema of the single JSON reply used by the fused turn mode"""
+    move_to_next_stage: bool
+    question: str = Field(min_length=1)
+    scores: Optional[FusedScores] = None
+    feedback: Optional[str] = None
@@ -0,0 +1,321 @@
+"""
+Prompt registry.
+
+Every prompt the bot sends is compiled once at import into a static prefix
+(role, rules and output format, identical across sessions) and a small
+per-turn template holding the variables. The prefix is a shared immutable
+string; only the variable part is formatted on each call.
+"""
+from string import Formatter
+from textwrap import dedent
+from typing import Dict, List
+
+
+class CompiledPrompt:
+    __slots__ = ("name", "static_prefix", "variable_template", "_pieces")
+
+    def __init__(self, name: str, static_prefix: str, variable_template: str):
+        self.name = name
+        self.static_prefix = dedent(static_prefix).strip() + "\n\n"
+        self.variable_template = dedent(variable_template).strip() + "\n"
+        
+        # Pre-parse the variable part into (literal, field) pairs so rendering
+        # is a join rather than a re-scan of the template on every call
+        self._pieces = []
+        for literal, field, format_spec, conversion in Formatter().parse(self.variable_template):
+            if format_spec or conversion:
+                raise ValueError(f"Prompt {name} uses an unsupported format spec")
+            self._pieces.append((literal, field))
+
+    def _join(self, parts: List[str], values: Dict) -> str:
+        for literal, field in self._pieces:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+    def render(self, **values) -> str:
+        return self._join([self.static_prefix], values)
+
+
+STAGE_FOCUS = {
+    "introduction": "educational background, academic achievements, general professional background, career journey and aspirations",
+    "technical": "specific technical skills from the resume, depth of technical knowledge, core technologies they've worked with",
+    "experience": "specific projects, technical challenges and solutions, implementation details, impact and results of their work",
+    "behavioral": "problem-solving approach, team collaboration, handling challenges, leadership, conflict resolution (STAR format)",
+    "closing": "role clarification, company culture, next steps, start date availability, any final questions"
+}
+
+TRANSITION_PROMPT = CompiledPrompt(
+    "transition",
+    """
+    You are an AI analyzing interview responses.
+    
+    Determine if we should move to the next stage based on:
+    - Introduction stage: Have they covered their background and education?
+    - Technical stage: Have they demonstrated their technical knowledge?
+    - Experience stage: Have they explained their project implementations?
+    - Behavioral stage: Have they shown their soft skills and problem-solving approach?
+    
+    Respond with ONLY 'yes' to move to next stage, or 'no' to continue current stage.
+    """,
+    """
+    Current stage: {current_stage}
+    Candidate's response: {candidate_response}
+    """
+)
+
+QUESTION_PROMPTS: Dict[str, CompiledPrompt] = {
+    "introduction": CompiledPrompt(
+        "question.introduction",
+        """
+        You are an HR interviewer named Natasha conducting a professional interview.
+        
+        Generate a natural follow-up question focusing on:
+        - Educational background
+        - Academic achievements
+        - General professional background
+        - Career journey and aspirations
+        
+        RULES:
+        - Keep questions professional and focused
+        - Make it conversational and natural
+        - Don't mention interview stages
+        - One clear question at a time
+        - Consider the candidate's previous response
+        
+        Respond with ONLY the question, nothing else.
+        """,
+        """
+        Conversation so far (don't repeat questions already asked):
+        {history}
+        
+        Previous response: {candidate_response}
+        """
+    ),
+    "technical": CompiledPrompt(
+        "question.technical",
+        """
+        You are a technical interviewer.
+        
+        Generate a technical follow-up question that:
+        - Builds upon their previous response
+        - Assesses specific technical skills mentioned in their resume
+        - Tests depth of technical knowledge
+        - Focuses on core technologies they've worked with
+        
+        Keep questions specific and technical.
+        Respond with ONLY the question, nothing else.
+        """,
+        """
+        Resume: {resume_text}
+        
+        Conversation so far (don't repeat questions already asked):
+        {history}
+        
+        Previous response: {candidate_response}
+        """
+    ),
+    "experience": CompiledPrompt(
+        "question.experience",
+        """
+        You are a technical interviewer.
+        
+        Generate a follow-up question about:
+        - Specific projects they've mentioned
+        - Technical challenges and solutions
+        - Implementation details
+        - Real-world application of their skills
+        - Impact and results of their work
+        
+        Focus on practical experience and implementation.
+        Respond with ONLY the question, nothing else.
+        """,
+        """
+        Resume: {resume_text}
+        
+        Conversation so far (don't repeat questions already asked):
+        {history}
+        
+        Previous response: {candidate_response}
+        """
+    ),
+    "behavioral": CompiledPrompt(
+        "question.behavioral",
+        """
+        You are an HR interviewer.
+        
+        Generate a natural follow-up behavioral question that assesses:
+        - Problem-solving approach
+        - Team collaboration
+        - Handling challenges
+        - Leadership qualities
+        - Conflict resolution
+        
+        Use STAR (Situation, Task, Action, Result) format.
+        Consider their previous response for context.
+        Respond with ONLY the question, nothing else.
+        """,
+        """
+        Conversation so far (don't repeat questions already asked):
+        {history}
+        
+        Previous response: {candidate_response}
+        """
+    ),
+    "closing": CompiledPrompt(
+        "question.closing",
+        """
+        You are an HR interviewer wrapping up the interview.
+        
+        Generate a closing question about:
+        - Role clarification
+        - Company culture
+        - Next steps
+        - Start date availability
+        - Any final questions
+        
+        Keep it professional and welcoming.
+        Respond with ONLY the question, nothing else.
+        """,
+        """
+        Conversation so far (don't repeat questions already asked):
+        {history}
+        
+        Previous response: {candidate_response}
+        """
+    ),
+}
+
+SCORING_PROMPT = CompiledPrompt(
+    "scoring",
+    """
+    You are an expert interview evaluator. Evaluate the candidate response below.
+    
+    Score the response on these criteria (0-10 scale, use 0 if not applicable):
+    1. Relevance: How directly does it answer the question?
+    2. Depth: How detailed and thorough is the response?
+    3. Clarity: How well-structured and clear is the communication?
+    4. Technical Accuracy: How technically sound is the response? (use 0 for non-technical questions)
+    
+    Provide your evaluation in the following format ONLY:
+    RELEVANCE_SCORE: [number between 0-10]
+    DEPTH_SCORE: [number between 0-10]
+    CLARITY_SCORE: [number between 0-10]
+    TECHNICAL_SCORE: [number between 0-10]
+    FEEDBACK: [Brief 1-2 sentence feedback]
+    """,
+    """
+    Stage: {current_stage}
+    Question Asked: {question}
+    Candidate Response: {candidate_response}
+    """
+)
+
+SUMMARY_PROMPT = CompiledPrompt(
+    "summary",
+    """
+    Generate a brief interview summary based on the scores below.
+    
+    Provide a concise summary with:
+    1. Overall assessment (2-3 sentences)
+    2. Key strengths (2-3 bullet points)
+    3. Areas for improvement (1-2 bullet points)
+    """,
+    """
+    Stage Scores:
+    {stage_lines}
+    
+    Overall Score: {overall_score}/10
+    """
+)
+
+FUSED_TURN_PROMPT = CompiledPrompt(
+    "fused_turn",
+    """
+    You are Natasha, an experienced interviewer conducting a professional interview.
+    
+    First decide whether to move to the next stage:
+    - Introduction stage: Have they covered their background and education?
+    - Technical stage: Have they demonstrated their technical knowledge?
+    - Experience stage: Have they explained their project implementations?
+    - Behavioral stage: Have they shown their soft skills and problem-solving approach?
+    - The closing stage is final: move_to_next_stage must be false.
+    
+    Then write ONE natural follow-up question for the stage you chose.
+    Keep it professional and conversational and don't mention interview stages.
+    
+    Respond with a single JSON object ONLY, matching:
+    {"move_to_next_stage": true|false, "question": "...",
+      "scores": {"relevance": 0-10, "depth": 0-10, "clarity": 0-10, "technical": 0-10},
+      "feedback": "..."}
+    """,
+    """
+    Current stage: {current_stage} ({current_focus})
+    Next stage: {next_stage} ({next_focus})
+    Resume: {resume_text}
+    
+    Conversation so far (don't repeat questions already asked):
+    {history}
+    
+    Candidate's response: {candidate_response}
+    
+    {scoring_instructions}
+    """
+)
+
+MEMORY_PROMPT = CompiledPrompt(
+    "memory",
+    """
+    You keep running notes on a job interview for the interviewer.
+    
+    Merge the new exchanges into the existing notes. Keep what the candidate
+    said about their background, skills, projects and examples, and the
+    topics already asked about so they are not asked again.
+    
+    Respond with ONLY the notes as plain text, nothing else.
+    """,
+    """
+    Word limit: {max_words}
+    Existing notes: {summary}
+    New exchanges:
+    {turns}
+    """
+)
+
+OPENING_QUESTIONS_PROMPT = CompiledPrompt(
+    "opening_questions",
+    """
+    You are a technical interviewer preparing for an interview.
+    
+    Draft opening questions for the stage described below, grounded in
+    specific skills, technologies and projects from the candidate's resume.
+    Each question should stand on its own and cover a different topic.
+    
+    RULES:
+    - Keep questions professional and conversational
+    - Don't mention interview stages
+    - One clear question per line
+    
+    Respond with ONLY the questions, one per line, nothing else.
+    """,
+    """
+    Stage: {stage} ({focus})
+    Number of questions: {count}
+    Resume: {resume_text}
+    """
+)
+
+FUSED_SCORING_INSTRUCTIONS = (
+    'Also score the candidate\'s response to the question "{question}" on relevance, '
+    "depth, clarity and technical accuracy (0-10 scale, use 0 if not applicable or "
+    "non-technical), plus a brief 1-2 sentence feedback."
+)
+FUSED_NOTHING_TO_SCORE = 'There is nothing to score yet: set "scores" and "feedback" to null.'
+
+# Every compiled prompt by name
+PROMPTS: Dict[str, CompiledPrompt] = {
+    prompt.name: prompt
+    for prompt in (TRANSITION_PROMPT, SCORING_PROMPT, SUMMARY_PROMPT, FUSED_TURN_PROMPT,
+                   MEMORY_PROMPT, OPENING_QUESTIONS_PROMPT, *QUESTION_PROMPTS.values())
+}
@@ -0,0 +1,95 @@
+"""
+Per-session BM25 index over resume chunks.
+
+The resume is split once when it is loaded; each turn retrieves only the
+chunks most relevant to the candidate's last answer, within a token budget,
+instead of pasting the whole resume into the prompt.
+"""
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import List, Tuple
+from .tokens import estimate_tokens
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have i in is it its my of on or "
+    "our so that the their they this to was we were with you your".split()
+)
+
+
+def _terms(text: str) -> List[str]:
+    # Dots are kept inside terms like "node.js" but not at sentence ends
+    terms = (t.strip(".") for t in re.findall(r"[a-z0-9+#.]+", text.lower()))
+    return [t for t in terms if t and t not in STOPWORDS]
+
+
+class ResumeIndex:
+    def __init__(self, text: str, chunk_size: int = 400, chunk_overlap: int = 50,
+                 k1: float = 1.5, b: float = 0.75):
+        self.text = text
+        self.k1 = k1
+        self.b = b
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+        splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        self.chunks = splitter.split_text(text)
+        self._term_counts = [Counter(_terms(chunk)) for chunk in self.chunks]
+        self._lengths = [sum(counts.values()) for counts in self._term_counts]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self.chunks else 0.0
+        
+        doc_freq = Counter()
+        for counts in self._term_counts:
+            doc_freq.update(counts.keys())
+        n = len(self.chunks)
+        self._idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+
+    def search(self, query: str, k: int) -> List[Tuple[int, float]]:
+        """Return up to k (chunk index, BM25 score) pairs, best first"""
+        query_terms = set(_terms(query))
+        scored = []
+        for index, counts in enumerate(self._term_counts):
+            score = 0.0
+            norm = self.k1 * (1 - self.b + self.b * self._lengths[index] / (self._avg_length or 1))
+            for term in query_terms:
+                tf = counts.get(term)
+                if tf:
+                    score += self._idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            if score > 0:
+                scored.append((index, score))
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:k]
+
+    def excerpt(self, query: str, k: int, token_budget: int) -> str:
+        """
+        Top-k chunks for the query that fit in token_budget, in resume order.
+        Short resumes are returned whole; with no matches the opening chunks are used.
+        """
+        if estimate_tokens(self.text) <= token_budget:
+            return self.text
+        
+        ranked = [index for index, _ in self.search(query, k)]
+        if not ranked:
+            ranked = list(range(min(k, len(self.chunks))))
+        
+        selected = []
+        used = 0
+        for index in ranked:
+            cost = estimate_tokens(self.chunks[index])
+            if used + cost > token_budget:
+                continue
+            selected.append(index)
+            used += cost
+        return "\n...\n".join(self.chunks[index] for index in sorted(selected))
+
+
+@lru_cache(maxsize=256)
+def get_resume_index(text: str) -> ResumeIndex:
+    """
+    Shared index per resume text. Sessions restored from an external store
+    reuse the index instead of re-splitting the resume on every request.
+    """
+    return ResumeIndex(text)
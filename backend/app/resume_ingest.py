@@ -0,0 +1,138 @@
+"""
+Resume upload and parsing off the event loop.
+
+Uploads are streamed to a uniquely named temp file while their SHA-256 is
+computed, PDF text extraction runs in a process pool with page and size
+limits, and extracted text is cached by content hash so re-uploading the
+same resume skips parsing.
+"""
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from .metrics import span
+import logging
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class ResumeTooLarge(ValueError):
+    """Raised when an upload exceeds the configured size limit"""
+
+
+def extract_pdf_text(file_path: str, max_pages: int) -> str:
+    """Extract text from the first max_pages pages of a PDF (runs in a worker process)"""
+    from pypdf import PdfReader
+
+    reader = PdfReader(file_path)
+    pages = reader.pages[:max_pages]
+    if len(reader.pages) > max_pages:
+        logger.warning(f"Resume has {len(reader.pages)} pages, only the first {max_pages} are used")
+    return " ".join(page.extract_text() for page in pages)
+
+
+async def save_upload(upload, max_bytes: int) -> Tuple[str, str]:
+    """
+    Stream an UploadFile to a unique temp file. Returns (path, sha256 hex).
+    The caller owns the file and must remove it.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    handle = tempfile.NamedTemporaryFile(prefix="resume_", suffix=".pdf", delete=False)
+    try:
+        with handle:
+            while True:
+                chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if size == 0 and not chunk.startswith(b"%PDF-"):
+                    raise ValueError("Unsupported file format. Please use PDF")
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ResumeTooLarge(f"Resume exceeds the {max_bytes // 1024} KiB upload limit")
+                digest.update(chunk)
+                handle.write(chunk)
+        if size == 0:
+            raise ValueError("Uploaded resume is empty")
+    except BaseException:
+        os.remove(handle.name)
+        raise
+    return handle.name, digest.hexdigest()
+
+
+class ResumeParser:
+    """Process-pool PDF parser with an LRU cache keyed by content hash"""
+
+    def __init__(self, max_workers: Optional[int] = None, max_pages: int = 20,
+                 max_bytes: int = 10 * 1024 * 1024, cache_size: int = 256):
+        self.max_workers = max_workers
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._pool = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        # Created on first upload so importing the app doesn't fork workers
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def cached(self, digest: str) -> Optional[str]:
+        text = self._cache.get(digest)
+        if text is not None:
+            self._cache.move_to_end(digest)
+        return text
+
+    async def parse(self, file_path: str, digest: str) -> str:
+        with span("pdf_load") as call:
+            text = self.cached(digest)
+            if text is not None:
+                self.cache_hits += 1
+                call.cache_hit = True
+                return text
+            
+            self.cache_misses += 1
+            loop = asyncio.get_running_loop()
+            try:
+                text = await loop.run_in_executor(
+                    self._executor(), extract_pdf_text, file_path, self.max_pages
+                )
+            except Exception as e:
+                raise Exception(f"Error loading resume: {str(e)}")
+            
+            self._cache[digest] = text
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return text
+
+    async def ingest(self, upload) -> str:
+        """Stream, hash and parse an uploaded resume, returning its text"""
+        file_path, digest = await save_upload(upload, self.max_bytes)
+        try:
+            return await self.parse(file_path, digest)
+        finally:
+            os.remove(file_path)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+def create_resume_parser() -> ResumeParser:
+    workers = os.getenv('RESUME_PARSE_WORKERS')
+    return ResumeParser(
+        max_workers=int(workers) if workers else None,
+        max_pages=int(os.getenv('RESUME_MAX_PAGES', '20')),
+        max_bytes=int(os.getenv('RESUME_MAX_BYTES', str(10 * 1024 * 1024))),
+        cache_size=int(os.getenv('RESUME_CACHE_SIZE', '256'))
+    )
@@ -1,13 +1,71 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
-from typing import Dict
+from fastapi import APIRouter, HTTPException, UploadFile, File, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import Dict, List, Optional, Tuple
 from pydantic import BaseModel
+from .batch import BatchScorer, load_rows
 from .interview_bot import InterviewBot
+from .llm_policy import CircuitOpen, LLMCallTimeout
+from .llm_pool import LLMPoolSaturated
+from .llm_scheduler import SchedulerSaturated, get_scheduler
+from .resume_ingest import ResumeTooLarge, create_resume_parser
+from .score_store import EXPORT_FORMATS, get_score_store
+from .scoring import reweight
+from .session_store import create_session_store
+from .speech import get_speech_engines, transcribe_answer
+import asyncio
 import json
+import math
+import os
+import tempfile
 
 router = APIRouter()
 
+GREETING = (
+    "Hello! I'm Natasha, your AI interviewer today. "
+    "I'd love to get to know you better as a person. "
+    "Could you please tell me a bit about yourself?"
+)
+
+INVALID_TRANSCRIBE_FRAME = 'Text frames must be JSON objects such as {"event": "end"}'
+INVALID_SYNTHESIZE_FRAME = 'Frames must be JSON objects such as {"text": "..."}'
+
 # Store active interview sessions
-interview_sessions: Dict[str, InterviewBot] = {}
+session_store = create_session_store()
+resume_parser = create_resume_parser()
+
+async def _get_session(session_id: str) -> InterviewBot:
+    interviewer = await session_store.get(session_id)
+    if not interviewer:
+        raise HTTPException(status_code=404, detail="Interview session not found")
+    return interviewer
+
+def _admit_session() -> None:
+    """Fail fast with 429 rather than start an interview the LLM quota can't serve"""
+    try:
+        get_scheduler().admit_session()
+    except SchedulerSaturated as e:
+        raise HTTPException(status_code=429, detail=str(e),
+                            headers={"Retry-After": str(math.ceil(e.retry_after))})
+
+def _llm_error_status(e: Exception) -> Tuple[int, Optional[int]]:
+    """HTTP status and Retry-After seconds for an error raised during a turn"""
+    if isinstance(e, LLMPoolSaturated):
+        return 503, 1
+    if isinstance(e, CircuitOpen):
+        return 503, max(1, math.ceil(e.retry_after))
+    if isinstance(e, LLMCallTimeout):
+        return 504, None
+    return 500, None
+
+def _error_detail(e: Exception) -> Dict:
+    """Error payload for SSE and WebSocket clients, mirroring the /respond statuses"""
+    status, retry_after = _llm_error_status(e)
+    detail = {"status": status, "detail": str(e)}
+    if retry_after is not None:
+        detail["retry_after"] = retry_after
+    return detail
 
 class InterviewResponse(BaseModel):
     session_id: str
@@ -18,15 +76,21 @@ class InterviewQuestion(BaseModel):
     stage: str
     evaluation: Dict = None
 
+class ReweightRequest(BaseModel):
+    rows: List[Dict]
+    criteria_weights: Optional[Dict[str, Dict[str, float]]] = None
+    stage_weights: Optional[Dict[str, float]] = None
+
 @router.post("/interview/start", tags=["interview"])
 async def start_interview(resume: str):
     """Start a new interview session"""
+    _admit_session()
     try:
         interviewer = InterviewBot()
-        session_id = str(len(interview_sessions) + 1)
-        interview_sessions[session_id] = interviewer
-        
         initial_question = interviewer.start_interview(resume)
+        # Started before the session is stored so the store keeps the drafts
+        interviewer.start_warm_up()
+        session_id = await session_store.create(interviewer)
         
         return {
             "session_id": session_id,
@@ -40,52 +104,69 @@ async def start_interview(resume: str):
 async def respond_to_question(response: InterviewResponse):
     """Get next interview question based on candidate's response"""
     try:
-        interviewer = interview_sessions.get(response.session_id)
-        if not interviewer:
-            raise HTTPException(status_code=404, detail="Interview session not found")
+        interviewer = await _get_session(response.session_id)
         
-        # Use process_response instead of get_next_question to get evaluation
-        result = interviewer.process_response(
+        # Use process_response instead of get_next_question to get evaluation.
+        # The async variant keeps the event loop free while Gemini responds.
+        result = await interviewer.aprocess_response(
             resume_text=interviewer.current_resume,
             candidate_response=response.response
         )
+        await session_store.save(response.session_id, interviewer)
         
         return {
             "question": result["question"],
             "stage": result["stage"],
             "evaluation": result["evaluation"]
         }
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        status, retry_after = _llm_error_status(e)
+        raise HTTPException(status_code=status, detail=str(e),
+                            headers={"Retry-After": str(retry_after)} if retry_after else None)
+
+@router.post("/interview/respond/stream", tags=["interview"])
+async def stream_response_to_question(response: InterviewResponse):
+    """Stream the next interview question as Server-Sent Events"""
+    interviewer = await _get_session(response.session_id)
+    
+    async def event_stream():
+        try:
+            async for event, data in interviewer.astream_response(
+                resume_text=interviewer.current_resume,
+                candidate_response=response.response
+            ):
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+            await session_store.save(response.session_id, interviewer)
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps(_error_detail(e))}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.post("/interview/upload-resume", tags=["interview"])
 async def upload_resume(file: UploadFile = File(...)):
     """Upload and process a resume file"""
+    _admit_session()
     try:
         print(f"Received file: {file.filename}")
-        contents = await file.read()
-        
-        temp_path = f"temp_{file.filename}"
-        print(f"Saving to temp path: {temp_path}")
         
-        with open(temp_path, "wb") as f:
-            f.write(contents)
+        # Streamed to a unique temp file and parsed in a worker process
+        resume_text = await resume_parser.ingest(file)
         
         interviewer = InterviewBot()
-        resume_text = interviewer.load_resume(temp_path)
-        
-        import os
-        os.remove(temp_path)
-        
-        session_id = str(len(interview_sessions) + 1)
-        interview_sessions[session_id] = interviewer
         interviewer.current_resume = resume_text
+        # Draft the technical and experience openings while the candidate
+        # answers the greeting; started first so the store keeps the drafts
+        interviewer.start_warm_up()
+        session_id = await session_store.create(interviewer)
         
-        initial_question = (
-            "Hello! I'm Natasha, your AI interviewer today. "
-            "I'd love to get to know you better as a person. "
-            "Could you please tell me a bit about yourself?"
-        )
+        # Fixed text, so its speech is served from the audio cache
+        initial_question = GREETING
         
         print(f"Successfully processed file, session_id: {session_id}")
         
@@ -94,6 +175,10 @@ async def upload_resume(file: UploadFile = File(...)):
             "message": initial_question,
             "stage": "introduction"
         }
+    except ResumeTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"Error processing file: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -102,20 +187,20 @@ async def upload_resume(file: UploadFile = File(...)):
 async def end_interview(session_id: str):
     """End an interview session and return final summary"""
     try:
-        interviewer = interview_sessions.get(session_id)
-        if not interviewer:
-            raise HTTPException(status_code=404, detail="Interview session not found")
+        interviewer = await _get_session(session_id)
         
         # Get the summary before ending the session
-        summary = interviewer.get_interview_summary(early_termination=True)
+        summary = await interviewer.aget_interview_summary(early_termination=True)
         
         # Clean up the session
-        del interview_sessions[session_id]
+        await session_store.delete(session_id)
         
         return {
             "message": "Interview session ended successfully",
             "summary": summary
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -123,11 +208,220 @@ async def end_interview(session_id: str):
 async def get_interview_summary(session_id: str):
     """Get the interview summary with scores"""
     try:
-        interviewer = interview_sessions.get(session_id)
-        if not interviewer:
-            raise HTTPException(status_code=404, detail="Interview session not found")
+        interviewer = await _get_session(session_id)
         
-        summary = interviewer.get_interview_summary()
+        summary = await interviewer.aget_interview_summary()
+        # Persist only the memoized narrative, so later polls skip the LLM
+        # call without overwriting a turn saved while this request ran
+        await session_store.save_summary(session_id, interviewer)
         return summary
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/batch/score", tags=["batch"])
+async def batch_score(file: UploadFile = File(...)):
+    """Score a JSONL file of (stage, question, response) rows, streaming NDJSON results"""
+    try:
+        rows = load_rows((await file.read()).decode("utf-8").splitlines())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    scorer = BatchScorer(concurrency=int(os.getenv('BATCH_CONCURRENCY', '8')))
+    
+    async def result_stream():
+        # Results are written as they complete; rows with "error" can be resubmitted
+        async for result in scorer.score(rows):
+            yield json.dumps(result) + "\n"
+    
+    return StreamingResponse(result_stream(), media_type="application/x-ndjson")
+
+@router.post("/batch/reweight", tags=["batch"])
+async def batch_reweight(request: ReweightRequest):
+    """Recompute overall scores of stored evaluations under new weights (no LLM calls)"""
+    try:
+        overall, interviews = reweight(
+            request.rows,
+            criteria_weights=request.criteria_weights,
+            stage_weights=request.stage_weights
+        )
+        # In request order; the rows themselves are not echoed back
+        return {"overall_scores": overall.tolist(), "interviews": interviews}
+    except (KeyError, ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _score_store():
+    store = get_score_store()
+    if store is None:
+        raise HTTPException(status_code=404, detail="Score store is disabled (set SCORE_STORE_PATH to enable it)")
+    return store
+
+@router.get("/analytics/scores/distribution", tags=["analytics"])
+async def score_distribution(since: Optional[float] = None, bins: int = 20):
+    """Per-stage distribution of stored scores, optionally since a Unix time"""
+    if not 1 <= bins <= 1000:
+        raise HTTPException(status_code=400, detail="bins must be between 1 and 1000")
+    try:
+        return await run_in_threadpool(_score_store().distribution, since, bins)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/analytics/scores/export", tags=["analytics"])
+async def export_scores(format: str = "csv", since: Optional[float] = None):
+    """Every stored evaluation as CSV (streamed), NumPy .npz or Parquet"""
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    store = _score_store()
+    if format == "csv":
+        # A sync iterator, so the reads run in the threadpool
+        return StreamingResponse(store.iter_csv(since), media_type="text/csv",
+                                 headers={"Content-Disposition": "attachment; filename=scores.csv"})
+    
+    handle = tempfile.NamedTemporaryFile(suffix=f".{format}", delete=False)
+    handle.close()
+    try:
+        await run_in_threadpool(store.export, handle.name, format, since)
+    except Exception as e:
+        os.remove(handle.name)
+        raise HTTPException(status_code=500, detail=str(e))
+    return FileResponse(handle.name, filename=f"scores.{format}", media_type="application/octet-stream",
+                        background=BackgroundTask(os.remove, handle.name))
+
+@router.websocket("/interview/{session_id}/speech/transcribe")
+async def transcribe_speech(websocket: WebSocket, session_id: str):
+    """
+    Spoken answers. Binary frames carry candidate audio and a text frame
+    {"event": "end"} ends the answer. Interim transcripts are sent as
+    "partial" events; the final transcript goes through the respond path and
+    a "result" event carries the next question. One connection can carry
+    several answers.
+    """
+    if not await session_store.get(session_id):
+        await websocket.close(code=4404)
+        return
+    await websocket.accept()
+    stt, _ = get_speech_engines()
+    
+    while True:
+        # Frames are read by a separate task so a disconnect never surfaces
+        # inside the speech engine's request stream
+        frames: asyncio.Queue = asyncio.Queue()
+        
+        async def read_frames():
+            try:
+                while True:
+                    message = await websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        return False
+                    if message.get("bytes"):
+                        frames.put_nowait(message["bytes"])
+                    elif message.get("text"):
+                        try:
+                            event = json.loads(message["text"]).get("event")
+                        except (json.JSONDecodeError, AttributeError):
+                            await websocket.send_json({"event": "error", "detail": INVALID_TRANSCRIBE_FRAME})
+                            continue
+                        if event == "end":
+                            return True
+            finally:
+                # Always end the audio stream, or the transcription waits forever
+                frames.put_nowait(None)
+        
+        async def audio():
+            while (chunk := await frames.get()) is not None:
+                yield chunk
+        
+        reader = asyncio.create_task(read_frames())
+        try:
+            transcript = ""
+            async for update in transcribe_answer(stt, audio()):
+                if update.is_final:
+                    transcript = update.text
+                else:
+                    await websocket.send_json({"event": "partial", "text": update.text})
+            if not await reader:
+                return
+            if not transcript:
+                await websocket.send_json({"event": "error", "detail": "No speech detected"})
+                continue
+            
+            interviewer = await session_store.get(session_id)
+            if not interviewer:
+                await websocket.send_json({"event": "error", "detail": "Interview session not found"})
+                await websocket.close(code=4404)
+                return
+            result = await interviewer.aprocess_response(
+                resume_text=interviewer.current_resume,
+                candidate_response=transcript
+            )
+            await session_store.save(session_id, interviewer)
+            await websocket.send_json({
+                "event": "result",
+                "transcript": transcript,
+                "question": result["question"],
+                "stage": result["stage"],
+                "evaluation": result["evaluation"]
+            })
+        except WebSocketDisconnect:
+            return
+        except Exception as e:
+            try:
+                await websocket.send_json({"event": "error", **_error_detail(e)})
+            except Exception:
+                return
+            # Discard the rest of a failed answer before listening again
+            if not await reader:
+                return
+        finally:
+            reader.cancel()
+
+@router.websocket("/interview/{session_id}/speech/synthesize")
+async def synthesize_speech(websocket: WebSocket, session_id: str):
+    """
+    Interviewer audio. Each {"text": ...} frame is answered with a "start"
+    event, binary audio chunks and an "end" event. Without "text" the
+    session's current question (the greeting before the first answer) is
+    spoken.
+    """
+    if not await session_store.get(session_id):
+        await websocket.close(code=4404)
+        return
+    await websocket.accept()
+    _, speaker = get_speech_engines()
+    
+    try:
+        while True:
+            try:
+                request = await websocket.receive_json()
+                text = request.get("text")
+            except (json.JSONDecodeError, AttributeError, KeyError):
+                # KeyError: a binary frame, which carries no text
+                await websocket.send_json({"event": "error", "detail": INVALID_SYNTHESIZE_FRAME})
+                continue
+            if not text:
+                interviewer = await session_store.get(session_id)
+                if not interviewer:
+                    await websocket.send_json({"event": "error", "detail": "Interview session not found"})
+                    await websocket.close(code=4404)
+                    return
+                text = interviewer.previous_question or GREETING
+            
+            await websocket.send_json({"event": "start", "media_type": speaker.media_type, "text": text})
+            chunks = cached = 0
+            try:
+                async for chunk, from_cache in speaker.speak(text):
+                    await websocket.send_bytes(chunk)
+                    chunks += 1
+                    cached += from_cache
+            except WebSocketDisconnect:
+                raise
+            except Exception as e:
+                await websocket.send_json({"event": "error", **_error_detail(e)})
+                continue
+            await websocket.send_json({"event": "end", "chunks": chunks, "cached_chunks": cached})
+    except WebSocketDisconnect:
+        return
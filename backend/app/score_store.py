@@ -0,0 +1,370 @@
+"""
+Append-only store of every evaluation, for analytics across interviews.
+
+Each scored answer becomes one row: interview id, time, stage, question
+hash, the four criterion scores, the overall score and the feedback. Rows
+are queued by the request path and written in batches by a background
+thread into SQLite in WAL mode, so readers never block the writer. Stages
+and question texts are stored once and referenced by integer codes, which
+keeps a row at roughly 90 bytes plus its feedback.
+
+Aggregations run as SQL over the table; exports stream from a cursor in
+batches into CSV, NumPy .npz columns or Parquet (needs pyarrow).
+
+The store is off unless SCORE_STORE_PATH names the SQLite file, so a
+server started from any directory does not leave a database behind.
+
+    python -m app.score_store distribution --db scores.db
+    python -m app.score_store export scores.parquet --db scores.db
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .scoring import SCORE_CRITERIA
+import logging
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("interview_id", "created", "stage", "question_hash") + SCORE_CRITERIA + ("overall", "feedback")
+EXPORT_FORMATS = ("csv", "npz", "parquet")
+# Upper bound of every score; histogram buckets split [0, MAX_SCORE]
+MAX_SCORE = 10.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stages (code INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS questions (hash INTEGER PRIMARY KEY, text TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS scores (
+    interview BLOB NOT NULL,
+    created REAL NOT NULL,
+    stage INTEGER NOT NULL,
+    question INTEGER NOT NULL,
+    relevance REAL NOT NULL,
+    depth REAL NOT NULL,
+    clarity REAL NOT NULL,
+    technical REAL NOT NULL,
+    overall REAL NOT NULL,
+    feedback TEXT NOT NULL
+);
+"""
+
+_STOP = object()
+
+
+def question_hash(question: str) -> int:
+    """Signed 64-bit hash of the question text, an SQLite INTEGER key"""
+    digest = hashlib.sha256((question or "").encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def _interview_key(interview_id: str) -> bytes:
+    try:
+        return bytes.fromhex(interview_id)
+    except (TypeError, ValueError):
+        return str(interview_id).encode("utf-8")
+
+
+def _since_clause(since: Optional[float]) -> Tuple[str, Tuple]:
+    return ("WHERE s.created >= ?", (since,)) if since is not None else ("", ())
+
+
+class ScoreStore:
+    def __init__(self, path: str, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        self.written = 0
+        self._stage_codes: Dict[str, int] = {}
+        self._queue: queue.Queue = queue.Queue()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps committed rows durable across crashes without fsync per batch
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+        for code, name in self._db.execute("SELECT code, name FROM stages"):
+            self._stage_codes[name] = code
+        self._writer = threading.Thread(target=self._write_loop, name="score-store", daemon=True)
+        self._writer.start()
+
+    def record(self, interview_id: str, evaluation: Dict) -> None:
+        """Queue one evaluation for writing; never blocks on the database"""
+        scores = evaluation['detailed_scores']
+        self._queue.put((
+            _interview_key(interview_id),
+            time.time(),
+            evaluation['stage'],
+            evaluation['question'] or "",
+            *(float(scores.get(k, 0.0)) for k in SCORE_CRITERIA),
+            float(evaluation['overall_score']),
+            evaluation.get('feedback') or ""
+        ))
+
+    def _stage_code(self, name: str) -> int:
+        code = self._stage_codes.get(name)
+        if code is None:
+            self._db.execute("INSERT OR IGNORE INTO stages (name) VALUES (?)", (name,))
+            code = self._db.execute("SELECT code FROM stages WHERE name = ?", (name,)).fetchone()[0]
+            self._stage_codes[name] = code
+        return code
+
+    def _write(self, batch: List[Tuple]) -> None:
+        questions = {}
+        rows = []
+        for interview, created, stage, question, *values in batch:
+            key = question_hash(question)
+            questions[key] = question
+            rows.append((interview, created, self._stage_code(stage), key, *values))
+        self._db.executemany("INSERT OR IGNORE INTO questions (hash, text) VALUES (?, ?)", questions.items())
+        self._db.executemany("INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self._db.commit()
+        self.written += len(rows)
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch, stop = [], item is _STOP
+            if not stop:
+                batch.append(item)
+            # Everything queued meanwhile goes into the same transaction
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self._write(batch)
+            except Exception as e:
+                self._db.rollback()
+                logger.error(f"Error writing {len(batch)} scores: {str(e)}")
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """Wait until every queued evaluation is written"""
+        self._queue.join()
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._db.close()
+
+    def _reader(self) -> sqlite3.Connection:
+        # Readers get their own connection; WAL lets them run beside the writer
+        return sqlite3.connect(self.path)
+
+    def count(self) -> int:
+        with closing(self._reader()) as db:
+            return db.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def distribution(self, since: Optional[float] = None, bins: int = 20) -> Dict[str, Dict]:
+        """
+        Per-stage score distribution: count, mean/std/min/max of the overall
+        score, mean of each criterion, an overall-score histogram over
+        [0, MAX_SCORE] and quartiles interpolated from it.
+        """
+        where, params = _since_clause(since)
+        sums = ", ".join(f"SUM(s.{k})" for k in SCORE_CRITERIA)
+        # One scan: partial sums per (stage, bucket), combined per stage below
+        with closing(self._reader()) as db:
+            stage_names = dict(db.execute("SELECT code, name FROM stages"))
+            groups = db.execute(
+                f"SELECT s.stage, MAX(MIN(CAST(s.overall * ? / ? AS INTEGER), ?), 0) AS bucket, COUNT(*), "
+                f"SUM(s.overall), SUM(s.overall * s.overall), MIN(s.overall), MAX(s.overall), {sums} "
+                f"FROM scores s {where} GROUP BY s.stage, bucket",
+                (bins, MAX_SCORE, bins - 1) + params
+            ).fetchall()
+
+        stages: Dict[int, List] = {}
+        for code, bucket, count, total, total_sq, low, high, *criteria in groups:
+            acc = stages.setdefault(code, [[0] * bins, 0, 0.0, 0.0, low, high, [0.0] * len(SCORE_CRITERIA)])
+            acc[0][bucket] += count
+            acc[1] += count
+            acc[2] += total
+            acc[3] += total_sq
+            acc[4], acc[5] = min(acc[4], low), max(acc[5], high)
+            acc[6] = [a + b for a, b in zip(acc[6], criteria)]
+
+        result = {}
+        for code, (histogram, count, total, total_sq, low, high, criteria) in stages.items():
+            mean = total / count
+            result[stage_names.get(code, str(code))] = {
+                "count": count,
+                "mean": round(mean, 3),
+                "std": round(max(total_sq / count - mean * mean, 0.0) ** 0.5, 3),
+                "min": low,
+                "max": high,
+                "criteria_means": {k: round(v / count, 3) for k, v in zip(SCORE_CRITERIA, criteria)},
+                "quantiles": {f"p{int(q * 100)}": min(max(_histogram_quantile(histogram, q), low), high)
+                              for q in (0.25, 0.5, 0.75, 0.9)},
+                "histogram": {"edges": [round(MAX_SCORE * i / bins, 3) for i in range(bins + 1)],
+                              "counts": histogram},
+            }
+        return result
+
+    def iter_rows(self, since: Optional[float] = None, batch_rows: int = 50000) -> Iterator[List[Tuple]]:
+        """Batches of export rows (COLUMNS order), straight from the cursor"""
+        where, params = _since_clause(since)
+        criteria = ", ".join(f"s.{k}" for k in SCORE_CRITERIA)
+        with closing(self._reader()) as db:
+            cursor = db.execute(
+                f"SELECT lower(hex(s.interview)), s.created, t.name, s.question, {criteria}, s.overall, s.feedback "
+                f"FROM scores s JOIN stages t ON t.code = s.stage {where} ORDER BY s.rowid",
+                params
+            )
+            while True:
+                batch = cursor.fetchmany(batch_rows)
+                if not batch:
+                    return
+                yield batch
+
+    def iter_csv(self, since: Optional[float] = None) -> Iterator[str]:
+        """CSV text in pieces, for streaming responses"""
+        buffer = _LineBuffer()
+        writer = csv.writer(buffer)
+        writer.writerow(COLUMNS)
+        yield buffer.take()
+        for batch in self.iter_rows(since):
+            writer.writerows(batch)
+            yield buffer.take()
+
+    def export(self, path: str, fmt: Optional[str] = None, since: Optional[float] = None) -> int:
+        """Write every row (or those since a timestamp) to path; returns the row count"""
+        fmt = fmt or os.path.splitext(path)[1].lstrip(".")
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        if fmt == "csv":
+            with open(path, "w", newline="") as handle:
+                for piece in self.iter_csv(since):
+                    handle.write(piece)
+            return self._exported(since)
+        columns = self.columns(since)
+        if fmt == "npz":
+            import numpy as np
+            np.savez_compressed(path, **columns)
+        else:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise Exception("Parquet export needs pyarrow (pip install pyarrow)")
+            pq.write_table(pa.table({name: pa.array(values) for name, values in columns.items()}), path)
+        return len(columns["overall"])
+
+    def _exported(self, since: Optional[float]) -> int:
+        where, params = _since_clause(since)
+        with closing(self._reader()) as db:
+            return db.execute(f"SELECT COUNT(*) FROM scores s {where}", params).fetchone()[0]
+
+    def columns(self, since: Optional[float] = None) -> Dict:
+        """Every column as a NumPy array (strings as object arrays)"""
+        import numpy as np
+
+        parts = {name: [] for name in COLUMNS}
+        for batch in self.iter_rows(since):
+            for name, values in zip(COLUMNS, zip(*batch)):
+                parts[name].append(values)
+        dtypes = {"created": np.float64, "question_hash": np.int64, "overall": np.float64}
+        dtypes.update(dict.fromkeys(SCORE_CRITERIA, np.float64))
+        return {
+            name: np.concatenate([np.asarray(p, dtype=dtypes.get(name, object)) for p in chunks])
+            if chunks else np.empty(0, dtype=dtypes.get(name, object))
+            for name, chunks in parts.items()
+        }
+
+
+class _LineBuffer:
+    """Minimal file-like sink for csv.writer"""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+
+    def take(self) -> str:
+        text = "".join(self.parts)
+        self.parts = []
+        return text
+
+
+def _histogram_quantile(counts: List[int], q: float) -> float:
+    total = sum(counts)
+    width = MAX_SCORE / len(counts)
+    target = q * total
+    seen = 0
+    for index, count in enumerate(counts):
+        if count and seen + count >= target:
+            return round((index + (target - seen) / count) * width, 3)
+        seen += count
+    return MAX_SCORE
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_score_store() -> Optional[ScoreStore]:
+    """Process-wide store at SCORE_STORE_PATH; None when it is not set"""
+    global _store
+    path = os.getenv('SCORE_STORE_PATH')
+    if not path:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ScoreStore(path, batch_size=int(os.getenv('SCORE_STORE_BATCH_SIZE', '500')))
+    return _store
+
+
+def close_score_store() -> None:
+    """Flush queued evaluations and close the process-wide store"""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+            _store = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stored interview scores")
+    parser.add_argument("--db", default=os.getenv('SCORE_STORE_PATH') or None,
+                        required=not os.getenv('SCORE_STORE_PATH'), help="defaults to SCORE_STORE_PATH")
+    parser.add_argument("--since", type=float, help="only rows created at or after this Unix time")
+    commands = parser.add_subparsers(dest="command", required=True)
+    dist_cmd = commands.add_parser("distribution", help="per-stage score distributions as JSON")
+    dist_cmd.add_argument("--bins", type=int, default=20)
+    export_cmd = commands.add_parser("export", help="export rows to csv, npz or parquet")
+    export_cmd.add_argument("output")
+    export_cmd.add_argument("--format", choices=EXPORT_FORMATS)
+    args = parser.parse_args()
+
+    store = ScoreStore(args.db)
+    try:
+        if args.command == "distribution":
+            print(json.dumps(store.distribution(since=args.since, bins=args.bins), indent=2))
+        else:
+            rows = store.export(args.output, args.format, since=args.since)
+            print(f"exported {rows} rows to {args.output}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
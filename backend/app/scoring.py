@@ -0,0 +1,135 @@
+"""
+Rubric weights and vectorized re-weighting of stored scores.
+
+evaluate_response weights the four criteria by stage and the summary weights
+stage averages by scoring_weights. Both tables live here so a re-weighting
+pass over stored detailed scores can recompute every overall score and
+interview total with NumPy, without calling the LLM. NumPy is imported by
+ScoreMatrix on first use, since per-turn scoring never needs it.
+"""
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+SCORE_CRITERIA = ('relevance', 'depth', 'clarity', 'technical')
+
+# Criterion weights per stage; stages not listed use DEFAULT_CRITERIA_WEIGHTS
+CRITERIA_WEIGHTS = {
+    'technical': {'relevance': 0.25, 'depth': 0.3, 'clarity': 0.15, 'technical': 0.3},
+    'experience': {'relevance': 0.3, 'depth': 0.3, 'clarity': 0.2, 'technical': 0.2},
+}
+DEFAULT_CRITERIA_WEIGHTS = {'relevance': 0.4, 'depth': 0.3, 'clarity': 0.3, 'technical': 0.0}
+
+STAGE_WEIGHTS = {
+    "introduction": 0.15,
+    "technical": 0.35,
+    "experience": 0.25,
+    "behavioral": 0.20,
+    "closing": 0.05
+}
+
+
+def criteria_weights_for(stage: str, criteria_weights: Optional[Dict] = None) -> Dict[str, float]:
+    table = CRITERIA_WEIGHTS if criteria_weights is None else criteria_weights
+    return table.get(stage, table.get('default', DEFAULT_CRITERIA_WEIGHTS))
+
+
+def overall_score(stage: str, scores: Dict[str, float],
+                  criteria_weights: Optional[Dict] = None) -> float:
+    """Weighted score of a single answer, rounded like evaluate_response"""
+    weights = criteria_weights_for(stage, criteria_weights)
+    return round(sum(scores[k] * v for k, v in weights.items()), 2)
+
+
+class ScoreMatrix:
+    """
+    Detailed scores of many answers as arrays, one row per answer. Build it
+    once and call overall_scores/interview_totals for each weight set tried.
+    """
+
+    def __init__(self, rows: Iterable[Dict]):
+        import numpy as np
+
+        rows = rows if isinstance(rows, list) else list(rows)
+        count = len(rows)
+        # One column per criterion, filled straight from the rows
+        self.scores = np.empty((count, len(SCORE_CRITERIA)), dtype=np.float64)
+        for column, criterion in enumerate(SCORE_CRITERIA):
+            self.scores[:, column] = np.fromiter(
+                (row['detailed_scores'][criterion] for row in rows), dtype=np.float64, count=count
+            )
+        # Small integer codes for stages and interviews, in first-seen order
+        self.stage_names, self.stage_codes = _encode((row['stage'] for row in rows), count)
+        self.interviews, self.interview_codes = _encode(
+            (str(row.get('interview_id')) for row in rows), count
+        )
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def overall_scores(self, criteria_weights: Optional[Dict] = None) -> "np.ndarray":
+        """Per-answer overall scores under the given criterion weights"""
+        import numpy as np
+
+        weight_rows = np.array(
+            [[criteria_weights_for(stage, criteria_weights).get(k, 0.0) for k in SCORE_CRITERIA]
+             for stage in self.stage_names],
+            dtype=np.float64
+        ).reshape(len(self.stage_names), len(SCORE_CRITERIA))
+        weighted = np.einsum('ij,ij->i', self.scores, weight_rows[self.stage_codes])
+        return np.round(weighted, 2)
+
+    def interview_totals(self, overall: "np.ndarray", stages: List[str],
+                         stage_weights: Optional[Dict[str, float]] = None) -> Dict[str, Tuple[Dict[str, float], float]]:
+        """Stage averages and weighted total per interview_id"""
+        import numpy as np
+
+        stage_weights = STAGE_WEIGHTS if stage_weights is None else stage_weights
+        # Map this matrix's stage codes onto columns of `stages`; -1 is unknown
+        columns = np.array([stages.index(s) if s in stages else -1 for s in self.stage_names],
+                           dtype=np.intp)[self.stage_codes]
+        known = columns >= 0
+
+        shape = (len(self.interviews), len(stages))
+        cells = self.interview_codes[known] * len(stages) + columns[known]
+        size = shape[0] * shape[1]
+        totals = np.bincount(cells, weights=overall[known], minlength=size).reshape(shape)
+        counts = np.bincount(cells, minlength=size).reshape(shape)
+        averages = np.round(np.divide(totals, counts, out=np.zeros(shape), where=counts > 0), 2)
+        weighted = np.round(averages @ np.array([stage_weights.get(s, 0.0) for s in stages]), 2)
+
+        return {
+            interview: (dict(zip(stages, stage_averages)), total)
+            for interview, stage_averages, total in zip(self.interviews, averages.tolist(), weighted.tolist())
+        }
+
+
+def _encode(values: Iterable[str], count: int) -> Tuple[List[str], "np.ndarray"]:
+    import numpy as np
+
+    codes: Dict[str, int] = {}
+    encoded = np.fromiter((codes.setdefault(v, len(codes)) for v in values),
+                          dtype=np.intp, count=count)
+    return list(codes), encoded
+
+
+def reweight(rows, criteria_weights: Optional[Dict] = None,
+             stage_weights: Optional[Dict[str, float]] = None,
+             stages: Optional[List[str]] = None) -> Tuple["np.ndarray", Dict]:
+    """
+    Recompute overall scores of stored evaluations under new weights.
+    Returns the new overall score of every row, as an array in row order,
+    and {interview_id: {"stage_scores", "overall_score"}}. rows may be a
+    prebuilt ScoreMatrix when trying several weight sets.
+    """
+    matrix = rows if isinstance(rows, ScoreMatrix) else ScoreMatrix(rows)
+    overall = matrix.overall_scores(criteria_weights)
+    stages = stages or list(STAGE_WEIGHTS)
+
+    totals = matrix.interview_totals(overall, stages, stage_weights)
+    interviews = {
+        interview: {"stage_scores": stage_scores, "overall_score": total}
+        for interview, (stage_scores, total) in totals.items()
+    }
+    return overall, interviews
@@ -0,0 +1,297 @@
+"""
+Interview session storage.
+
+Routes look sessions up through a SessionStore instead of a module-level dict.
+The in-memory backend keeps live InterviewBot objects with LRU and idle-TTL
+eviction; the Redis backend stores a compact JSON snapshot per session so any
+worker process can serve any session.
+
+Deployments:
+
+* one process, in-memory sessions (the default);
+* several processes or nodes each with their own in-memory store, started
+  with distinct NODE_ID values. Session ids then start with the node id so a
+  load balancer can pin each session to the node that created it;
+* any number of workers sharing SESSION_STORE_URL.
+
+The app calls restore() on startup and drain() on shutdown. With
+SESSION_SNAPSHOT_PATH set, the in-memory store lets background work finish,
+writes every session to that file and reads them back on the next start, so
+a restart doesn't end interviews.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+from .interview_bot import InterviewBot
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def new_session_id() -> str:
+    """Random, collision-free session identifier, prefixed with NODE_ID if set"""
+    node = os.getenv('NODE_ID')
+    return f"{node}-{uuid.uuid4().hex}" if node else uuid.uuid4().hex
+
+
+class SessionStore:
+    """Interface shared by the session backends"""
+
+    async def create(self, bot: InterviewBot) -> str:
+        raise NotImplementedError
+
+    async def get(self, session_id: str) -> Optional[InterviewBot]:
+        raise NotImplementedError
+
+    async def save(self, session_id: str, bot: InterviewBot) -> None:
+        raise NotImplementedError
+
+    async def delete(self, session_id: str) -> None:
+        raise NotImplementedError
+
+    async def save_summary(self, session_id: str, bot: InterviewBot) -> None:
+        """Persist the memoized summary narrative, leaving the turn state alone"""
+
+    async def restore(self) -> None:
+        """Load what the last drain() saved; called once at startup"""
+
+    async def drain(self, timeout: float) -> None:
+        """Persist what a restart would otherwise lose; called once at shutdown"""
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local store with LRU eviction and an idle TTL"""
+
+    def __init__(self, max_sessions: int = 10000, ttl_seconds: float = 7200,
+                 snapshot_path: Optional[str] = None):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.snapshot_path = snapshot_path
+        self._sessions = OrderedDict()
+
+    async def restore(self) -> None:
+        if not self.snapshot_path:
+            return
+        try:
+            handle = open(self.snapshot_path)
+        except FileNotFoundError:
+            return
+        now = time.monotonic()
+        with handle:
+            for line in handle:
+                record = json.loads(line)
+                bot = InterviewBot.from_state(record["state"], record["resume"])
+                self._sessions[record["id"]] = (now - record["idle"], bot)
+        # A second restart must not bring back sessions ended in between
+        os.remove(self.snapshot_path)
+        self._evict()
+        logger.info(f"Restored {len(self._sessions)} interview sessions from {self.snapshot_path}")
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        # Entries are kept in last-used order, so expired ones are at the front
+        while self._sessions:
+            session_id, (last_used, _) = next(iter(self._sessions.items()))
+            if now - last_used < self.ttl_seconds and len(self._sessions) <= self.max_sessions:
+                break
+            self._sessions.popitem(last=False)
+            logger.info(f"Evicted interview session {session_id}")
+
+    async def create(self, bot: InterviewBot) -> str:
+        session_id = new_session_id()
+        self._sessions[session_id] = (time.monotonic(), bot)
+        self._evict()
+        return session_id
+
+    async def get(self, session_id: str) -> Optional[InterviewBot]:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        last_used, bot = entry
+        if time.monotonic() - last_used >= self.ttl_seconds:
+            del self._sessions[session_id]
+            return None
+        self._sessions[session_id] = (time.monotonic(), bot)
+        self._sessions.move_to_end(session_id)
+        return bot
+
+    async def save(self, session_id: str, bot: InterviewBot) -> None:
+        # Sessions are live objects here, so saving only refreshes recency
+        self._sessions[session_id] = (time.monotonic(), bot)
+        self._sessions.move_to_end(session_id)
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    async def drain(self, timeout: float) -> None:
+        """Finish background work on every session, then write the snapshot"""
+        bots = [bot for _, bot in self._sessions.values()]
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(bot.wait_for_background() for bot in bots)), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Background work still running after {timeout}s; saving sessions as they are")
+        if not self.snapshot_path:
+            if self._sessions:
+                logger.warning(f"Dropping {len(self._sessions)} interview sessions; set SESSION_SNAPSHOT_PATH to keep them")
+            return
+        
+        now = time.monotonic()
+        directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+        # Write then rename so a crash mid-write leaves the previous snapshot
+        handle = tempfile.NamedTemporaryFile("w", dir=directory, delete=False)
+        with handle:
+            for session_id, (last_used, bot) in self._sessions.items():
+                record = {"id": session_id, "idle": now - last_used,
+                          "state": bot.to_state(), "resume": bot.current_resume}
+                handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        os.replace(handle.name, self.snapshot_path)
+        logger.info(f"Saved {len(self._sessions)} interview sessions to {self.snapshot_path}")
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Shared store for multi-worker deployments. ``client`` is any object with
+    the redis.asyncio get/set/delete API. Resumes are stored once per content
+    hash and referenced from the session snapshot. Sessions are rebuilt on
+    every get() with ``llm``, or the shared client from llm_pool if None.
+
+    A conversation summary or question warm-up still running when a session
+    is saved is stored under its own key once it lands, and merged into the
+    snapshot by the next get(), so saving never waits for it. The interview summary
+    narrative also has its own key, so read-only requests never rewrite the
+    snapshot a concurrent turn may have just saved.
+    """
+
+    def __init__(self, client, ttl_seconds: int = 7200, prefix: str = "interview", llm=None):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.llm = llm
+        self._background = set()
+
+    def _session_key(self, session_id: str) -> str:
+        return f"{self.prefix}:session:{session_id}"
+
+    def _resume_key(self, resume_ref: str) -> str:
+        return f"{self.prefix}:resume:{resume_ref}"
+
+    def _memory_key(self, session_id: str) -> str:
+        return f"{self.prefix}:memory:{session_id}"
+
+    def _narrative_key(self, session_id: str) -> str:
+        return f"{self.prefix}:narrative:{session_id}"
+
+    def _drafts_key(self, session_id: str) -> str:
+        return f"{self.prefix}:drafts:{session_id}"
+
+    async def _write(self, session_id: str, bot: InterviewBot, only_new: bool = False) -> bool:
+        state = bot.to_state()
+        if bot.current_resume:
+            resume_ref = hashlib.sha256(bot.current_resume.encode("utf-8")).hexdigest()
+            await self.client.set(self._resume_key(resume_ref), bot.current_resume, ex=self.ttl_seconds)
+            state["resume"] = resume_ref
+        payload = json.dumps(state, separators=(",", ":"))
+        return bool(await self.client.set(
+            self._session_key(session_id), payload, ex=self.ttl_seconds, nx=only_new
+        ))
+
+    async def create(self, bot: InterviewBot) -> str:
+        while True:
+            session_id = new_session_id()
+            if await self._write(session_id, bot, only_new=True):
+                self._write_background_later(session_id, bot)
+                return session_id
+
+    async def get(self, session_id: str) -> Optional[InterviewBot]:
+        payload, memory, narrative, drafts = await asyncio.gather(
+            self.client.get(self._session_key(session_id)),
+            self.client.get(self._memory_key(session_id)),
+            self.client.get(self._narrative_key(session_id)),
+            self.client.get(self._drafts_key(session_id))
+        )
+        if payload is None:
+            return None
+        state = json.loads(payload)
+        resume_text = ""
+        if state.get("resume"):
+            resume_text = await self.client.get(self._resume_key(state["resume"])) or ""
+            if isinstance(resume_text, bytes):
+                resume_text = resume_text.decode("utf-8")
+        bot = InterviewBot.from_state(state, resume_text, llm=self.llm)
+        if memory is not None:
+            summary, folded = json.loads(memory)
+            bot.memory.merge_summary(summary, folded)
+        if narrative is not None:
+            bot.merge_summary_narrative(*json.loads(narrative))
+        if drafts is not None:
+            bot.merge_question_pool(json.loads(drafts))
+        return bot
+
+    async def _write_background(self, session_id: str, bot: InterviewBot) -> None:
+        await bot.wait_for_background()
+        if bot.memory.folded:
+            payload = json.dumps([bot.memory.summary, bot.memory.folded], separators=(",", ":"))
+            await self.client.set(self._memory_key(session_id), payload, ex=self.ttl_seconds)
+        if bot.question_pool:
+            payload = json.dumps(bot.question_pool, separators=(",", ":"))
+            await self.client.set(self._drafts_key(session_id), payload, ex=self.ttl_seconds)
+
+    def _write_background_later(self, session_id: str, bot: InterviewBot) -> None:
+        # This copy of the bot is dropped after the request; what its
+        # background work produces is stored on its own when it lands
+        if not bot.has_background_work:
+            return
+        task = asyncio.create_task(self._write_background(session_id, bot))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def save(self, session_id: str, bot: InterviewBot) -> None:
+        await self._write(session_id, bot)
+        self._write_background_later(session_id, bot)
+
+    async def save_summary(self, session_id: str, bot: InterviewBot) -> None:
+        if bot.summary_narrative is not None:
+            payload = json.dumps(list(bot.summary_narrative), separators=(",", ":"))
+            await self.client.set(self._narrative_key(session_id), payload, ex=self.ttl_seconds)
+
+    async def delete(self, session_id: str) -> None:
+        await self.client.delete(
+            self._session_key(session_id), self._memory_key(session_id),
+            self._narrative_key(session_id), self._drafts_key(session_id)
+        )
+
+    async def drain(self, timeout: float) -> None:
+        """Let summaries and warm-ups still running reach the store"""
+        if not self._background:
+            return
+        _, pending = await asyncio.wait(set(self._background), timeout=timeout)
+        if pending:
+            logger.warning(f"{len(pending)} sessions still had background work after {timeout}s; dropping it")
+
+
+def create_session_store() -> SessionStore:
+    """Build the store configured by SESSION_STORE_URL (redis://...) or fall back to memory"""
+    ttl_seconds = int(os.getenv('SESSION_TTL_SECONDS', '7200'))
+    url = os.getenv('SESSION_STORE_URL')
+    if url:
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise Exception("SESSION_STORE_URL is set but the 'redis' package is not installed")
+        return RedisSessionStore(redis.from_url(url), ttl_seconds=ttl_seconds)
+    return InMemorySessionStore(
+        max_sessions=int(os.getenv('SESSION_MAX_ACTIVE', '10000')),
+        ttl_seconds=ttl_seconds,
+        snapshot_path=os.getenv('SESSION_SNAPSHOT_PATH') or None
+    )
@@ -0,0 +1,303 @@
+"""
+Server-side speech for spoken interviews.
+
+A SpeechToText engine turns streamed candidate audio into incremental
+transcripts. A TextToSpeech engine renders interviewer text. Speaker
+synthesizes each sentence separately, a few at a time, and sends them in
+order, so the first audio chunk is ready after the first sentence rather
+than the whole question. Rendered sentences are kept in a content-addressed
+AudioCache keyed by the text and voice settings, so fixed lines like the
+greeting are synthesized once.
+
+The Google Cloud engines are the defaults and their client libraries are
+imported on first use; set_speech_engines swaps in local stand-ins.
+"""
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+
+from .metrics import span
+import logging
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {
+    "MP3": "audio/mpeg",
+    "OGG_OPUS": "audio/ogg",
+    "LINEAR16": "audio/wav",
+    "MULAW": "audio/basic",
+}
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_END.split(text.strip()) if s.strip()]
+
+
+class Transcript(NamedTuple):
+    text: str
+    is_final: bool
+
+
+class GoogleSpeechToText:
+    """Streaming recognition with interim results via Cloud Speech-to-Text"""
+
+    def __init__(self, language_code: str = "en-US", sample_rate: int = 16000,
+                 encoding: str = "LINEAR16"):
+        self.language_code = language_code
+        self.sample_rate = sample_rate
+        self.encoding = encoding
+        self._client = None
+
+    async def transcribe(self, audio: AsyncIterator[bytes]) -> AsyncIterator[Transcript]:
+        from google.cloud import speech
+
+        if self._client is None:
+            self._client = speech.SpeechAsyncClient()
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding[self.encoding],
+                sample_rate_hertz=self.sample_rate,
+                language_code=self.language_code,
+                enable_automatic_punctuation=True
+            ),
+            interim_results=True
+        )
+
+        async def requests():
+            yield speech.StreamingRecognizeRequest(streaming_config=streaming_config)
+            async for chunk in audio:
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+        responses = await self._client.streaming_recognize(requests=requests())
+        async for response in responses:
+            for result in response.results:
+                if result.alternatives:
+                    yield Transcript(result.alternatives[0].transcript, result.is_final)
+
+
+class GoogleTextToSpeech:
+    """Cloud Text-to-Speech, one request per sentence"""
+
+    def __init__(self, voice: str = "en-US-Neural2-F", language_code: str = "en-US",
+                 audio_encoding: str = "MP3", speaking_rate: float = 1.0):
+        self.voice = voice
+        self.language_code = language_code
+        self.audio_encoding = audio_encoding
+        self.speaking_rate = speaking_rate
+        self.media_type = MEDIA_TYPES.get(audio_encoding, "application/octet-stream")
+        self._client = None
+
+    @property
+    def cache_namespace(self) -> str:
+        """Everything besides the text that changes the rendered audio"""
+        return f"google:{self.language_code}:{self.voice}:{self.audio_encoding}:{self.speaking_rate}"
+
+    async def synthesize(self, text: str) -> bytes:
+        from google.cloud import texttospeech
+
+        if self._client is None:
+            self._client = texttospeech.TextToSpeechAsyncClient()
+        response = await self._client.synthesize_speech(
+            input=texttospeech.SynthesisInput(text=text),
+            voice=texttospeech.VoiceSelectionParams(language_code=self.language_code, name=self.voice),
+            audio_config=texttospeech.AudioConfig(
+                audio_encoding=texttospeech.AudioEncoding[self.audio_encoding],
+                speaking_rate=self.speaking_rate
+            )
+        )
+        return response.audio_content
+
+
+def audio_key(namespace: str, text: str) -> str:
+    return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """
+    Rendered audio by content hash: an in-process LRU bounded by total
+    bytes and, optionally, a directory of files that survives restarts and
+    can be shared by replicas.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, directory: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        if key in self._entries:
+            self.size -= len(self._entries.pop(key))
+        self._entries[key] = audio
+        self.size += len(audio)
+        while self.size > self.max_bytes and len(self._entries) > 1:
+            self.size -= len(self._entries.popitem(last=False)[1])
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return audio
+
+            if self.directory:
+                try:
+                    with open(os.path.join(self.directory, key), "rb") as handle:
+                        audio = handle.read()
+                except FileNotFoundError:
+                    audio = None
+                if audio is not None:
+                    self._remember(key, audio)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return audio
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, audio: bytes) -> None:
+        with self._lock:
+            self._remember(key, audio)
+        if self.directory:
+            # Write then rename so a concurrent reader never sees a partial file
+            handle = tempfile.NamedTemporaryFile(dir=self.directory, delete=False)
+            with handle:
+                handle.write(audio)
+            os.replace(handle.name, os.path.join(self.directory, key))
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class Speaker:
+    """Synthesizes text as a stream of audio chunks, sentence by sentence"""
+
+    def __init__(self, tts, cache: Optional[AudioCache] = None, chunk_bytes: int = 16 * 1024,
+                 lookahead: int = 3):
+        self.tts = tts
+        self.cache = cache
+        self.chunk_bytes = chunk_bytes
+        # Sentences rendering at once, including the one being sent
+        self.lookahead = lookahead
+
+    @property
+    def media_type(self) -> str:
+        return self.tts.media_type
+
+    async def render(self, sentence: str) -> Tuple[bytes, bool]:
+        """Audio for one sentence and whether it came from the cache"""
+        key = audio_key(self.tts.cache_namespace, sentence)
+        with span("tts") as call:
+            audio = self.cache.get(key) if self.cache is not None else None
+            if audio is not None:
+                call.cache_hit = True
+                return audio, True
+            audio = await self.tts.synthesize(sentence)
+            if self.cache is not None:
+                self.cache.put(key, audio)
+            return audio, False
+
+    async def speak(self, text: str) -> AsyncIterator[Tuple[bytes, bool]]:
+        """Yield (chunk, cached) pairs in sentence order"""
+        sentences = iter(split_sentences(text))
+        rendering = deque()
+        try:
+            for sentence in islice(sentences, self.lookahead):
+                rendering.append(asyncio.ensure_future(self.render(sentence)))
+            while rendering:
+                audio, cached = await rendering.popleft()
+                for sentence in islice(sentences, 1):
+                    rendering.append(asyncio.ensure_future(self.render(sentence)))
+                for start in range(0, len(audio), self.chunk_bytes):
+                    yield audio[start:start + self.chunk_bytes], cached
+        finally:
+            for task in rendering:
+                task.cancel()
+
+
+async def transcribe_answer(stt, audio: AsyncIterator[bytes]) -> AsyncIterator[Transcript]:
+    """
+    Relay interim transcripts, then yield the whole answer as a final
+    Transcript once the audio ends. Finals are joined; trailing interim text
+    is kept if the engine never finalized it.
+    """
+    finals = []
+    interim = ""
+    with span("stt"):
+        async for transcript in stt.transcribe(audio):
+            if transcript.is_final:
+                finals.append(transcript.text.strip())
+                interim = ""
+            else:
+                interim = transcript.text.strip()
+                yield transcript
+    if interim:
+        finals.append(interim)
+    yield Transcript(" ".join(t for t in finals if t), True)
+
+
+_engines = None
+_engines_lock = threading.Lock()
+
+
+def get_speech_engines() -> Tuple[object, Speaker]:
+    """Process-wide (speech-to-text, speaker), configured from the environment"""
+    global _engines
+    if _engines is None:
+        with _engines_lock:
+            if _engines is None:
+                language = os.getenv('SPEECH_LANGUAGE', 'en-US')
+                stt = GoogleSpeechToText(
+                    language_code=language,
+                    sample_rate=int(os.getenv('STT_SAMPLE_RATE', '16000')),
+                    encoding=os.getenv('STT_ENCODING', 'LINEAR16')
+                )
+                tts = GoogleTextToSpeech(
+                    voice=os.getenv('TTS_VOICE', 'en-US-Neural2-F'),
+                    language_code=language,
+                    audio_encoding=os.getenv('TTS_AUDIO_ENCODING', 'MP3')
+                )
+                _engines = (stt, _speaker(tts))
+    return _engines
+
+
+def _speaker(tts) -> Speaker:
+    cache = AudioCache(
+        max_bytes=int(os.getenv('AUDIO_CACHE_MAX_BYTES', str(64 * 1024 * 1024))),
+        directory=os.getenv('AUDIO_CACHE_DIR') or None
+    )
+    return Speaker(
+        tts, cache,
+        chunk_bytes=int(os.getenv('TTS_CHUNK_BYTES', str(16 * 1024))),
+        lookahead=int(os.getenv('TTS_LOOKAHEAD_SENTENCES', '3'))
+    )
+
+
+def set_speech_engines(stt, tts) -> None:
+    """Replace the speech engines (e.g. with local fakes), with a fresh audio cache"""
+    global _engines
+    with _engines_lock:
+        _engines = (stt, _speaker(tts))
@@ -0,0 +1,3 @@
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for budgeting prompts (Gemini averages ~4 chars per token)"""
+    return max(1, len(text) // 4) if text else 0
@@ -0,0 +1,189 @@
+"""
+In-process stage transition classifiers.
+
+The bot asks the LLM whether the candidate has covered the current stage.
+A classifier here can answer that locally; when its confidence is below the
+bot's threshold the LLM is still consulted. With TRANSITION_DECISIONS_PATH
+set, LLM decisions are appended to that file as JSON lines, candidate
+answer included, so they can be used to train or evaluate a local model
+offline. They never go to the app log, which only gets the answer's length
+and hash at DEBUG. In shadow mode the classifier's confident prediction is
+recorded next to the LLM decision and counted in
+``transition_shadow_decisions_total``, without replacing the LLM.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from .metrics import REGISTRY
+import logging
+
+logger = logging.getLogger(__name__)
+# Opt-in sink for full decision records; kept out of the app log
+decision_logger = logging.getLogger("app.transition.decisions")
+decision_logger.propagate = False
+_sink_lock = threading.Lock()
+
+SHADOW_DECISIONS = REGISTRY.counter(
+    "transition_shadow_decisions_total",
+    "Confident local transition predictions by agreement with the LLM (agree, disagree)",
+    ("stage", "outcome")
+)
+
+
+class TransitionDecision(NamedTuple):
+    should_transition: bool
+    confidence: float
+
+
+class TransitionClassifier:
+    def predict(self, stage: str, candidate_response: str) -> Optional[TransitionDecision]:
+        """Return a decision, or None when the classifier has no opinion"""
+        raise NotImplementedError
+
+
+# Topic groups a stage answer should touch before moving on. A group counts
+# as covered when any of its terms appears in the answer.
+STAGE_COVERAGE: Dict[str, List[List[str]]] = {
+    "introduction": [
+        ["studied", "degree", "university", "college", "bootcamp", "graduated", "school",
+         "major", "bachelor", "master", "phd", "course"],
+        ["experience", "worked", "working", "job", "role", "engineer", "developer",
+         "company", "startup", "years", "intern", "internship"],
+        ["interested", "interest", "passion", "passionate", "goal", "want", "looking for",
+         "career", "excited", "aspire", "enjoy", "love"],
+    ],
+    "technical": [
+        ["python", "java", "javascript", "typescript", "react", "sql", "postgres", "postgresql",
+         "mysql", "docker", "kubernetes", "aws", "gcp", "azure", "api", "database", "redis",
+         "kafka", "spark", "django", "fastapi", "node", "go", "rust", "c++", "framework"],
+        ["because", "trade-off", "tradeoff", "performance", "complexity", "scale", "scaling",
+         "latency", "index", "design", "architecture", "implemented", "consistency", "memory"],
+    ],
+    "experience": [
+        ["project", "built", "developed", "implemented", "migrated", "led", "designed",
+         "launched", "shipped", "created"],
+        ["challenge", "problem", "issue", "bug", "bottleneck", "difficult", "hard", "outage"],
+        ["result", "improved", "reduced", "increased", "impact", "percent", "%", "faster",
+         "saved", "users", "customers"],
+    ],
+    "behavioral": [
+        ["when", "time", "situation", "once", "last year", "previous"],
+        ["i decided", "i talked", "i proposed", "i organized", "i organised", "i took",
+         "we agreed", "listened", "communicated", "i asked", "i explained", "i set up"],
+        ["result", "outcome", "learned", "resolved", "successfully", "eventually", "in the end"],
+    ],
+}
+
+_WORD = re.compile(r"[\w%+#']+")
+
+
+class KeywordTransitionClassifier(TransitionClassifier):
+    """Per-stage keyword coverage rules; confident only at the extremes"""
+
+    def __init__(self, coverage: Dict[str, List[List[str]]] = STAGE_COVERAGE):
+        self.coverage = coverage
+
+    def predict(self, stage: str, candidate_response: str) -> Optional[TransitionDecision]:
+        groups = self.coverage.get(stage)
+        if not groups:
+            return None
+        
+        text = candidate_response.lower()
+        words = len(_WORD.findall(text))
+        padded = f" {' '.join(_WORD.findall(text))} "
+        covered = sum(
+            any(f" {term} " in padded or (" " in term and term in text) for term in group)
+            for group in groups
+        ) / len(groups)
+        
+        if words < 6:
+            return TransitionDecision(False, 0.9)
+        if covered == 1.0 and words >= 25:
+            return TransitionDecision(True, 0.9)
+        if covered >= 0.66 and words >= 40:
+            return TransitionDecision(True, 0.8)
+        if covered < 0.34 and words < 20:
+            return TransitionDecision(False, 0.85)
+        # Somewhere in between: let the LLM decide
+        return TransitionDecision(covered >= 0.5, 0.5)
+
+
+class ModelTransitionClassifier(TransitionClassifier):
+    """
+    Wraps a scikit-learn style pipeline (text in, predict_proba out) trained
+    on logged LLM decisions. Inputs are "<stage> <response>" strings.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._yes_column = list(model.classes_).index(1)
+
+    def predict(self, stage: str, candidate_response: str) -> Optional[TransitionDecision]:
+        if stage == "closing":
+            return None
+        probabilities = self.model.predict_proba([f"{stage} {candidate_response}"])[0]
+        yes = probabilities[self._yes_column]
+        return TransitionDecision(yes >= 0.5, max(yes, 1 - yes))
+
+
+def train_transition_model(records: Iterable[Dict]) -> ModelTransitionClassifier:
+    """Fit a TF-IDF + logistic regression model on logged decisions (needs scikit-learn)"""
+    try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import make_pipeline
+    except ImportError:
+        raise Exception("Training a transition model requires scikit-learn")
+    
+    records = list(records)
+    model = make_pipeline(
+        TfidfVectorizer(ngram_range=(1, 2), min_df=1),
+        LogisticRegression(max_iter=1000)
+    )
+    model.fit(
+        [f"{r['stage']} {r['response']}" for r in records],
+        [1 if r['llm_decision'] == 'yes' else 0 for r in records]
+    )
+    return ModelTransitionClassifier(model)
+
+
+def _decision_sink() -> Optional[logging.Logger]:
+    """decision_logger writing to TRANSITION_DECISIONS_PATH, or None when that is unset"""
+    path = os.getenv('TRANSITION_DECISIONS_PATH')
+    if not path:
+        return None
+    if not decision_logger.handlers:
+        with _sink_lock:
+            if not decision_logger.handlers:
+                handler = logging.FileHandler(path)
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                decision_logger.addHandler(handler)
+                decision_logger.setLevel(logging.INFO)
+    return decision_logger
+
+
+def log_llm_decision(stage: str, candidate_response: str, decision: str, latency_ms: float,
+                     shadow_decision: Optional[str] = None) -> None:
+    """
+    Record an LLM transition decision, with the local classifier's
+    'yes'/'no' when it ran in shadow mode. The full record, one JSON line
+    for offline training, only goes to TRANSITION_DECISIONS_PATH.
+    """
+    record = {
+        "stage": stage,
+        "llm_decision": decision,
+        "llm_latency_ms": round(latency_ms, 1)
+    }
+    if shadow_decision is not None:
+        record["shadow_decision"] = shadow_decision
+        SHADOW_DECISIONS.inc_key((stage, "agree" if shadow_decision == decision else "disagree"))
+    sink = _decision_sink()
+    if sink is not None:
+        sink.info(json.dumps({"stage": stage, "response": candidate_response, **record}))
+    if logger.isEnabledFor(logging.DEBUG):
+        record["response_chars"] = len(candidate_response)
+        record["response_sha256"] = hashlib.sha256(candidate_response.encode("utf-8")).hexdigest()[:16]
+        logger.debug(f"Transition decision {json.dumps(record)}")
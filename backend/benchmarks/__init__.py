@@ -0,0 +1,10 @@
+"""Offline benchmarks for the interview backend.
+
+Run from the ``backend`` directory, e.g. ``python -m benchmarks.bench_async_respond``.
+"""
+import os
+
+# Fake interviews must not end up in the analytics store, even when the
+# shell exports SCORE_STORE_PATH for the server; benchmarks that measure it
+# pass their own path
+os.environ["SCORE_STORE_PATH"] = ""
@@ -0,0 +1,63 @@
+"""Throughput of /interview/respond turns under concurrency.
+
+Each simulated session runs ``--turns`` calls of the respond path against a
+FakeLLM with ``--latency`` seconds per call. The ``async`` mode uses
+``aprocess_response``; the ``blocking`` mode calls ``process_response`` from
+a coroutine, which is what the route did before and freezes the event loop.
+Turns whose answer could not be scored are counted separately; they still
+produce a question, so they are part of the throughput.
+"""
+import argparse
+import asyncio
+import time
+
+from app.interview_bot import InterviewBot
+from benchmarks.fake_llm import FakeLLM
+
+CANDIDATE_ANSWER = "I built a data pipeline in Python that processed orders in real time."
+
+
+async def run_session(mode: str, latency: float, turns: int) -> int:
+    """Number of answers that could not be scored"""
+    bot = InterviewBot(llm=FakeLLM(latency=latency))
+    bot.llm_cache = None  # measure uncached LLM traffic
+    bot.current_resume = "Python developer with FastAPI experience"
+    failed = 0
+    for _ in range(turns):
+        if mode == "async":
+            result = await bot.aprocess_response(bot.current_resume, CANDIDATE_ANSWER)
+        else:
+            result = bot.process_response(bot.current_resume, CANDIDATE_ANSWER)
+        failed += bool((result["evaluation"] or {}).get("scoring_failed"))
+    return failed
+
+
+async def run_level(mode: str, concurrency: int, latency: float, turns: int):
+    """(turns per second, answers that could not be scored)"""
+    start = time.perf_counter()
+    failed = await asyncio.gather(*(run_session(mode, latency, turns) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return concurrency * turns / elapsed, sum(failed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--levels", default="1,8,32,128,256")
+    parser.add_argument("--modes", default="blocking,async")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.levels.split(",")]
+    print(f"{'mode':<10}{'sessions':>10}{'turns/s':>12}{'scoring failed':>16}")
+    for mode in args.modes.split(","):
+        for concurrency in levels:
+            if mode == "blocking" and concurrency > 8:
+                # Blocking throughput is flat; larger levels only take longer
+                continue
+            throughput, failed = asyncio.run(run_level(mode, concurrency, args.latency, args.turns))
+            print(f"{mode:<10}{concurrency:>10}{throughput:>12.1f}{failed:>16}")
+
+
+if __name__ == "__main__":
+    main()
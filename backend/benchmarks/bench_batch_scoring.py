@@ -0,0 +1,151 @@
+"""Batch scoring throughput, checkpoint resume and NumPy re-weighting.
+
+Answers from ``--transcripts`` are scored three ways against a FakeLLM: the
+old sequential ``evaluate_response`` loop, and ``BatchScorer`` at each
+``--concurrency``. The output file is then truncated and re-scored to show
+that only missing rows are sent again. Finally ``--reweight-rows`` synthetic
+evaluations are re-weighted with ``app.scoring.reweight`` and with a plain
+Python loop, and the results are compared.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+from app.batch import BatchScorer
+from app.interview_bot import InterviewBot
+from app.scoring import SCORE_CRITERIA, STAGE_WEIGHTS, ScoreMatrix, overall_score, reweight
+from benchmarks.fake_llm import FakeLLM
+
+DEFAULT_TRANSCRIPTS = os.path.join(os.path.dirname(__file__), "data", "transcripts.jsonl")
+
+
+def build_rows(path: str):
+    rows = []
+    with open(path) as handle:
+        for line in handle:
+            transcript = json.loads(line)
+            for answer in transcript["answers"]:
+                rows.append({
+                    "id": len(rows),
+                    "interview_id": transcript["interview_id"],
+                    "stage": answer["stage"],
+                    "question": f"Tell me about your {answer['stage']} background.",
+                    "response": answer["response"],
+                })
+    return rows
+
+
+def sequential(rows, latency: float):
+    bot = InterviewBot(llm=FakeLLM(latency=latency))
+    bot.llm_cache = None  # measure uncached LLM traffic
+    start = time.perf_counter()
+    for row in rows:
+        bot.evaluate_response(row["response"], row["question"], stage=row["stage"])
+    return time.perf_counter() - start
+
+
+async def batched(rows, latency: float, concurrency: int, output_path: str):
+    llm = FakeLLM(latency=latency)
+    scorer = BatchScorer(llm=llm, concurrency=concurrency)
+    scorer.bot.llm_cache = None  # measure uncached LLM traffic
+    start = time.perf_counter()
+    counts = await scorer.score_file(output_path + ".in", output_path)
+    return time.perf_counter() - start, counts, llm.calls
+
+
+def python_reweight(rows):
+    totals = {}
+    for row in rows:
+        score = overall_score(row["stage"], row["detailed_scores"])
+        stage_totals = totals.setdefault(row["interview_id"], {})
+        entry = stage_totals.setdefault(row["stage"], [0.0, 0])
+        entry[0] += score
+        entry[1] += 1
+    result = {}
+    for interview, stage_totals in totals.items():
+        averages = {s: round(t / c, 2) for s, (t, c) in stage_totals.items()}
+        result[interview] = round(sum(averages.get(s, 0) * w for s, w in STAGE_WEIGHTS.items()), 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transcripts", default=DEFAULT_TRANSCRIPTS)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32])
+    parser.add_argument("--reweight-rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = build_rows(args.transcripts)
+    print(f"{len(rows)} answers, {args.latency * 1000:.0f} ms fake LLM latency")
+    print(f"{'mode':<16}{'seconds':>10}{'rows/s':>10}")
+    elapsed = sequential(rows, args.latency)
+    print(f"{'sequential':<16}{elapsed:>10.2f}{len(rows) / elapsed:>10.0f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "scored.jsonl")
+        with open(output_path + ".in", "w") as handle:
+            for row in rows:
+                handle.write(json.dumps(row) + "\n")
+
+        for concurrency in args.concurrency:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            elapsed, counts, _ = asyncio.run(batched(rows, args.latency, concurrency, output_path))
+            print(f"{'batch x' + str(concurrency):<16}{elapsed:>10.2f}{counts['scored'] / elapsed:>10.0f}")
+
+        # Simulate an interrupted run: keep the first third of the results
+        with open(output_path) as handle:
+            lines = handle.readlines()
+        with open(output_path, "w") as handle:
+            handle.writelines(lines[:len(lines) // 3])
+            handle.write(lines[len(lines) // 3][:10])
+        _, counts, calls = asyncio.run(batched(rows, args.latency, args.concurrency[0], output_path))
+        print(f"resume: skipped {counts['skipped']}, scored {counts['scored']}, LLM calls {calls}")
+
+    stages = list(STAGE_WEIGHTS)
+    rng = random.Random(0)
+    synthetic = [
+        {
+            "interview_id": f"i{i // 15}",
+            "stage": rng.choice(stages),
+            "detailed_scores": {k: float(rng.randint(0, 10)) for k in SCORE_CRITERIA},
+        }
+        for i in range(args.reweight_rows)
+    ]
+    start = time.perf_counter()
+    _, interviews = reweight(synthetic)
+    numpy_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = python_reweight(synthetic)
+    python_elapsed = time.perf_counter() - start
+    mismatches = sum(abs(interviews[i]["overall_score"] - expected[i]) > 0.011 for i in expected)
+    print(f"reweight {len(synthetic)} rows: numpy {numpy_elapsed * 1000:.0f} ms, "
+          f"python {python_elapsed * 1000:.0f} ms, mismatched interviews {mismatches}")
+
+    # A rubric sweep builds the matrix once and only re-weights per candidate
+    matrix = ScoreMatrix(synthetic)
+    start = time.perf_counter()
+    for _ in range(10):
+        matrix.interview_totals(matrix.overall_scores(), stages)
+    sweep_elapsed = (time.perf_counter() - start) / 10
+    print(f"re-weight per weight set on a prebuilt matrix: {sweep_elapsed * 1000:.1f} ms")
+
+    # Re-weighting one session must not leak into others or the defaults,
+    # and must survive a session store round trip
+    llm = FakeLLM(latency=0)
+    reweighted, other = InterviewBot(llm=llm), InterviewBot(llm=llm)
+    reweighted.scoring_weights["technical"] += 0.1
+    restored = InterviewBot.from_state(reweighted.to_state(), llm=llm)
+    isolated = (other.scoring_weights == STAGE_WEIGHTS != reweighted.scoring_weights
+                and restored.scoring_weights == reweighted.scoring_weights
+                and restored.scoring_weights is not reweighted.scoring_weights)
+    print(f"stage weights are per session: {isolated}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Cold-start cost of the API process.
+
+Import time: ``python -X importtime -c "import main"`` is run in fresh
+interpreters ``--runs`` times; the table shows the median cumulative time of
+``main`` and the top-level packages that account for most of it.
+
+Time to first health check: ``uvicorn main:app`` is started in a subprocess
+and ``/health`` polled until it answers, which is what an autoscaler waits
+for before routing traffic to a new replica. Any HTTP response counts, so
+trees without the health route can be measured as a baseline.
+
+``--output`` saves the numbers as JSON; ``--budget-ms`` exits non-zero if
+the median import time of main exceeds it.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _env():
+    env = dict(os.environ)
+    env.setdefault("GOOGLE_API_KEY", "benchmark-placeholder")
+    env.setdefault("LOG_LEVEL", "WARNING")
+    return env
+
+
+def import_times(module: str):
+    """Cumulative import time of `module` and self time per top-level package, in ms"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True, check=True)
+    total = 0.0
+    packages = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header line
+        name = name.strip()
+        packages[name.split(".")[0]] += int(self_us) / 1000
+        if name == module:
+            total = int(cumulative_us) / 1000
+    return total, packages
+
+
+def time_to_health(timeout: float = 30.0) -> float:
+    """Seconds from spawning uvicorn to the first HTTP response from /health"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0)
+                return time.perf_counter() - start
+            except httpx.TransportError:
+                pass
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited before answering /health")
+            time.sleep(0.01)
+        raise RuntimeError(f"/health did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--skip-health", action="store_true")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--budget-ms", type=float, help="fail if the median import time exceeds this")
+    args = parser.parse_args()
+
+    totals = []
+    packages = defaultdict(list)
+    for _ in range(args.runs):
+        total, per_package = import_times(args.module)
+        totals.append(total)
+        for name, ms in per_package.items():
+            packages[name].append(ms)
+    median_total = statistics.median(totals)
+    top = sorted(((statistics.median(v), k) for k, v in packages.items()), reverse=True)[:args.top]
+
+    print(f"import {args.module}: median {median_total:.0f} ms over {args.runs} runs "
+          f"(min {min(totals):.0f}, max {max(totals):.0f})")
+    print(f"{'package':<28}{'self ms':>9}")
+    for ms, name in top:
+        print(f"{name:<28}{ms:>9.1f}")
+
+    results = {
+        "module": args.module,
+        "runs": args.runs,
+        "import_ms": {"median": round(median_total, 1), "min": round(min(totals), 1),
+                      "max": round(max(totals), 1)},
+        "top_packages_ms": {name: round(ms, 1) for ms, name in top},
+    }
+    if not args.skip_health:
+        health = [time_to_health() for _ in range(args.runs)]
+        results["time_to_health_ms"] = round(statistics.median(health) * 1000, 1)
+        print(f"time to first /health: median {results['time_to_health_ms']:.0f} ms")
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+    if args.budget_ms is not None and median_total > args.budget_ms:
+        print(f"import time {median_total:.0f} ms exceeds budget {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
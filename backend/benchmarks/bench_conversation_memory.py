@@ -0,0 +1,100 @@
+"""Prompt-token growth of the question prompt over a 15-turn interview.
+
+Answers are the longer labelled responses in ``data/synthetic_transition_decisions.jsonl``,
+three per stage. The same interview is replayed with the conversation history
+disabled (last answer only), with an unbounded buffer of every turn, and with
+the bounded memory (recent turns verbatim plus a rolling summary). For each
+turn the table shows the estimated tokens of the question prompt; background
+summary calls are counted separately since they are off the critical path.
+"""
+import argparse
+import asyncio
+import json
+import os
+
+from app.interview_bot import InterviewBot
+from app.memory import ConversationMemory
+from app.tokens import estimate_tokens
+from benchmarks.fake_llm import FakeLLM
+
+DEFAULT_DECISIONS = os.path.join(os.path.dirname(__file__), "data", "synthetic_transition_decisions.jsonl")
+STAGES = ["introduction", "technical", "experience", "behavioral", "closing"]
+
+
+class RecordingLLM(FakeLLM):
+    """FakeLLM that remembers the size of every question and memory prompt"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.question_tokens = []
+        self.memory_calls = 0
+        self.memory_tokens = 0
+
+    def _message(self, prompt: str):
+        if "Conversation so far" in prompt:
+            self.question_tokens.append(estimate_tokens(prompt))
+        elif "running notes" in prompt:
+            self.memory_calls += 1
+            self.memory_tokens += estimate_tokens(prompt)
+        return super()._message(prompt)
+
+
+def build_answers(path: str, turns: int):
+    with open(path) as handle:
+        records = [json.loads(line) for line in handle if line.strip()]
+    by_stage = {stage: [r["response"] for r in records if r["stage"] == stage and r["llm_decision"] == "yes"]
+                for stage in STAGES}
+    # Closing answers reuse behavioural ones; the prompt size is what matters
+    by_stage["closing"] = by_stage["behavioral"][::-1]
+    per_stage = turns // len(STAGES)
+    return [(stage, by_stage[stage][i % len(by_stage[stage])])
+            for stage in STAGES for i in range(per_stage)]
+
+
+async def replay(answers, mode: str, latency: float):
+    llm = RecordingLLM(latency=latency)
+    bot = InterviewBot(llm=llm)
+    bot.llm_cache = None  # measure uncached LLM traffic
+    bot.speculative_questions = False
+    # Walk the stages in a fixed order so every mode sees the same prompts
+    bot.transition_classifier = None
+    bot.max_interactions_per_stage = 3
+    if mode == "last answer":
+        bot.memory.render = lambda: "(none yet)"
+    elif mode == "full buffer":
+        bot.memory = ConversationMemory(recent_turns=10 ** 6, token_budget=10 ** 9)
+    bot.previous_question = "Could you please tell me a bit about yourself?"
+
+    per_turn = []
+    for _, answer in answers:
+        before = len(llm.question_tokens)
+        await bot.aprocess_response("", answer)
+        per_turn.append(max(llm.question_tokens[before:], default=0))
+        # The candidate's think time hides the background summary
+        if bot._memory_task:
+            await bot._memory_task
+    return per_turn, llm.memory_calls, llm.memory_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", default=DEFAULT_DECISIONS)
+    parser.add_argument("--turns", type=int, default=15)
+    parser.add_argument("--latency", type=float, default=0.001)
+    args = parser.parse_args()
+
+    answers = build_answers(args.decisions, args.turns)
+    modes = ["last answer", "full buffer", "bounded"]
+    results = {mode: asyncio.run(replay(answers, mode, args.latency)) for mode in modes}
+
+    print("question prompt tokens per turn")
+    print(f"{'turn':>4}  " + "".join(f"{mode:>14}" for mode in modes))
+    for turn in range(len(answers)):
+        print(f"{turn + 1:>4}  " + "".join(f"{results[mode][0][turn]:>14}" for mode in modes))
+    print(f"{'sum':>4}  " + "".join(f"{sum(results[mode][0]):>14}" for mode in modes))
+    calls, tokens = results["bounded"][1:]
+    print(f"bounded memory: {calls} background summary calls, {tokens} prompt tokens off the critical path")
+
+
+if __name__ == "__main__":
+    main()
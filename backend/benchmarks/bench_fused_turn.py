@@ -0,0 +1,61 @@
+"""LLM calls and tokens per interview, three-call mode vs fused turn mode.
+
+Drives a full 15-turn interview (5 stages x 3 interactions) through
+``aprocess_response`` against a FakeLLM and reports the number of calls and
+the estimated prompt/completion tokens. ``--failure-rate`` makes the fake
+return unparseable fused replies to exercise the fallback path.
+"""
+import argparse
+import asyncio
+
+from app.interview_bot import InterviewBot
+from benchmarks.fake_llm import FakeLLM
+
+RESUME = (
+    "Jane Doe - Senior Software Engineer. 6 years building Python services "
+    "with FastAPI, PostgreSQL and Kafka. Led a payments platform migration, "
+    "mentored 4 engineers, B.Sc. Computer Science. "
+) * 8
+
+ANSWERS = [
+    "I studied computer science and have spent six years on backend systems.",
+    "Mostly Python with FastAPI, plus PostgreSQL tuning and Kafka consumers.",
+    "We moved the payments platform to an event-driven design with idempotent handlers.",
+    "When two teams disagreed on the schema I set up a design review and we compromised.",
+    "I'd like to know more about the team and the next steps in the process.",
+]
+
+
+async def run_interview(fused: bool, speculative: bool, failure_rate: float, turns: int) -> FakeLLM:
+    llm = FakeLLM(latency=0.0, fused_failure_rate=failure_rate)
+    bot = InterviewBot(llm=llm)
+    bot.llm_cache = None  # measure uncached LLM traffic
+    bot.fused_turn = fused
+    bot.speculative_questions = speculative
+    bot.current_resume = RESUME
+    bot.previous_question = "Could you please tell me a bit about yourself?"
+    for turn in range(turns):
+        answer = ANSWERS[min(turn // bot.max_interactions_per_stage, len(ANSWERS) - 1)]
+        await bot.aprocess_response(bot.current_resume, answer)
+    return llm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=15)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    modes = (
+        ("three-call", False, False),
+        ("speculative", False, True),
+        ("fused", True, False),
+    )
+    print(f"{'mode':<13}{'calls':>7}{'prompt tok':>12}{'completion tok':>16}")
+    for name, fused, speculative in modes:
+        llm = asyncio.run(run_interview(fused, speculative, args.failure_rate, args.turns))
+        print(f"{name:<13}{llm.calls:>7}{llm.prompt_tokens:>12}{llm.completion_tokens:>16}")
+
+
+if __name__ == "__main__":
+    main()
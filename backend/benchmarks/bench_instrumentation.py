@@ -0,0 +1,65 @@
+"""Overhead of per-call spans and cost of rendering /metrics.
+
+Times ``--calls`` empty spans spread over every call kind and stage, then
+replays the recorded transcripts through ``aprocess_response`` with a
+zero-latency FakeLLM so the remaining time is the bot's own overhead, and
+renders the resulting registry.
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from app.interview_bot import InterviewBot
+from app.metrics import render_metrics, span
+from benchmarks.fake_llm import FakeLLM
+
+DEFAULT_TRANSCRIPTS = os.path.join(os.path.dirname(__file__), "data", "transcripts.jsonl")
+KINDS = ("transition", "question", "evaluate", "summary", "fused")
+
+
+async def replay(transcripts):
+    llm = FakeLLM(latency=0.0, jitter=0.0)
+    turns = 0
+    start = time.perf_counter()
+    for transcript in transcripts:
+        bot = InterviewBot(llm=llm)
+        bot.llm_cache = None  # measure uncached LLM traffic
+        bot.previous_question = "Could you please tell me a bit about yourself?"
+        for answer in transcript["answers"]:
+            await bot.aprocess_response("", answer["response"])
+            turns += 1
+        await bot.aget_interview_summary()
+    return turns, llm.calls, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transcripts", default=DEFAULT_TRANSCRIPTS)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    stages = InterviewBot.interview_stages
+    start = time.perf_counter()
+    for i in range(args.calls):
+        with span(KINDS[i % len(KINDS)], stages[i % len(stages)]) as call:
+            call.prompt_tokens = 100
+            call.completion_tokens = 20
+    per_span = (time.perf_counter() - start) / args.calls
+    print(f"span overhead: {per_span * 1e6:.2f} us per call")
+
+    with open(args.transcripts) as handle:
+        transcripts = [json.loads(line) for line in handle if line.strip()]
+    turns, calls, elapsed = asyncio.run(replay(transcripts))
+    print(f"replayed {turns} turns ({calls} LLM calls) in {elapsed * 1000:.0f} ms, "
+          f"{elapsed / turns * 1e6:.0f} us per turn")
+
+    start = time.perf_counter()
+    text = render_metrics()
+    print(f"render /metrics: {(time.perf_counter() - start) * 1000:.2f} ms, "
+          f"{len(text.splitlines())} lines")
+
+
+if __name__ == "__main__":
+    main()
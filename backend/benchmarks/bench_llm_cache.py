@@ -0,0 +1,110 @@
+"""Replay recorded transcripts through the LLM result cache.
+
+Every interview in ``--transcripts`` (JSONL of {"interview_id", "answers":
+[{"stage", "response"}]}) is replayed through ``aprocess_response`` against
+a FakeLLM, once without a cache and once with a shared LLMCache. Only the
+transition and scoring calls are cacheable by default. With ``--sqlite`` a
+third pass uses a fresh in-memory tier over the same SQLite file, showing
+what survives a restart. "sqlite on loop" is the time spent in SQLite
+calls made from the event-loop thread, which stalls every other session. Finally the prompt normalization is checked on
+answers that must, or must not, share a cache entry.
+"""
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+
+from app.interview_bot import InterviewBot
+from app.llm_cache import LLMCache, prompt_key
+from benchmarks.fake_llm import FakeLLM
+
+DEFAULT_TRANSCRIPTS = os.path.join(os.path.dirname(__file__), "data", "transcripts.jsonl")
+# Answers that differ only in case, spacing or final punctuation share a key
+SAME_KEY = [("Yes.", "yes"), ("I used  Python!", "i used python"), ("Mostly Go, some Rust...", "mostly go, some rust")]
+DIFFERENT_KEY = [("C++", "C"), ("C#", "C"), ("C++", "C#"), ("Python 5.0", "Python 50"), ("node.js", "node js")]
+
+
+def load_transcripts(path: str):
+    with open(path) as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+class TimedConnection:
+    """SQLite connection wrapper adding up the time spent on one thread"""
+
+    def __init__(self, db, thread):
+        self.db = db
+        self.thread = thread
+        self.seconds = 0.0
+
+    def __getattr__(self, name):
+        method = getattr(self.db, name)
+
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return method(*args)
+            finally:
+                if threading.current_thread() is self.thread:
+                    self.seconds += time.perf_counter() - start
+        return timed
+
+
+async def replay(transcripts, latency: float, cache):
+    llm = FakeLLM(latency=latency)
+    timed = None
+    if cache is not None and cache._db is not None:
+        timed = cache._db = TimedConnection(cache._db, threading.current_thread())
+    start = time.perf_counter()
+    for transcript in transcripts:
+        bot = InterviewBot(llm=llm)
+        bot.llm_cache = cache
+        bot.speculative_questions = False
+        bot.previous_question = "Could you please tell me a bit about yourself?"
+        for answer in transcript["answers"]:
+            await bot.aprocess_response("", answer["response"])
+    elapsed = time.perf_counter() - start
+    if timed is not None:
+        cache.flush()
+        cache._db = timed.db
+    return llm.calls, elapsed, timed.seconds if timed else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transcripts", default=DEFAULT_TRANSCRIPTS)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--sqlite", help="path of an SQLite file for the persistent tier")
+    args = parser.parse_args()
+
+    transcripts = load_transcripts(args.transcripts)
+    turns = sum(len(t["answers"]) for t in transcripts)
+    print(f"replaying {len(transcripts)} interviews, {turns} turns")
+
+    base_calls, base_time, _ = asyncio.run(replay(transcripts, args.latency, None))
+    passes = [("cached", LLMCache(sqlite_path=args.sqlite))]
+    if args.sqlite:
+        passes.append(("restarted", LLMCache(sqlite_path=args.sqlite)))
+
+    print(f"{'pass':<11}{'LLM calls':>10}{'hit rate':>10}{'disk hits':>11}{'wall (s)':>10}"
+          f"{'saved (s)':>11}{'sqlite on loop (ms)':>21}")
+    print(f"{'uncached':<11}{base_calls:>10}{'-':>10}{'-':>11}{base_time:>10.2f}{'-':>11}{'-':>21}")
+    for name, cache in passes:
+        calls, elapsed, stall = asyncio.run(replay(transcripts, args.latency, cache))
+        stats = cache.stats()
+        print(f"{name:<11}{calls:>10}{stats['hit_rate']:>10.1%}{stats['disk_hits']:>11}"
+              f"{elapsed:>10.2f}{base_time - elapsed:>11.2f}"
+              f"{(f'{stall * 1000:.1f}' if stall is not None else '-'):>21}")
+
+    def key(answer: str) -> str:
+        return prompt_key(f"Candidate's response: {answer}\nScore it.")
+
+    folded = all(key(a) == key(b) for a, b in SAME_KEY)
+    distinct = all(key(a) != key(b) for a, b in DIFFERENT_KEY)
+    print(f"\nnear-duplicates share a key: {folded}; technical variants keep distinct keys: {distinct}")
+
+
+if __name__ == "__main__":
+    main()
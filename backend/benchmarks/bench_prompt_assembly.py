@@ -0,0 +1,181 @@
+"""Time and memory spent assembling the prompts of one turn.
+
+``legacy`` reproduces how prompts used to be built: the five-entry
+stage_prompts dict rebuilt and ``.format``-ed on every call, plus f-strings
+for the transition and scoring prompts. ``registry`` renders the precompiled
+templates from app.prompts. Peak bytes is tracemalloc's high-water mark for
+assembling one turn's prompts. The registry's static prefixes are shared
+strings, built once at import.
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from app.prompts import QUESTION_PROMPTS, SCORING_PROMPT, TRANSITION_PROMPT
+
+STAGE = "technical"
+RESUME = "Backend engineer. Python, FastAPI, PostgreSQL, Kafka. " * 20
+ANSWER = "I designed an idempotent consumer so retries never double-charged customers."
+QUESTION = "How did you make the payment consumer safe to retry?"
+
+
+def legacy_turn():
+    current_stage = STAGE
+    candidate_response = ANSWER
+    transition = f"""
+            You are an AI analyzing interview responses.
+            Current stage: {current_stage}
+            Candidate's response: {candidate_response}
+            
+            Determine if we should move to the next stage based on:
+            - Introduction stage: Have they covered their background and education?
+            - Technical stage: Have they demonstrated their technical knowledge?
+            - Experience stage: Have they explained their project implementations?
+            - Behavioral stage: Have they shown their soft skills and problem-solving approach?
+            
+            Respond with ONLY 'yes' to move to next stage, or 'no' to continue current stage.
+            """
+    stage_prompts = {
+        "introduction": """
+                You are an HR interviewer named Natasha conducting a professional interview.
+                Previous response: {candidate_response}
+                
+                Generate a natural follow-up question focusing on:
+                - Educational background
+                - Academic achievements
+                - General professional background
+                - Career journey and aspirations
+                
+                RULES:
+                - Keep questions professional and focused
+                - Make it conversational and natural
+                - Don't mention interview stages
+                - One clear question at a time
+                - Consider the candidate's previous response
+                
+                Respond with ONLY the question, nothing else.
+                """,
+        "technical": """
+                You are a technical interviewer.
+                Resume: {resume_text}
+                Previous response: {candidate_response}
+                
+                Generate a technical follow-up question that:
+                - Builds upon their previous response
+                - Assesses specific technical skills mentioned in their resume
+                - Tests depth of technical knowledge
+                - Focuses on core technologies they've worked with
+                
+                Keep questions specific and technical.
+                Respond with ONLY the question, nothing else.
+                """,
+        "experience": """
+                You are a technical interviewer.
+                Resume: {resume_text}
+                Previous response: {candidate_response}
+                
+                Generate a follow-up question about:
+                - Specific projects they've mentioned
+                - Technical challenges and solutions
+                - Implementation details
+                - Real-world application of their skills
+                - Impact and results of their work
+                
+                Focus on practical experience and implementation.
+                Respond with ONLY the question, nothing else.
+                """,
+        "behavioral": """
+                You are an HR interviewer.
+                Previous response: {candidate_response}
+                
+                Generate a natural follow-up behavioral question that assesses:
+                - Problem-solving approach
+                - Team collaboration
+                - Handling challenges
+                - Leadership qualities
+                - Conflict resolution
+                
+                Use STAR (Situation, Task, Action, Result) format.
+                Consider their previous response for context.
+                Respond with ONLY the question, nothing else.
+                """,
+        "closing": """
+                You are an HR interviewer wrapping up the interview.
+                Previous response: {candidate_response}
+                
+                Generate a closing question about:
+                - Role clarification
+                - Company culture
+                - Next steps
+                - Start date availability
+                - Any final questions
+                
+                Keep it professional and welcoming.
+                Respond with ONLY the question, nothing else.
+                """
+    }
+    question = stage_prompts[current_stage].format(
+        candidate_response=candidate_response,
+        resume_text=RESUME if current_stage in ["technical", "experience"] else ""
+    )
+    scoring = f"""
+        You are an expert interview evaluator. Evaluate the following candidate response:
+        
+        Stage: {current_stage}
+        Question Asked: {QUESTION}
+        Candidate Response: {candidate_response}
+        
+        Score the response on these criteria (0-10 scale, use 0 if not applicable):
+        1. Relevance: How directly does it answer the question?
+        2. Depth: How detailed and thorough is the response?
+        3. Clarity: How well-structured and clear is the communication?
+        4. Technical Accuracy: How technically sound is the response? (use 0 for non-technical questions)
+        
+        Provide your evaluation in the following format ONLY:
+        RELEVANCE_SCORE: [number between 0-10]
+        DEPTH_SCORE: [number between 0-10]
+        CLARITY_SCORE: [number between 0-10]
+        TECHNICAL_SCORE: [number between 0-10]
+        FEEDBACK: [Brief 1-2 sentence feedback]
+        """
+    return transition, question, scoring
+
+
+def registry_turn():
+    return (
+        TRANSITION_PROMPT.render(current_stage=STAGE, candidate_response=ANSWER),
+        QUESTION_PROMPTS[STAGE].render(candidate_response=ANSWER, resume_text=RESUME, history="(none yet)"),
+        SCORING_PROMPT.render(current_stage=STAGE, question=QUESTION, candidate_response=ANSWER),
+    )
+
+
+def peak_bytes(build) -> int:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    build()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'us/turn':>9}{'peak bytes':>12}{'prompt chars':>14}")
+    for name, build in (("legacy", legacy_turn), ("registry", registry_turn)):
+        build()
+        per_turn = timeit.timeit(build, number=args.number) / args.number
+        chars = sum(len(prompt) for prompt in build())
+        print(f"{name:<10}{per_turn * 1e6:>9.2f}{peak_bytes(build):>12}{chars:>14}")
+
+    static = sum(len(prompt.static_prefix)
+                 for prompt in (TRANSITION_PROMPT, QUESTION_PROMPTS[STAGE], SCORING_PROMPT))
+    total = sum(len(prompt) for prompt in registry_turn())
+    print(f"static (shared) prefix: {static} of {total} chars")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Prompt size per turn with the full resume vs retrieved resume excerpts.
+
+Runs a 15-turn interview over a long synthetic CV twice: once with
+``resume_token_budget=None`` (the whole resume in every technical/experience
+prompt, as before) and once with the BM25 excerpt. Reports average
+estimated prompt tokens per turn and per resume-bearing question prompt,
+then checks that terms at the end of a sentence are still matched.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+
+from app.interview_bot import InterviewBot
+from app.resume_index import ResumeIndex, _terms
+from app.resume_ingest import extract_pdf_text
+from app.tokens import estimate_tokens
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.synthetic_pdf import build_pdf
+
+ANSWERS = [
+    "I studied computer science and moved into backend engineering.",
+    "I mostly use python and fastapi, with postgres and kafka for pipelines.",
+    "I migrated our platform to kubernetes with terraform and reduced latency.",
+    "I mentored the team through a tough delivery and we scaled the service.",
+    "I'd like to hear about next steps and the team.",
+]
+
+# (text, expected terms) for the tokenizer
+TERM_CASES = [
+    ("Skills: Python, Django. Built APIs in Go.", ["skills", "python", "django", "built", "apis", "go"]),
+    ("Shipped node.js and C++ services...", ["shipped", "node.js", "c++", "services"]),
+]
+
+
+class RecordingLLM(FakeLLM):
+    def __init__(self):
+        super().__init__(latency=0.0)
+        self.question_prompt_tokens = []
+
+    def _message(self, prompt):
+        if "Resume:" in prompt and "Respond with ONLY the question" in prompt:
+            self.question_prompt_tokens.append(estimate_tokens(prompt))
+        return super()._message(prompt)
+
+
+def long_resume(pages: int) -> str:
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as handle:
+        handle.write(build_pdf(pages))
+    try:
+        return extract_pdf_text(handle.name, max_pages=pages)
+    finally:
+        os.remove(handle.name)
+
+
+async def run(resume: str, budget, turns: int) -> RecordingLLM:
+    llm = RecordingLLM()
+    bot = InterviewBot(llm=llm)
+    bot.llm_cache = None  # measure uncached LLM traffic
+    bot.speculative_questions = False
+    bot.resume_token_budget = budget
+    bot.current_resume = resume
+    bot.previous_question = "Could you please tell me a bit about yourself?"
+    for turn in range(turns):
+        answer = ANSWERS[min(turn // bot.max_interactions_per_stage, len(ANSWERS) - 1)]
+        await bot.aprocess_response(bot.current_resume, answer)
+    return llm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=15)
+    parser.add_argument("--budget", type=int, default=InterviewBot.resume_token_budget)
+    args = parser.parse_args()
+
+    resume = long_resume(args.pages)
+    print(f"resume: {args.pages} pages, ~{estimate_tokens(resume)} tokens")
+    print(f"{'mode':<10}{'prompt tok/turn':>17}{'resume prompt tok':>19}")
+    for name, budget in (("full", None), ("excerpt", args.budget)):
+        llm = asyncio.run(run(resume, budget, args.turns))
+        per_turn = llm.prompt_tokens / args.turns
+        per_question = statistics.mean(llm.question_prompt_tokens)
+        print(f"{name:<10}{per_turn:>17.0f}{per_question:>19.0f}")
+
+    tokenized = all(_terms(text) == expected for text, expected in TERM_CASES)
+    matched = bool(ResumeIndex("Skills: Kafka.").search("I worked with Kafka a lot", 1))
+    print(f"sentence-final terms matched: {tokenized and matched}")
+
+
+if __name__ == "__main__":
+    main()
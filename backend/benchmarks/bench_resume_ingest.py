@@ -0,0 +1,106 @@
+"""Resume ingestion: inline parsing vs the process-pool pipeline.
+
+Builds a corpus of synthetic multi-page PDFs and ingests them concurrently.
+``inline`` parses on the event loop like the old upload route; ``pool`` uses
+ResumeParser (streamed temp file, worker processes); ``pool-cached`` re-uploads
+the same corpus so every parse is a content-hash cache hit. Event-loop lag is
+the worst delay observed by a 10 ms ticker while ingestion runs.
+"""
+import argparse
+import asyncio
+import io
+import os
+import random
+import tempfile
+import time
+
+from app.resume_ingest import ResumeParser, extract_pdf_text
+from benchmarks.synthetic_pdf import build_pdf
+
+
+class BytesUpload:
+    """The slice of UploadFile that ResumeParser.ingest uses"""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+async def inline_ingest(data: bytes) -> str:
+    # What the route used to do: write to a temp file and parse on the loop
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as handle:
+        handle.write(data)
+    try:
+        return extract_pdf_text(handle.name, max_pages=20)
+    finally:
+        os.remove(handle.name)
+
+
+async def run(ingest, corpus):
+    worst_lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal worst_lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            worst_lag = max(worst_lag, time.perf_counter() - start - 0.01)
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(ingest(data) for data in corpus))
+    elapsed = time.perf_counter() - start
+    done = True
+    await tick
+    return elapsed, worst_lag
+
+
+async def main_async(args):
+    rng = random.Random(0)
+    corpus = [build_pdf(rng.randint(args.min_pages, args.max_pages), seed=i) for i in range(args.resumes)]
+    total_mb = sum(len(data) for data in corpus) / 1e6
+    print(f"corpus: {len(corpus)} PDFs, {args.min_pages}-{args.max_pages} pages, {total_mb:.1f} MB")
+
+    parser = ResumeParser(max_workers=args.workers)
+    await warm_up(parser, corpus[0])
+
+    modes = (
+        ("inline", inline_ingest),
+        ("pool", lambda data: parser.ingest(BytesUpload(data))),
+        ("pool-cached", lambda data: parser.ingest(BytesUpload(data))),
+    )
+    print(f"{'mode':<13}{'wall (s)':>10}{'resumes/s':>11}{'max loop lag (ms)':>19}")
+    for name, ingest in modes:
+        elapsed, lag = await run(ingest, corpus)
+        print(f"{name:<13}{elapsed:>10.2f}{len(corpus) / elapsed:>11.1f}{lag * 1000:>19.1f}")
+    print(f"cache hits: {parser.cache_hits}, misses: {parser.cache_misses}")
+    parser.shutdown()
+
+
+async def warm_up(parser: ResumeParser, data: bytes) -> None:
+    """Start the worker processes before timing, then reset the cache"""
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as handle:
+        handle.write(data)
+    try:
+        await parser.parse(handle.name, "warm-up")
+    finally:
+        os.remove(handle.name)
+    parser._cache.clear()
+    parser.cache_hits = parser.cache_misses = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=40)
+    parser.add_argument("--min-pages", type=int, default=2)
+    parser.add_argument("--max-pages", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Interview latency while batch re-scoring competes for the LLM quota.
+
+``--batch-workers`` BatchScorer workers keep re-scoring answers while
+``--sessions`` interviews each answer ``--turns`` questions, with
+``--think`` seconds between answers. All calls share one LLMScheduler that
+allows ``--concurrency`` calls at a time and ``--rpm`` requests per minute.
+Every call goes to a FakeLLM with ``--latency`` seconds per call.
+
+``priority`` is the scheduler as configured for the app. ``fifo`` puts every
+call in one class and one session queue, so calls are served in arrival
+order. That is what a plain concurrency limit does.
+
+Admission: ``--burst`` sessions start a turn at the same moment, then
+``--probes`` new sessions ask to be admitted. The output shows how many
+were refused, the Retry-After they got and how long the refusal took.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.batch import BatchScorer
+from app.interview_bot import InterviewBot
+from app.llm_scheduler import LLMScheduler, SchedulerSaturated
+from benchmarks.fake_llm import FakeLLM
+
+CANDIDATE_ANSWER = "I built a data pipeline in Python that processed orders in real time."
+ROW = {"id": 0, "stage": "technical", "question": "How did you test the pipeline?",
+       "response": "Unit tests for each transform and a replay of a day of production orders."}
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _bot(scheduler: LLMScheduler, llm, mode: str) -> InterviewBot:
+    bot = InterviewBot(llm=llm)
+    bot.llm_cache = None  # measure uncached LLM traffic
+    bot.scheduler = scheduler
+    bot.current_resume = "Python developer with FastAPI experience"
+    if mode == "fifo":
+        bot.llm_priority = "interactive"
+        bot.interview_id = "everyone"
+    return bot
+
+
+async def interview(scheduler, llm, mode, turns, think, latencies):
+    bot = _bot(scheduler, llm, mode)
+    for _ in range(turns):
+        await asyncio.sleep(think)
+        start = time.perf_counter()
+        await bot.aprocess_response(bot.current_resume, CANDIDATE_ANSWER)
+        latencies.append(time.perf_counter() - start)
+
+
+async def rescore(scorer: BatchScorer, stop: asyncio.Event, done: list):
+    while not stop.is_set():
+        await scorer.score_row(ROW)
+        done.append(1)
+
+
+async def run_mode(mode: str, args) -> dict:
+    scheduler = LLMScheduler(max_concurrency=args.concurrency, requests_per_minute=args.rpm,
+                             burst_seconds=1.0)
+    llm = FakeLLM(latency=args.latency)
+    scorer = BatchScorer(llm=llm)
+    scorer.bot = _bot(scheduler, llm, mode)
+    if mode == "priority":
+        scorer.bot.llm_priority = "batch"
+
+    stop = asyncio.Event()
+    rescored = []
+    workers = [asyncio.create_task(rescore(scorer, stop, rescored)) for _ in range(args.batch_workers)]
+    await asyncio.sleep(args.warmup)
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(interview(scheduler, llm, mode, args.turns, args.think, latencies)
+                           for _ in range(args.sessions)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    return {
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 0.95),
+        "max": max(latencies),
+        "rescored_per_s": len(rescored) / (elapsed + args.warmup),
+    }
+
+
+async def admission(args) -> dict:
+    scheduler = LLMScheduler(max_concurrency=args.concurrency, requests_per_minute=args.rpm,
+                             burst_seconds=1.0, admission_wait=args.admission_wait)
+    llm = FakeLLM(latency=args.latency)
+    turns = [asyncio.create_task(interview(scheduler, llm, "priority", 1, 0.0, []))
+             for _ in range(args.burst)]
+    await asyncio.sleep(0.05)
+
+    refused = []
+    decide = []
+    for _ in range(args.probes):
+        start = time.perf_counter()
+        try:
+            scheduler.admit_session()
+        except SchedulerSaturated as e:
+            refused.append(e.retry_after)
+        decide.append(time.perf_counter() - start)
+    for task in turns:
+        task.cancel()
+    await asyncio.gather(*turns, return_exceptions=True)
+    return {
+        "refused": len(refused),
+        "retry_after": statistics.median(refused) if refused else 0.0,
+        "decide_us": statistics.mean(decide) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rpm", type=float, default=3000)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--think", type=float, default=0.2)
+    parser.add_argument("--batch-workers", type=int, default=32)
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--burst", type=int, default=300)
+    parser.add_argument("--probes", type=int, default=1000)
+    parser.add_argument("--admission-wait", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"quota {args.rpm:.0f} rpm, {args.concurrency} concurrent, {args.latency * 1000:.0f} ms/call, "
+          f"{args.batch_workers} re-scoring workers, {args.sessions} interviews x {args.turns} turns")
+    print(f"{'mode':<10}{'turn p50 ms':>12}{'turn p95 ms':>12}{'turn max ms':>12}{'rescored/s':>12}")
+    for mode in ("fifo", "priority"):
+        result = asyncio.run(run_mode(mode, args))
+        print(f"{mode:<10}{result['p50'] * 1000:>12.0f}{result['p95'] * 1000:>12.0f}"
+              f"{result['max'] * 1000:>12.0f}{result['rescored_per_s']:>12.1f}")
+
+    result = asyncio.run(admission(args))
+    print(f"\nadmission with {args.burst} turns queued: {result['refused']}/{args.probes} new sessions "
+          f"refused, Retry-After {result['retry_after']:.1f}s, {result['decide_us']:.1f} us per decision")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Write throughput, size and query time of the score store.
+
+``--rows`` synthetic evaluations (five stages, a few hundred distinct
+questions, one-sentence feedback) are recorded through ScoreStore.record
+into a fresh database. Reported: the enqueue cost on the request path, the
+time until the writer thread has committed everything, bytes on disk per
+row, the per-stage distribution query, and CSV/.npz exports. "dicts" is the
+same per-stage mean computed after loading every row as a Python dict, the
+approach the SQL aggregation replaces.
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+
+from app.score_store import ScoreStore
+from app.scoring import SCORE_CRITERIA, overall_score
+
+STAGES = ["introduction", "technical", "experience", "behavioral", "closing"]
+
+
+def evaluations(rows: int, seed: int):
+    rng = random.Random(seed)
+    questions = [f"Question {i}: tell me about a time you worked on project {i}?" for i in range(300)]
+    for index in range(rows):
+        stage = STAGES[index % len(STAGES)]
+        scores = {k: round(min(10.0, max(0.0, rng.gauss(6.5, 1.8))), 1) for k in SCORE_CRITERIA}
+        yield f"{index // 15:032x}", {
+            "stage": stage,
+            "question": rng.choice(questions),
+            "detailed_scores": scores,
+            "overall_score": overall_score(stage, scores),
+            "feedback": "Clear answer with a concrete example; could go deeper on trade-offs.",
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--dict-rows", type=int, default=200_000, help="rows loaded for the dicts baseline")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "scores.db")
+    store = ScoreStore(path)
+
+    generated = list(evaluations(args.rows, args.seed))
+    start = time.perf_counter()
+    for interview_id, evaluation in generated:
+        store.record(interview_id, evaluation)
+    enqueued = time.perf_counter() - start
+    store.flush()
+    committed = time.perf_counter() - start
+    del generated
+    size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+    print(f"{args.rows} rows: record {enqueued / args.rows * 1e6:.2f} us/row on the request path, "
+          f"all committed after {committed:.1f}s ({args.rows / committed:,.0f} rows/s)")
+    print(f"on disk: {size / 2 ** 20:.1f} MiB, {size / args.rows:.0f} bytes/row")
+
+    timings = {}
+    start = time.perf_counter()
+    distribution = store.distribution()
+    timings["distribution (sql)"] = time.perf_counter() - start
+    for fmt in ("csv", "npz"):
+        start = time.perf_counter()
+        store.export(os.path.join(directory, f"scores.{fmt}"))
+        timings[f"export {fmt}"] = time.perf_counter() - start
+
+    # Baseline: the stage means the way a log-scraping script would get them
+    start = time.perf_counter()
+    loaded = 0
+    totals = defaultdict(list)
+    for batch in store.iter_rows():
+        for row in batch:
+            record = dict(zip(("interview_id", "created", "stage", "question_hash") + SCORE_CRITERIA
+                              + ("overall", "feedback"), row))
+            totals[record["stage"]].append(record["overall"])
+            loaded += 1
+        if loaded >= args.dict_rows:
+            break
+    {stage: statistics.fmean(values) for stage, values in totals.items()}
+    timings[f"dicts ({loaded} rows)"] = time.perf_counter() - start
+
+    for name, seconds in timings.items():
+        print(f"{name:<24}{seconds * 1000:>10.0f} ms")
+    technical = distribution["technical"]
+    print(f"technical: n={technical['count']} mean={technical['mean']} quantiles={technical['quantiles']}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
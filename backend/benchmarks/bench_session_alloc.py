@@ -0,0 +1,81 @@
+"""Startup and per-session allocation cost, per-session clients vs the shared pool.
+
+``per-session`` rebuilds what InterviewBot.__init__ used to create for every
+session (a ChatGoogleGenerativeAI, a ConversationBufferMemory and a
+PromptTemplate). ``pooled`` constructs InterviewBot against the shared
+llm_pool client. Memory is the tracemalloc delta retained per live session
+(Python heap only; native gRPC channel buffers come on top of it).
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-placeholder")
+
+from langchain.memory import ConversationBufferMemory
+from langchain.prompts import PromptTemplate
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from app import llm_pool
+from app.interview_bot import InterviewBot
+
+# The unused per-session template InterviewBot.__init__ used to build
+LEGACY_INTERVIEW_TEMPLATE = """
+            You are an experienced HR interviewer conducting a technical interview. 
+            Current resume:
+            {resume_text}
+            
+            Current interview stage: {stage}
+            
+            Candidate's last response: {candidate_response}
+            
+            Based on the current stage and candidate's response, provide the next relevant question.
+            For technical questions, dive deeper if the candidate's response shows expertise.
+            If the response is unclear, ask for clarification.
+            Keep your responses conversational and professional.
+            """
+
+
+def per_session_objects():
+    return (
+        ChatGoogleGenerativeAI(model="gemini-pro", temperature=0.7,
+                               google_api_key=os.getenv('GOOGLE_API_KEY')),
+        ConversationBufferMemory(memory_key="chat_history", return_messages=True,
+                                 input_key="candidate_response"),
+        PromptTemplate(input_variables=["resume_text", "stage", "candidate_response"],
+                       template=LEGACY_INTERVIEW_TEMPLATE),
+        InterviewBot(llm=object()),
+    )
+
+
+def measure(build, sessions: int):
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    live = [build() for _ in range(sessions)]
+    elapsed = time.perf_counter() - start
+    retained = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+    del live
+    return elapsed / sessions, retained / sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=100)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    llm_pool.get_llm()
+    print(f"shared client startup: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    print(f"{'mode':<13}{'setup (ms)':>12}{'memory (KiB)':>14}")
+    for name, build in (("per-session", per_session_objects), ("pooled", InterviewBot)):
+        build()  # warm caches and lazy imports
+        setup, memory = measure(build, args.sessions)
+        print(f"{name:<13}{setup * 1000:>12.3f}{memory / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
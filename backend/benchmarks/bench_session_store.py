@@ -0,0 +1,77 @@
+"""Session store throughput and snapshot size.
+
+Runs a get/save cycle per simulated turn against the in-memory store and the
+Redis store (backed by the FakeRedis stand-in, optionally with injected
+round-trip latency). Two RedisSessionStore instances share one FakeRedis to
+stand in for two workers, and the benchmark checks that a session written
+by one is served by the other.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from app import llm_pool
+from app.interview_bot import InterviewBot
+from app.session_store import InMemorySessionStore, RedisSessionStore
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.fake_redis import FakeRedis
+
+RESUME = "Data engineer with Spark, Airflow and Python experience. " * 40
+
+
+def populated_bot(turns: int) -> InterviewBot:
+    bot = InterviewBot(llm=FakeLLM(latency=0.0))
+    bot.current_resume = RESUME
+    bot.previous_question = "Tell me about yourself."
+    for _ in range(turns):
+        bot.process_response(RESUME, "I built batch and streaming pipelines on Spark.")
+    return bot
+
+
+async def cycle(store, bot: InterviewBot, sessions: int, turns: int) -> float:
+    ids = [await store.create(bot) for _ in range(sessions)]
+    start = time.perf_counter()
+    for _ in range(turns):
+        for session_id in ids:
+            loaded = await store.get(session_id)
+            await store.save(session_id, loaded)
+    return sessions * turns / (time.perf_counter() - start)
+
+
+async def main_async(args):
+    # Sessions rebuilt by the Redis store use the shared client
+    llm_pool.set_client_factory(lambda model, temperature: FakeLLM(latency=0.0))
+    bot = populated_bot(args.history)
+    snapshot = json.dumps(bot.to_state(), separators=(",", ":"))
+    print(f"snapshot size after {args.history} turns: {len(snapshot)} bytes (resume stored once by reference)")
+
+    redis = FakeRedis(latency=args.redis_latency)
+    stores = (
+        ("memory", InMemorySessionStore()),
+        ("redis-standin", RedisSessionStore(redis)),
+    )
+    print(f"{'store':<15}{'get+save/s':>12}")
+    for name, store in stores:
+        rate = await cycle(store, bot, args.sessions, args.turns)
+        print(f"{name:<15}{rate:>12.0f}")
+
+    worker_a, worker_b = RedisSessionStore(redis), RedisSessionStore(redis, llm=FakeLLM(latency=0.0))
+    session_id = await worker_a.create(bot)
+    restored = await worker_b.get(session_id)
+    shared = restored.to_state() == bot.to_state() and restored.current_resume == bot.current_resume
+    print(f"session shared across workers: {shared}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--history", type=int, default=15)
+    parser.add_argument("--redis-latency", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Latency of the speech WebSockets against local stand-in engines.
+
+The app is served by uvicorn on a local port (see http_server) and driven
+with the websockets client.
+
+Synthesis: time to the first audio chunk and to the last one for the
+greeting and for a multi-sentence question. "whole text" is one TTS call
+for the full text, which is what the sentence pipeline replaces. "cold" is
+the first request through the synthesize socket and "cached" is a repeat
+served from the audio cache.
+
+Transcription: ``--frames`` audio frames (text standing in for audio) are
+sent per answer. The table shows how many interim transcripts came back and
+the time from the end-of-answer frame to the next question.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-placeholder")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx
+from websockets.asyncio.client import connect
+
+from app import llm_pool
+from app.routes import GREETING
+from app.speech import set_speech_engines
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.fake_speech import FakeSpeechToText, FakeTextToSpeech
+from benchmarks.http_server import start_server
+from benchmarks.synthetic_pdf import build_pdf
+from main import app
+
+API = "/api/v1/interview"
+QUESTION = (
+    "That sounds like a demanding migration. How did you decide which services to move first? "
+    "What would you do differently if you ran it again today? "
+    "And how did you keep the on-call load manageable during the cutover?"
+)
+ANSWER = "we moved the billing service first because it had the fewest callers and good tests".split()
+
+
+async def speak(ws_url: str, session_id: str, text: str):
+    """(time to first chunk, total time, cached chunks) for one synthesize request"""
+    async with connect(f"{ws_url}{API}/{session_id}/speech/synthesize") as ws:
+        start = time.perf_counter()
+        await ws.send(json.dumps({"text": text}))
+        assert json.loads(await ws.recv())["event"] == "start"
+        first = None
+        while True:
+            message = await ws.recv()
+            if isinstance(message, bytes):
+                first = first or time.perf_counter() - start
+            else:
+                end = json.loads(message)
+                return first, time.perf_counter() - start, end["cached_chunks"]
+
+
+async def answer(ws_url: str, session_id: str, frames: int):
+    """(interim transcripts, seconds from end of audio to result)"""
+    async with connect(f"{ws_url}{API}/{session_id}/speech/transcribe") as ws:
+        words = (ANSWER * (frames // len(ANSWER) + 1))[:frames]
+        for word in words:
+            await ws.send(word.encode("utf-8"))
+        await ws.send(json.dumps({"event": "end"}))
+        ended = time.perf_counter()
+        partials = 0
+        while True:
+            event = json.loads(await ws.recv())
+            if event["event"] == "partial":
+                partials += 1
+            elif event["event"] == "result":
+                return partials, time.perf_counter() - ended
+            else:
+                raise RuntimeError(event)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tts-latency", type=float, default=0.15)
+    parser.add_argument("--char-latency", type=float, default=0.002)
+    parser.add_argument("--stt-latency", type=float, default=0.005)
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    parser.add_argument("--frames", type=int, default=40)
+    parser.add_argument("--answers", type=int, default=5)
+    args = parser.parse_args()
+
+    llm_pool.set_client_factory(lambda model, temperature: FakeLLM(latency=args.llm_latency))
+    set_speech_engines(FakeSpeechToText(latency=args.stt_latency),
+                       FakeTextToSpeech(latency=args.tts_latency, char_latency=args.char_latency))
+
+    base_url = start_server(app)
+    ws_url = base_url.replace("http://", "ws://")
+    upload = httpx.post(f"{base_url}{API}/upload-resume",
+                        files={"file": ("resume.pdf", build_pdf(2), "application/pdf")}, timeout=30.0)
+    upload.raise_for_status()
+    session_id = upload.json()["session_id"]
+
+    print(f"{'synthesis':<24}{'first chunk ms':>15}{'total ms':>10}{'cached':>8}")
+    for name, text in (("greeting", GREETING), ("question", QUESTION)):
+        start = time.perf_counter()
+        asyncio.run(FakeTextToSpeech(latency=args.tts_latency, char_latency=args.char_latency).synthesize(text))
+        whole = (time.perf_counter() - start) * 1000
+        print(f"{name + ', whole text':<24}{whole:>15.0f}{whole:>10.0f}{'-':>8}")
+        for label in ("cold", "cached"):
+            first, total, cached = asyncio.run(speak(ws_url, session_id, text))
+            print(f"{name + ', ' + label:<24}{first * 1000:>15.0f}{total * 1000:>10.0f}{cached:>8}")
+
+    results = [asyncio.run(answer(ws_url, session_id, args.frames)) for _ in range(args.answers)]
+    partials = statistics.mean(r[0] for r in results)
+    after_end = statistics.mean(r[1] for r in results) * 1000
+    print(f"\ntranscription: {args.frames} frames/answer, {partials:.0f} interim transcripts, "
+          f"{after_end:.0f} ms from end of audio to next question")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Time-to-first-token of the SSE respond route vs the buffered route.
+
+Both routes are served by uvicorn on a local port, in a background thread,
+against a FakeLLM that streams the question word by word (``--token-latency``
+between words). A real socket is used because httpx's ASGI transport buffers
+response bodies. For the buffered route the first byte arrives with the full
+reply.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+from app import routes
+from app.interview_bot import InterviewBot
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.http_server import start_server
+from main import app
+
+CANDIDATE_ANSWER = "I optimised our search service by moving ranking into a batch job."
+
+
+async def new_session(latency: float, token_latency: float) -> str:
+    bot = InterviewBot(llm=FakeLLM(latency=latency, token_latency=token_latency))
+    bot.llm_cache = None  # measure uncached LLM traffic
+    bot.current_resume = "Search engineer, Elasticsearch, Python"
+    bot.previous_question = "Tell me about yourself."
+    return await routes.session_store.create(bot)
+
+
+async def buffered_turn(client: httpx.AsyncClient, session_id: str):
+    start = time.perf_counter()
+    response = await client.post("/api/v1/interview/respond",
+                                 json={"session_id": session_id, "response": CANDIDATE_ANSWER})
+    response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+
+async def streamed_turn(client: httpx.AsyncClient, session_id: str):
+    start = time.perf_counter()
+    first_token = None
+    async with client.stream("POST", "/api/v1/interview/respond/stream",
+                             json={"session_id": session_id, "response": CANDIDATE_ANSWER}) as response:
+        event = None
+        async for line in response.aiter_lines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: ") and event == "token" and first_token is None:
+                first_token = time.perf_counter() - start
+            elif line.startswith("data: ") and event == "error":
+                raise RuntimeError(json.loads(line[len("data: "):])["detail"])
+    return first_token, time.perf_counter() - start
+
+
+async def run(base_url: str, mode: str, turns: int, latency: float, token_latency: float):
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        session_id = await new_session(latency, token_latency)
+        turn = streamed_turn if mode == "stream" else buffered_turn
+        return [await turn(client, session_id) for _ in range(turns)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--token-latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    base_url = start_server(app)
+    print(f"{'route':<10}{'ttft (ms)':>11}{'total (ms)':>12}")
+    for mode in ("buffered", "stream"):
+        results = asyncio.run(run(base_url, mode, args.turns, args.latency, args.token_latency))
+        ttft = statistics.mean(r[0] for r in results) * 1000
+        total = statistics.mean(r[1] for r in results) * 1000
+        print(f"{mode:<10}{ttft:>11.1f}{total:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
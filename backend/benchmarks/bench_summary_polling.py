@@ -0,0 +1,98 @@
+"""Cost of polling GET /interview/{id}/summary.
+
+A session with a full 15-answer score list is polled ``--polls`` times,
+concurrently, with a new evaluation arriving every ``--every`` polls. The
+memoized summary calls the LLM once per score version; the legacy column is
+what the old implementation did (one call per poll). Stage scores are
+checked against a full rescan of response_scores. Finally, through the Redis
+session store, a summary request that overlaps a turn must keep that turn
+while still sparing the next poll its LLM call.
+"""
+import argparse
+import asyncio
+
+from app.interview_bot import InterviewBot
+from app.session_store import RedisSessionStore
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.fake_redis import FakeRedis
+
+
+def rescan_stage_scores(bot: InterviewBot):
+    """The pre-aggregate computation, used to check the running totals"""
+    stage_scores = {}
+    for stage in bot.interview_stages:
+        stage_responses = [r for r in bot.response_scores if r['stage'] == stage]
+        if stage_responses:
+            stage_scores[stage] = round(
+                sum(r['overall_score'] for r in stage_responses) / len(stage_responses), 2
+            )
+        else:
+            stage_scores[stage] = 0
+    return stage_scores
+
+
+async def main_async(args):
+    llm = FakeLLM(latency=args.latency)
+    bot = InterviewBot(llm=llm)
+    bot.llm_cache = None  # measure uncached LLM traffic
+    bot.previous_question = "Tell me about yourself."
+    for _ in range(15):
+        await bot.aprocess_response("", "I enjoy building reliable distributed systems.")
+    llm.calls = 0
+
+    consistent = True
+    for start in range(0, args.polls, args.every):
+        batch = min(args.every, args.polls - start)
+        summaries = await asyncio.gather(*(bot.aget_interview_summary() for _ in range(batch)))
+        consistent &= all(s["stage_scores"] == rescan_stage_scores(bot) for s in summaries)
+        await bot.aevaluate_response("Another answer", "Another question")
+    versions = -(-args.polls // args.every)
+    # Each batch was followed by one scoring call; the rest were summaries
+    summary_calls = llm.calls - versions
+
+    print(f"polls: {args.polls}, score versions: {versions}")
+    print(f"LLM summary calls  legacy: {args.polls}  memoized: {summary_calls}")
+    print(f"stage scores match full rescan: {consistent}")
+
+
+async def overlapping_summary(latency: float) -> bool:
+    """Summary loaded before a turn and persisted after it, as two requests would"""
+    llm = FakeLLM(latency=latency)
+    store = RedisSessionStore(FakeRedis(), llm=llm)
+    bot = InterviewBot(llm=llm)
+    bot.previous_question = "Tell me about yourself."
+    session_id = await store.create(bot)
+    for _ in range(3):
+        turn = await store.get(session_id)
+        await turn.aprocess_response("", "I enjoy building reliable distributed systems.")
+        await store.save(session_id, turn)
+
+    async def poll(bot: InterviewBot) -> None:
+        # What GET /summary does with a session it loaded
+        await bot.aget_interview_summary()
+        await store.save_summary(session_id, bot)
+
+    reader, writer = await store.get(session_id), await store.get(session_id)
+    await writer.aprocess_response("", "I also mentor new engineers.")
+    await store.save(session_id, writer)
+    await poll(reader)
+    turn_kept = len((await store.get(session_id)).response_scores) == len(writer.response_scores)
+
+    await poll(await store.get(session_id))
+    calls = llm.calls
+    await poll(await store.get(session_id))
+    return turn_kept and llm.calls == calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument("--every", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+    print(f"overlapping summary keeps the turn and the narrative: {asyncio.run(overlapping_summary(args.latency))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Candidate-facing latency of a single respond turn.
+
+Compares three pipelines:
+
+* ``sequential``: ``process_response`` (evaluate, transition check, question)
+* ``overlapped``: ``aprocess_response`` with speculation disabled, so scoring
+  overlaps the transition check but the question waits for it
+* ``speculative``: ``aprocess_response`` drafting both candidate questions
+  alongside the transition check
+
+Latency is reported in units of the injected per-call LLM latency, so 1.0
+means one round-trip. Turns run back to back unless ``--think`` gives the
+candidate time to answer. Older turns are summarised in the background by
+the async pipelines and inline after the question by the sync one; the
+final check replays each pipeline with two round-trips of think time, which
+lets the summary land, and compares the resulting interviews.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.interview_bot import InterviewBot
+from benchmarks.fake_llm import FakeLLM
+
+CANDIDATE_ANSWER = "I led the migration of our billing service to an event-driven design."
+
+
+async def measure(pipeline: str, latency: float, think: float, turns: int):
+    llm = FakeLLM(latency=latency)
+    bot = InterviewBot(llm=llm)
+    bot.llm_cache = None  # measure uncached LLM traffic
+    bot.speculative_questions = pipeline == "speculative"
+    bot.current_resume = "Backend engineer, Python, Kafka, PostgreSQL"
+    # Seed the first question so every measured turn includes an evaluation
+    bot.previous_question = "Tell me about yourself."
+
+    timings = []
+    for _ in range(turns):
+        await asyncio.sleep(think)
+        start = time.perf_counter()
+        if pipeline == "sequential":
+            bot.process_response(bot.current_resume, CANDIDATE_ANSWER)
+        else:
+            await bot.aprocess_response(bot.current_resume, CANDIDATE_ANSWER)
+        timings.append(time.perf_counter() - start)
+    return timings, llm.calls / turns, bot.get_interview_summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--think", type=float, default=0.0)
+    parser.add_argument("--turns", type=int, default=10)
+    args = parser.parse_args()
+
+    pipelines = ("sequential", "overlapped", "speculative")
+    print(f"{'pipeline':<12}{'mean (s)':>10}{'round-trips':>13}{'calls/turn':>12}")
+    for name in pipelines:
+        timings, calls, _ = asyncio.run(measure(name, args.latency, args.think, args.turns))
+        mean = statistics.mean(timings)
+        print(f"{name:<12}{mean:>10.3f}{mean / args.latency:>13.2f}{calls:>12.2f}")
+
+    summaries = [asyncio.run(measure(name, args.latency, args.latency * 2, args.turns))[2] for name in pipelines]
+    print(f"summaries identical: {summaries[0] == summaries[1] == summaries[2]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Latency of the first question of each stage, with and without warm-up.
+
+Each of ``--sessions`` interviews starts like an upload: the resume is set
+and, with warm-up on, ``start_warm_up`` drafts opening questions in the
+background. The candidate then takes ``--greeting`` seconds to answer the
+greeting, and answers until the behavioral stage begins. Every call goes to
+a FakeLLM with ``--latency`` seconds per call.
+
+"opening" turns are the ones that enter the technical or experience stage,
+which warm-up serves from its drafts. "other" turns are every other turn.
+For ``stream`` the time is to the first question token. The "+redis" rows
+keep each session in a RedisSessionStore (FakeRedis) and rebuild the bot
+on every turn, as a multi-worker deployment does; the LLM cache is off, so
+the drafts can only come from the store.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.interview_bot import InterviewBot
+from app.session_store import RedisSessionStore
+from benchmarks.fake_llm import FakeLLM
+from benchmarks.fake_redis import FakeRedis
+
+RESUME = (
+    "Backend engineer. Python, FastAPI, Kafka and PostgreSQL. Led the migration of a "
+    "billing service to an event-driven design; built a fraud-scoring pipeline."
+)
+ANSWERS = [
+    "I studied computer science and have worked on backend systems for six years.",
+    "I led the migration of our billing service to an event-driven design with Kafka.",
+    "We partitioned by account id and used idempotent consumers to handle replays.",
+]
+
+
+async def turn(bot: InterviewBot, mode: str, answer: str) -> float:
+    start = time.perf_counter()
+    if mode == "respond":
+        await bot.aprocess_response(bot.current_resume, answer)
+        return time.perf_counter() - start
+    first_token = None
+    async for event, _ in bot.astream_response(bot.current_resume, answer):
+        if event == "token" and first_token is None:
+            first_token = time.perf_counter() - start
+    return first_token
+
+
+def new_bot(llm: FakeLLM) -> InterviewBot:
+    bot = InterviewBot(llm=llm)
+    bot.llm_cache = None  # measure uncached LLM traffic
+    return bot
+
+
+async def interview(mode: str, warm: bool, args, opening: list, other: list, llm: FakeLLM, store):
+    bot = new_bot(llm)
+    bot.current_resume = RESUME
+    if warm:
+        bot.start_warm_up()
+    session_id = await store.create(bot) if store else None
+    await asyncio.sleep(args.greeting)
+
+    index = 0
+    while bot.interview_stages[bot.current_stage] != "behavioral":
+        if store:
+            bot = await store.get(session_id)
+            bot.llm_cache = None
+        stage = bot.current_stage
+        elapsed = await turn(bot, mode, ANSWERS[index % len(ANSWERS)])
+        if store:
+            await store.save(session_id, bot)
+        entered = bot.interview_stages[bot.current_stage]
+        (opening if bot.current_stage != stage and entered in bot.warm_up_stages else other).append(elapsed)
+        index += 1
+
+
+async def run(mode: str, warm: bool, redis: bool, args):
+    llm = FakeLLM(latency=args.latency, token_latency=args.token_latency)
+    store = RedisSessionStore(FakeRedis(), llm=llm) if redis else None
+    opening, other = [], []
+    await asyncio.gather(*(interview(mode, warm, args, opening, other, llm, store)
+                           for _ in range(args.sessions)))
+    return opening, other, llm.calls / args.sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--token-latency", type=float, default=0.005)
+    parser.add_argument("--greeting", type=float, default=0.5)
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'mode':<15}{'warm-up':<9}{'opening ms':>12}{'other ms':>10}{'openings':>10}{'calls':>7}")
+    for redis in (False, True):
+        for mode in ("respond", "stream"):
+            for warm in (False, True):
+                opening, other, calls = asyncio.run(run(mode, warm, redis, args))
+                name = mode + ("+redis" if redis else "")
+                print(f"{name:<15}{'on' if warm else 'off':<9}{statistics.mean(opening) * 1000:>12.0f}"
+                      f"{statistics.mean(other) * 1000:>10.0f}{len(opening):>10}{calls:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Throughput across worker processes, with sticky routing and graceful drain.
+
+Scaling: for each count in ``--workers``, that many uvicorn processes
+serving benchmarks.fake_app are started, each with its own NODE_ID and
+in-memory session store. Each process may have ``--llm-concurrency`` calls
+in flight to a FakeLLM with ``--latency`` seconds per call; this is the
+per-process client limit, LLM_MAX_CONCURRENCY. The benchmark client acts as
+the sticky load balancer. New interviews go round robin, and every later
+request goes to the node named in the session id. ``--sessions`` interviews
+per process answer ``--turns`` questions each, and the table shows respond
+throughput and speedup over one process. Scaling flattens once the
+processes need more CPU than the machine has, so os.cpu_count() is printed.
+
+Drain: one process with SESSION_SNAPSHOT_PATH gets SIGTERM while
+``--drain-sessions`` respond calls are in flight, and is then restarted on
+the same port. The output shows how many of those calls completed and how
+many interviews carried on after the restart with their state intact, i.e.
+the next answer was scored against the question asked before the restart.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API = "/api/v1/interview"
+RESUME = "Backend engineer. Python, FastAPI, Kafka and PostgreSQL; led a billing service migration."
+ANSWERS = [
+    "I have five years of backend experience, mostly Python and Go services.",
+    "We moved our ranking to a batch job and cut p99 latency by half.",
+    "I designed the Kafka pipeline and owned its on-call rotation.",
+]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_node(node_id: str, port: int, args, **env) -> subprocess.Popen:
+    environment = dict(os.environ, NODE_ID=node_id, FAKE_LLM_LATENCY=str(args.latency),
+                       LLM_MAX_CONCURRENCY=str(args.llm_concurrency), LOG_LEVEL="WARNING",
+                       SCORE_STORE_PATH="", **env)
+    node = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.fake_app:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/ready", timeout=1.0)
+            return node
+        except httpx.TransportError:
+            if node.poll() is not None:
+                raise RuntimeError(f"node {node_id} exited during startup")
+            time.sleep(0.05)
+    raise RuntimeError(f"node {node_id} did not start")
+
+
+def stop_node(node: subprocess.Popen) -> None:
+    node.send_signal(signal.SIGTERM)
+    node.wait()
+
+
+async def respond(client: httpx.AsyncClient, base: str, session_id: str, answer: str) -> dict:
+    response = await client.post(f"{base}{API}/respond", json={"session_id": session_id, "response": answer})
+    response.raise_for_status()
+    return response.json()
+
+
+async def interview(client: httpx.AsyncClient, nodes: dict, index: int, turns: int) -> int:
+    entry = list(nodes.values())[index % len(nodes)]
+    started = await client.post(f"{entry}{API}/start", params={"resume": RESUME})
+    started.raise_for_status()
+    session_id = started.json()["session_id"]
+    # Sticky routing: the node id is the session id's prefix
+    base = nodes[session_id.split("-", 1)[0]]
+    for turn in range(turns):
+        await respond(client, base, session_id, ANSWERS[turn % len(ANSWERS)])
+    await client.delete(f"{base}{API}/{session_id}")
+    return turns
+
+
+async def run_level(workers: int, args) -> float:
+    ports = {f"node{i}": free_port() for i in range(workers)}
+    processes = [start_node(node_id, port, args) for node_id, port in ports.items()]
+    nodes = {node_id: f"http://127.0.0.1:{port}" for node_id, port in ports.items()}
+    try:
+        async with httpx.AsyncClient(timeout=60.0, limits=httpx.Limits(max_connections=None)) as client:
+            start = time.perf_counter()
+            turns = await asyncio.gather(*(interview(client, nodes, i, args.turns)
+                                           for i in range(args.sessions * workers)))
+            return sum(turns) / (time.perf_counter() - start)
+    finally:
+        for process in processes:
+            stop_node(process)
+
+
+async def drain(args) -> dict:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    snapshot = os.path.join(tempfile.mkdtemp(), "sessions.jsonl")
+    node = start_node("drain", port, args, SESSION_SNAPSHOT_PATH=snapshot)
+    try:
+        async with httpx.AsyncClient(timeout=60.0, limits=httpx.Limits(max_connections=None)) as client:
+            sessions = []
+            for _ in range(args.drain_sessions):
+                started = await client.post(f"{base}{API}/start", params={"resume": RESUME})
+                sessions.append(started.json()["session_id"])
+            in_flight = [asyncio.ensure_future(respond(client, base, s, ANSWERS[0])) for s in sessions]
+            # Let the requests reach the server and their first LLM calls start
+            await asyncio.sleep(args.latency)
+            await asyncio.get_running_loop().run_in_executor(None, stop_node, node)
+            finished = await asyncio.gather(*in_flight, return_exceptions=True)
+
+            node = start_node("drain", port, args, SESSION_SNAPSHOT_PATH=snapshot)
+            continued = await asyncio.gather(*(respond(client, base, s, ANSWERS[1]) for s in sessions),
+                                             return_exceptions=True)
+    finally:
+        stop_node(node)
+    return {
+        "completed": sum(not isinstance(r, Exception) for r in finished),
+        "continued": sum(not isinstance(r, Exception) and r["evaluation"] is not None for r in continued),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--llm-concurrency", type=int, default=4)
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--turns", type=int, default=4)
+    parser.add_argument("--drain-sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU cores; {args.llm_concurrency} LLM calls in flight per process, "
+          f"{args.latency * 1000:.0f} ms per call, {args.sessions} interviews per process")
+    print(f"{'workers':>8}{'turns/s':>10}{'speedup':>9}")
+    baseline = None
+    for workers in args.workers:
+        throughput = asyncio.run(run_level(workers, args))
+        baseline = baseline or throughput
+        print(f"{workers:>8}{throughput:>10.1f}{throughput / baseline:>8.2f}x")
+
+    result = asyncio.run(drain(args))
+    print(f"\ndrain: SIGTERM with {args.drain_sessions} turns in flight; {result['completed']} completed, "
+          f"{result['continued']} interviews continued after restart")
+
+
+if __name__ == "__main__":
+    main()
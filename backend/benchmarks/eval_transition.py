@@ -0,0 +1,92 @@
+"""Evaluate local transition classifiers against logged LLM decisions.
+
+``--decisions`` is JSONL of {"stage", "response", "llm_decision",
+"llm_latency_ms"} as written to TRANSITION_DECISIONS_PATH by the app.
+For each classifier the report shows how many turns it decides locally
+(confidence >= ``--threshold``), how often those local decisions agree with
+the LLM, and the LLM latency those turns no longer pay. With scikit-learn
+installed a TF-IDF model is also trained on a split of the same records.
+
+The default file is synthetic: hand-written answers with hand-assigned
+decisions and made-up latencies, written alongside the keyword rules. It
+checks that the code runs, not that the rules agree with a real model.
+Pass a decision log captured in shadow mode before trusting the numbers.
+"""
+import argparse
+import json
+import os
+import random
+
+from app.transition import KeywordTransitionClassifier, train_transition_model
+
+DEFAULT_DECISIONS = os.path.join(os.path.dirname(__file__), "data", "synthetic_transition_decisions.jsonl")
+
+
+def load_decisions(path: str):
+    with open(path) as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def evaluate(classifier, records, threshold: float):
+    local = agree = 0
+    saved_ms = total_ms = 0.0
+    for record in records:
+        total_ms += record["llm_latency_ms"]
+        decision = classifier.predict(record["stage"], record["response"])
+        if decision is None or decision.confidence < threshold:
+            continue
+        local += 1
+        saved_ms += record["llm_latency_ms"]
+        if ("yes" if decision.should_transition else "no") == record["llm_decision"]:
+            agree += 1
+    return {
+        "turns": len(records),
+        "local": local,
+        "agree": agree,
+        "saved_ms": saved_ms,
+        "total_ms": total_ms,
+    }
+
+
+def report(name: str, result):
+    local = result["local"]
+    turns = result["turns"]
+    # Turns left to the LLM agree with it by definition
+    overall = (result["agree"] + turns - local) / turns if turns else 0.0
+    print(f"{name}:")
+    print(f"  decided locally    {local}/{turns} ({local / turns:.0%})")
+    if local:
+        print(f"  local agreement    {result['agree']}/{local} ({result['agree'] / local:.1%})")
+    print(f"  overall agreement  {overall:.1%}")
+    print(f"  LLM latency saved  {result['saved_ms']:.0f} ms of {result['total_ms']:.0f} ms "
+          f"({result['saved_ms'] / result['total_ms']:.0%}), "
+          f"{result['saved_ms'] / turns:.0f} ms per turn")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", default=DEFAULT_DECISIONS)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--test-fraction", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    records = load_decisions(args.decisions)
+    if args.decisions == DEFAULT_DECISIONS:
+        print("note: synthetic sample, not logged LLM decisions; agreement here is not evidence\n")
+    report("keyword rules", evaluate(KeywordTransitionClassifier(), records, args.threshold))
+
+    shuffled = list(records)
+    random.Random(args.seed).shuffle(shuffled)
+    split = int(len(shuffled) * (1 - args.test_fraction))
+    try:
+        model = train_transition_model(shuffled[:split])
+    except Exception as e:
+        print(f"skipping trained model: {e}")
+        return
+    report(f"tf-idf model (trained on {split}, tested on {len(shuffled) - split})",
+           evaluate(model, shuffled[split:], args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""The API app with the shared LLM client replaced by FakeLLM.
+
+For benchmarks that run the server in separate uvicorn processes, where
+llm_pool.set_client_factory can't be called from the benchmark itself:
+
+    FAKE_LLM_LATENCY=0.05 python -m uvicorn benchmarks.fake_app:app
+"""
+import os
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-placeholder")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("WARM_IMPORTS", "false")
+
+from app import llm_pool
+from benchmarks.fake_llm import FakeLLM
+from main import app
+
+_latency = float(os.getenv("FAKE_LLM_LATENCY", "0.05"))
+llm_pool.set_client_factory(lambda model, temperature: FakeLLM(latency=_latency))
+
+__all__ = ["app"]
@@ -0,0 +1,132 @@
+"""Local stand-in for ChatGoogleGenerativeAI with injected latency.
+
+The fake answers each prompt kind the bot sends (stage transition, question,
+scoring, summary) with a canned but well-formed reply, so the full interview
+flow can be exercised without network access or API keys.
+"""
+import asyncio
+import json
+import random
+import re
+import time
+import zlib
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from app.tokens import estimate_tokens
+
+
+QUESTIONS = [
+    "Can you walk me through a recent project you are proud of?",
+    "What was the hardest technical trade-off you made on that project?",
+    "How did you measure whether your change actually worked?",
+    "Tell me about a time you disagreed with a teammate. What happened?",
+    "What would you want to learn in your first three months here?",
+]
+
+
+LATENCY_DISTRIBUTIONS = ("normal", "lognormal", "constant")
+
+
+class FakeLLM:
+    """
+    ``latency`` is the mean (normal) or median (lognormal) time to the first
+    token. ``jitter`` is the standard deviation in seconds for "normal" and
+    the log-space sigma for "lognormal", which gives the long right tail real
+    APIs show. ``output_tokens`` fixes the completion size reported in usage
+    metadata instead of estimating it from the canned reply.
+    """
+
+    def __init__(self, latency: float = 0.1, jitter: float = 0.0, seed: int = 0,
+                 fused_failure_rate: float = 0.0, token_latency: float = 0.0,
+                 distribution: str = "normal", output_tokens: int = None):
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.latency = latency
+        self.token_latency = token_latency
+        self.jitter = jitter
+        self.distribution = distribution
+        self.output_tokens = output_tokens
+        self.fused_failure_rate = fused_failure_rate
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._random = random.Random(seed)
+
+    def _delay(self) -> float:
+        if not self.jitter or self.distribution == "constant":
+            return self.latency
+        if self.distribution == "lognormal":
+            return self.latency * self._random.lognormvariate(0.0, self.jitter)
+        return max(0.0, self._random.gauss(self.latency, self.jitter))
+
+    def reply(self, prompt: str) -> str:
+        if "single JSON object" in prompt:
+            if self._random.random() < self.fused_failure_rate:
+                return "Sure! Here is the next question: what motivates you?"
+            has_scores = "nothing to score" not in prompt
+            return json.dumps({
+                "move_to_next_stage": False,
+                "question": "Can you walk me through a recent project you are proud of?",
+                "scores": {"relevance": 8, "depth": 7, "clarity": 9, "technical": 6} if has_scores else None,
+                "feedback": "Clear answer with good structure." if has_scores else None
+            })
+        if "Respond with ONLY 'yes'" in prompt:
+            return "no"
+        if "RELEVANCE_SCORE" in prompt:
+            return (
+                "RELEVANCE_SCORE: 8\n"
+                "DEPTH_SCORE: 7\n"
+                "CLARITY_SCORE: 9\n"
+                "TECHNICAL_SCORE: 6\n"
+                "FEEDBACK: Clear answer with good structure."
+            )
+        if "running notes" in prompt:
+            # Keep the notes bounded like a model honouring the word limit
+            limit = int(re.search(r"Word limit: (\d+)", prompt).group(1))
+            exchanges = prompt.split("New exchanges:", 1)[1].split()
+            return " ".join(["Candidate covered:"] + exchanges[:limit - 2])
+        if "Number of questions:" in prompt:
+            count = int(re.search(r"Number of questions: (\d+)", prompt).group(1))
+            start = zlib.crc32(prompt.encode("utf-8"))
+            return "\n".join(f"{i + 1}. {QUESTIONS[(start + i) % len(QUESTIONS)]}" for i in range(count))
+        if "interview summary" in prompt:
+            return "Solid candidate with clear communication."
+        # Deterministic but prompt-dependent, like a real model at a fixed seed
+        return QUESTIONS[zlib.crc32(prompt.encode("utf-8")) % len(QUESTIONS)]
+
+    def _message(self, prompt: str) -> AIMessage:
+        content = self.reply(prompt)
+        input_tokens = estimate_tokens(prompt)
+        output_tokens = self.output_tokens or estimate_tokens(content)
+        self.calls += 1
+        self.prompt_tokens += input_tokens
+        self.completion_tokens += output_tokens
+        return AIMessage(content=content, usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens
+        })
+
+    def _generation_time(self, message: AIMessage) -> float:
+        return self.token_latency * (len(message.content.split(" ")) - 1)
+
+    def invoke(self, prompt: str) -> AIMessage:
+        message = self._message(prompt)
+        time.sleep(self._delay() + self._generation_time(message))
+        return message
+
+    async def ainvoke(self, prompt: str) -> AIMessage:
+        message = self._message(prompt)
+        await asyncio.sleep(self._delay() + self._generation_time(message))
+        return message
+
+
+    async def astream(self, prompt: str):
+        """Yield the reply word by word; ``latency`` is the time to first token"""
+        message = self._message(prompt)
+        await asyncio.sleep(self._delay())
+        for index, word in enumerate(message.content.split(" ")):
+            if index:
+                await asyncio.sleep(self.token_latency)
+            yield AIMessageChunk(content=word if index == 0 else " " + word)
@@ -0,0 +1,47 @@
+"""In-process stand-in for the redis.asyncio client used by RedisSessionStore.
+
+Only the commands the backend uses are implemented (get, set with ex/nx,
+delete). Values are stored as bytes, like a real server returns them, and
+an optional round-trip latency can be injected.
+"""
+import asyncio
+import time
+
+
+class FakeRedis:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self._data = {}
+
+    async def _round_trip(self):
+        await asyncio.sleep(self.latency)
+
+    def _live(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    async def get(self, key):
+        await self._round_trip()
+        return self._live(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        await self._round_trip()
+        if nx and self._live(key) is not None:
+            return None
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        self._data[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    async def delete(self, *keys):
+        await self._round_trip()
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def memory_bytes(self) -> int:
+        return sum(len(key) + len(value) for key, (value, _) in self._data.items())
@@ -0,0 +1,61 @@
+"""Deterministic local stand-ins for the speech engines in app.speech."""
+import asyncio
+import hashlib
+
+from app.speech import Transcript
+
+
+class FakeSpeechToText:
+    """
+    Treats each audio frame as UTF-8 text. Every frame costs ``latency``
+    seconds and produces an interim transcript of the utterance so far;
+    every ``final_every`` frames the utterance is finalized.
+    """
+
+    def __init__(self, latency: float = 0.01, final_every: int = 8):
+        self.latency = latency
+        self.final_every = final_every
+        self.frames = 0
+
+    async def transcribe(self, audio):
+        words = []
+        in_utterance = 0
+        async for chunk in audio:
+            self.frames += 1
+            await asyncio.sleep(self.latency)
+            words.extend(chunk.decode("utf-8", "ignore").split())
+            in_utterance += 1
+            if in_utterance >= self.final_every:
+                yield Transcript(" ".join(words), True)
+                words, in_utterance = [], 0
+            elif words:
+                yield Transcript(" ".join(words), False)
+        if words:
+            await asyncio.sleep(self.latency)
+            yield Transcript(" ".join(words), True)
+
+
+class FakeTextToSpeech:
+    """
+    Renders ``bytes_per_char`` bytes of deterministic noise per character
+    after ``latency`` plus ``char_latency`` per character, roughly the shape
+    of a hosted TTS call.
+    """
+
+    media_type = "audio/mpeg"
+    cache_namespace = "fake:v1"
+
+    def __init__(self, latency: float = 0.15, char_latency: float = 0.002, bytes_per_char: int = 120):
+        self.latency = latency
+        self.char_latency = char_latency
+        self.bytes_per_char = bytes_per_char
+        self.calls = 0
+        self.characters = 0
+
+    async def synthesize(self, text: str) -> bytes:
+        self.calls += 1
+        self.characters += len(text)
+        await asyncio.sleep(self.latency + self.char_latency * len(text))
+        seed = hashlib.sha256(text.encode("utf-8")).digest()
+        size = len(text) * self.bytes_per_char
+        return (seed * (size // len(seed) + 1))[:size]
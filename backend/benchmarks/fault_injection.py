@@ -0,0 +1,228 @@
+"""Fault-injection suite for the LLM call policy.
+
+Drives concurrent interviews through ``aprocess_response`` against a
+FaultyLLM that wraps FakeLLM with injected 5xx/429 errors, slow replies,
+hangs and a full outage. Every attempt is slowed independently, so a
+hedged duplicate can be slow too. Policies are scaled down (deadline ``--timeout``, hedge after
+``--hedge-after``) so the suite runs in seconds. Each scenario
+prints turn latency percentiles and outcome counts and checks the property
+it is about; the process exits non-zero if any check fails.
+"""
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+
+from app.interview_bot import InterviewBot
+from app.llm_policy import CallPolicy, CircuitBreaker, CircuitOpen, LLMCallTimeout
+from benchmarks.fake_llm import FakeLLM
+
+
+class UpstreamError(Exception):
+    """Stands in for google.api_core errors, which carry an HTTP code"""
+
+    def __init__(self, code: int):
+        super().__init__(f"{code} from upstream")
+        self.code = code
+
+
+class FaultyLLM:
+    def __init__(self, inner: FakeLLM, error_rate: float = 0.0, error_code: int = 503,
+                 slow_rate: float = 0.0, slow_seconds: float = 1.0, hang_rate: float = 0.0,
+                 seed: int = 0):
+        self.inner = inner
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self.hang_rate = hang_rate
+        self.outage = False
+        self.calls = 0
+        self._random = random.Random(seed)
+
+    async def _inject(self) -> None:
+        self.calls += 1
+        roll = self._random.random()
+        if self.outage or roll < self.error_rate:
+            await asyncio.sleep(self.inner.latency)
+            raise UpstreamError(self.error_code)
+        roll -= self.error_rate
+        if roll < self.slow_rate:
+            await asyncio.sleep(self.slow_seconds)
+        elif roll - self.slow_rate < self.hang_rate:
+            await asyncio.sleep(3600)
+
+    async def ainvoke(self, prompt: str):
+        await self._inject()
+        return await self.inner.ainvoke(prompt)
+
+    async def astream(self, prompt: str):
+        await self._inject()
+        async for chunk in self.inner.astream(prompt):
+            yield chunk
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def scaled_policies(timeout: float, hedge_after):
+    return {
+        "default": CallPolicy(timeout=timeout, max_retries=2, backoff_base=0.02, backoff_max=0.2),
+        "transition": CallPolicy(timeout=timeout, max_retries=2, backoff_base=0.02, backoff_max=0.2,
+                                 hedge_after=hedge_after),
+        "question": CallPolicy(timeout=timeout, max_retries=2, backoff_base=0.02, backoff_max=0.2,
+                               hedge_after=hedge_after),
+        "evaluate": CallPolicy(timeout=timeout, max_retries=3, backoff_base=0.02, backoff_max=0.2),
+        "summary": CallPolicy(timeout=timeout, max_retries=2, backoff_base=0.02, backoff_max=0.2),
+    }
+
+
+async def run_interviews(llm, breaker, policies, sessions: int, turns: int, score: bool = True):
+    latencies = []
+    outcomes = {"ok": 0, "scoring_failed": 0, "circuit_open": 0, "timeout": 0, "error": 0}
+
+    async def interview(index: int):
+        bot = InterviewBot(llm=llm)
+        bot.llm_cache = None  # measure uncached LLM traffic
+        bot.transition_classifier = None
+        bot.call_policies = policies
+        bot.circuit_breaker = breaker
+        bot.previous_question = "Could you please tell me a bit about yourself?"
+        for turn in range(turns):
+            if not score:
+                # Time only the calls that produce the next question
+                bot.previous_question = None
+            start = time.perf_counter()
+            try:
+                result = await bot.aprocess_response("", f"Answer {turn} from candidate {index}.")
+                evaluation = result["evaluation"] or {}
+                outcomes["scoring_failed" if evaluation.get("scoring_failed") else "ok"] += 1
+            except CircuitOpen:
+                outcomes["circuit_open"] += 1
+            except LLMCallTimeout:
+                outcomes["timeout"] += 1
+            except Exception:
+                outcomes["error"] += 1
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(interview(i) for i in range(sessions)))
+    return latencies, outcomes
+
+
+def report(name: str, latencies, outcomes, checks):
+    failed = [label for label, ok in checks if not ok]
+    print(f"{name:<22}{percentile(latencies, 0.5) * 1000:>8.0f}{percentile(latencies, 0.99) * 1000:>8.0f}"
+          f"{max(latencies) * 1000:>8.0f}  {outcomes}  {'FAIL: ' + ', '.join(failed) if failed else 'ok'}")
+    return not failed
+
+
+async def main_async(args) -> bool:
+    policies = scaled_policies(args.timeout, args.hedge_after)
+    unhedged = scaled_policies(args.timeout, None)
+    turns = args.sessions * args.turns
+    # Worst case for one turn: every attempt of the slowest call times out
+    bound = (args.timeout + 0.2) * 4
+    passed = True
+    print(f"{'scenario':<22}{'p50 ms':>8}{'p99 ms':>8}{'max ms':>8}  outcomes")
+
+    def fake():
+        return FakeLLM(latency=args.latency, jitter=args.latency / 4, seed=args.seed)
+
+    latencies, outcomes = await run_interviews(FaultyLLM(fake()), CircuitBreaker(), policies,
+                                               args.sessions, args.turns)
+    passed &= report("healthy", latencies, outcomes, [("all ok", outcomes["ok"] == turns)])
+
+    llm = FaultyLLM(fake(), error_rate=0.1, error_code=503, seed=args.seed)
+    latencies, outcomes = await run_interviews(llm, CircuitBreaker(failure_threshold=50), policies,
+                                               args.sessions, args.turns)
+    passed &= report("10% 503", latencies, outcomes, [
+        ("retries absorb errors", outcomes["ok"] >= turns * 0.98),
+    ])
+
+    llm = FaultyLLM(fake(), error_rate=0.1, error_code=429, seed=args.seed)
+    latencies, outcomes = await run_interviews(llm, CircuitBreaker(failure_threshold=50), policies,
+                                               args.sessions, args.turns)
+    passed &= report("10% 429", latencies, outcomes, [
+        ("retries absorb errors", outcomes["ok"] >= turns * 0.98),
+    ])
+
+    # Slow tail on the question path (transition + question, no scoring).
+    # A turn makes two or three calls, so about one in eight is slow without
+    # hedging; with it a turn is slow only if an attempt and its duplicate
+    # both are, well under 1%, which can still land on p99 of a short run
+    slow_seconds = args.timeout * 0.8
+    tails, slow_shares = {}, {}
+    for name, chosen in (("5% slow, no hedge", unhedged), ("5% slow, hedged", policies)):
+        llm = FaultyLLM(fake(), slow_rate=0.05, slow_seconds=slow_seconds, seed=args.seed)
+        latencies, outcomes = await run_interviews(llm, CircuitBreaker(), chosen,
+                                                   args.sessions, args.turns, score=False)
+        hedged = chosen is policies
+        tails[hedged] = percentile(latencies, 0.95)
+        slow_shares[hedged] = sum(latency >= slow_seconds for latency in latencies) / len(latencies)
+        checks = [("all ok", outcomes["ok"] == turns)]
+        if hedged:
+            checks.append(("hedging cuts p95", tails[True] < tails[False] / 2))
+            checks.append(("hedging cuts slow turns", slow_shares[True] <= slow_shares[False] / 4))
+        passed &= report(name, latencies, outcomes, checks)
+    print(f"{'':<22}p95 {tails[False] * 1000:.0f} -> {tails[True] * 1000:.0f} ms, "
+          f"slow turns {slow_shares[False]:.1%} -> {slow_shares[True]:.1%}")
+
+    llm = FaultyLLM(fake(), hang_rate=0.03, seed=args.seed)
+    latencies, outcomes = await run_interviews(llm, CircuitBreaker(failure_threshold=50), policies,
+                                               args.sessions, args.turns)
+    passed &= report("3% hang", latencies, outcomes, [
+        ("deadline bounds latency", max(latencies) < bound),
+        ("retries recover", outcomes["ok"] + outcomes["scoring_failed"] >= turns * 0.98),
+    ])
+
+    # Full outage: the breaker opens and later turns fail fast
+    breaker = CircuitBreaker(failure_threshold=5, reset_seconds=args.reset)
+    llm = FaultyLLM(fake(), seed=args.seed)
+    llm.outage = True
+    latencies, outcomes = await run_interviews(llm, breaker, policies, args.sessions, args.turns)
+    calls_during_outage = llm.calls
+    passed &= report("outage", latencies, outcomes, [
+        ("breaker opened", breaker.state != "closed"),
+        ("fails fast", outcomes["circuit_open"] >= turns * 0.5),
+        ("upstream shielded", calls_during_outage < turns * 3),
+    ])
+
+    # Recovery: after reset_seconds one probe turn closes the circuit (other
+    # callers get CircuitOpen while it is in flight) and traffic resumes
+    llm.outage = False
+    await asyncio.sleep(args.reset)
+    await run_interviews(llm, breaker, policies, 1, 1)
+    latencies, outcomes = await run_interviews(llm, breaker, policies, args.sessions, args.turns)
+    passed &= report("recovery", latencies, outcomes, [
+        ("breaker closed", breaker.state == "closed"),
+        ("all ok", outcomes["ok"] == turns),
+    ])
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--timeout", type=float, default=0.5)
+    parser.add_argument("--hedge-after", type=float, default=0.1)
+    parser.add_argument("--reset", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="show retry and error logs")
+    args = parser.parse_args()
+    if not args.verbose:
+        # Every injected fault is logged; keep the report readable
+        logging.getLogger("app").setLevel(logging.CRITICAL)
+
+    passed = asyncio.run(main_async(args))
+    print("all checks passed" if passed else "some checks failed")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
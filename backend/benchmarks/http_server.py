@@ -0,0 +1,22 @@
+"""Serve an ASGI app with uvicorn on a free local port in a daemon thread.
+
+Benchmarks that need real sockets use this instead of httpx's ASGI
+transport, which buffers response bodies.
+"""
+import socket
+import threading
+import time
+
+import uvicorn
+
+
+def start_server(app) -> str:
+    """Start serving ``app`` and return its base URL once it accepts connections"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
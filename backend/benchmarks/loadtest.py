@@ -0,0 +1,284 @@
+"""Offline load test of the interview API against a deterministic fake LLM.
+
+Each virtual user runs whole interviews through the FastAPI app:
+upload-resume, ``--turns`` x respond, summary, delete. ``--concurrency``
+users share ``--interviews`` interviews. The shared LLM client is replaced
+by FakeLLM (seeded latency from ``--distribution``), so runs are repeatable
+and need no API key. Requests go through httpx's ASGI transport by default,
+or through uvicorn on a local port with ``--http``.
+
+Reported: throughput, p50/p95/p99 per endpoint and resident memory per live
+session (RSS growth while ``--rss-sessions`` sessions are held open). Use
+``--output`` to save the results as JSON and ``--compare`` to check them
+against a saved baseline; the process exits non-zero on a regression.
+
+    python -m benchmarks.loadtest --output baseline.json
+    python -m benchmarks.loadtest --compare baseline.json --tolerance 0.15
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+# The app reads these at import time; keep LLM traffic uncached and local
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-placeholder")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx
+
+from app import llm_pool
+from benchmarks.fake_llm import LATENCY_DISTRIBUTIONS, FakeLLM
+from benchmarks.synthetic_pdf import build_pdf
+from main import app
+
+API = "/api/v1/interview"
+ENDPOINTS = ("upload", "respond", "summary", "delete")
+ANSWERS = [
+    "I have five years of backend experience, mostly Python and Go services.",
+    "We moved our ranking to a batch job and cut p99 latency by half.",
+    "I designed the Kafka pipeline and owned its on-call rotation.",
+    "When two teams disagreed on an API I set up a short design review.",
+    "I mentored two juniors and wrote our onboarding guide.",
+    "I'd like to work on larger distributed systems next.",
+]
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def rss_bytes() -> int:
+    """Current resident set size; falls back to peak RSS off Linux"""
+    try:
+        with open("/proc/self/status") as handle:
+            for line in handle:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+class LoadTest:
+    def __init__(self, client: httpx.AsyncClient, turns: int, resumes):
+        self.client = client
+        self.turns = turns
+        self.resumes = resumes
+        self.latencies = {endpoint: [] for endpoint in ENDPOINTS}
+        self.errors = {endpoint: 0 for endpoint in ENDPOINTS}
+
+    async def _request(self, endpoint: str, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response.json()
+        except Exception:
+            self.errors[endpoint] += 1
+            raise
+        finally:
+            self.latencies[endpoint].append(time.perf_counter() - start)
+
+    async def open_session(self, index: int) -> str:
+        pdf = self.resumes[index % len(self.resumes)]
+        started = await self._request("upload", "POST", f"{API}/upload-resume",
+                                      files={"file": (f"resume-{index}.pdf", pdf, "application/pdf")})
+        return started["session_id"]
+
+    async def respond(self, session_id: str, turn: int) -> None:
+        await self._request("respond", "POST", f"{API}/respond",
+                            json={"session_id": session_id, "response": ANSWERS[turn % len(ANSWERS)]})
+
+    async def interview(self, index: int) -> bool:
+        try:
+            session_id = await self.open_session(index)
+            for turn in range(self.turns):
+                await self.respond(session_id, turn)
+            await self._request("summary", "GET", f"{API}/{session_id}/summary")
+            await self._request("delete", "DELETE", f"{API}/{session_id}")
+            return True
+        except Exception:
+            return False
+
+    async def run(self, interviews: int, concurrency: int) -> dict:
+        next_index = iter(range(interviews))
+        completed = 0
+
+        async def user():
+            nonlocal completed
+            for index in next_index:
+                if await self.interview(index):
+                    completed += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        requests = sum(len(values) for values in self.latencies.values())
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "interviews_completed": completed,
+            "interviews_per_second": round(completed / elapsed, 3),
+            "requests_per_second": round(requests / elapsed, 3),
+            "endpoints": {
+                endpoint: {
+                    "count": len(values),
+                    "errors": self.errors[endpoint],
+                    "mean_ms": round(sum(values) / len(values) * 1000, 2) if values else 0.0,
+                    "p50_ms": round(percentile(values, 0.50) * 1000, 2),
+                    "p95_ms": round(percentile(values, 0.95) * 1000, 2),
+                    "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+                }
+                for endpoint, values in self.latencies.items()
+            },
+        }
+
+    async def rss_per_session(self, sessions: int) -> dict:
+        """RSS growth per live session, each one upload plus a couple of turns in"""
+        gc.collect()
+        before = rss_bytes()
+        session_ids = []
+        for index in range(sessions):
+            session_id = await self.open_session(index)
+            for turn in range(min(2, self.turns)):
+                await self.respond(session_id, turn)
+            session_ids.append(session_id)
+        gc.collect()
+        after = rss_bytes()
+        for session_id in session_ids:
+            await self.client.delete(f"{API}/{session_id}")
+        return {
+            "sessions": sessions,
+            "rss_before_bytes": before,
+            "rss_after_bytes": after,
+            "bytes_per_session": round(max(0, after - before) / max(1, sessions)),
+        }
+
+
+# (section, metric, +1 if higher is worse, -1 if lower is worse)
+COMPARED = [("throughput", "interviews_per_second", -1), ("memory", "bytes_per_session", +1)]
+COMPARED += [(f"endpoints.{endpoint}", stat, +1) for endpoint in ENDPOINTS for stat in ("p50_ms", "p95_ms", "p99_ms")]
+# Millisecond-scale routes (delete, cached uploads) jitter by more than 10%
+MIN_LATENCY_DELTA_MS = 2.0
+
+
+def _lookup(results: dict, section: str, metric: str):
+    node = results
+    for key in section.split("."):
+        node = node.get(key, {})
+    return node.get(metric)
+
+
+def compare(baseline: dict, current: dict, tolerance: float):
+    """Return (label, baseline, current, regressed) for every compared metric"""
+    rows = []
+    for section, metric, direction in COMPARED:
+        old, new = _lookup(baseline, section, metric), _lookup(current, section, metric)
+        if old is None or new is None:
+            continue
+        if metric.endswith("_ms"):
+            regressed = new > old * (1 + tolerance) and new - old > MIN_LATENCY_DELTA_MS
+        elif direction > 0:
+            regressed = new > old * (1 + tolerance)
+        else:
+            regressed = new < old * (1 - tolerance)
+        rows.append((f"{section}.{metric}", old, new, regressed))
+    return rows
+
+
+async def main_async(args) -> dict:
+    resumes = [build_pdf(args.pages, seed=seed) for seed in range(args.resume_variants)]
+    if args.http:
+        from benchmarks.http_server import start_server
+        client = httpx.AsyncClient(base_url=start_server(app), timeout=60.0)
+    else:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest",
+                                   timeout=60.0)
+    async with client:
+        # Warm up imports, the PDF worker pool and the shared LLM client
+        await LoadTest(client, args.turns, resumes).interview(0)
+        # Measured before the load run, whose freed memory would be reused
+        memory = await LoadTest(client, args.turns, resumes).rss_per_session(args.rss_sessions)
+        throughput = await LoadTest(client, args.turns, resumes).run(args.interviews, args.concurrency)
+
+    endpoints = throughput.pop("endpoints")
+    return {
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "throughput": throughput,
+        "endpoints": endpoints,
+        "memory": memory,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interviews", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="median LLM latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.3)
+    parser.add_argument("--distribution", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--output-tokens", type=int, default=None)
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--resume-variants", type=int, default=16)
+    parser.add_argument("--rss-sessions", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--http", action="store_true", help="go through uvicorn on a local port")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier --output")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    llm_pool.set_client_factory(lambda model, temperature: FakeLLM(
+        latency=args.latency, jitter=args.jitter, seed=args.seed,
+        distribution=args.distribution, output_tokens=args.output_tokens
+    ))
+    results = asyncio.run(main_async(args))
+
+    throughput = results["throughput"]
+    print(f"{throughput['interviews_completed']} interviews in {throughput['elapsed_seconds']:.1f}s: "
+          f"{throughput['interviews_per_second']:.2f} interviews/s, {throughput['requests_per_second']:.1f} req/s")
+    print(f"{'endpoint':<10}{'count':>7}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for endpoint, stats in results["endpoints"].items():
+        print(f"{endpoint:<10}{stats['count']:>7}{stats['errors']:>8}{stats['p50_ms']:>9.1f}"
+              f"{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}")
+    memory = results["memory"]
+    print(f"rss per session: {memory['bytes_per_session'] / 1024:.1f} KiB over {memory['sessions']} sessions")
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        rows = compare(baseline, results, args.tolerance)
+        print(f"\ncompared with {args.compare} (commit {baseline.get('commit', '?')}), tolerance {args.tolerance:.0%}")
+        for label, old, new, regressed in rows:
+            print(f"{label:<32}{old:>12}{new:>12}  {'REGRESSION' if regressed else 'ok'}")
+        if any(row[3] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
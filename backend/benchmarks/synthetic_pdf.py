@@ -0,0 +1,56 @@
+"""Minimal multi-page PDF writer for building synthetic resume corpora."""
+import random
+
+WORDS = (
+    "python fastapi kafka postgres kubernetes terraform react typescript spark "
+    "airflow led designed migrated optimised mentored delivered scaled reduced "
+    "latency throughput pipeline platform service team project customers revenue"
+).split()
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_pdf(pages: int, lines_per_page: int = 45, seed: int = 0) -> bytes:
+    """Return a valid PDF with ``pages`` pages of pseudo-resume text"""
+    rng = random.Random(seed)
+    objects = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b"")  # filled in once the page tree exists
+    page_tree = add(b"")
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_ids = []
+    for page in range(pages):
+        lines = [f"Experience section {page + 1}"] + [
+            " ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(lines_per_page)
+        ]
+        text = "\n".join(f"({_escape(line)}) Tj T*" for line in lines)
+        stream = f"BT /F1 10 Tf 12 TL 40 800 Td\n{text}\nET".encode("latin-1")
+        content = add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (page_tree, font, content)
+        ))
+
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[page_tree - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % page_tree
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog, xref
+    )
+    return bytes(out)
@@ -1,16 +1,39 @@
+from dotenv import load_dotenv
+
+# Load environment variables before the app modules, which read some of
+# them (session store, resume parser) when they are imported
+load_dotenv()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
-from app.routes import router
-import google.generativeai as genai
+from fastapi.responses import JSONResponse, PlainTextResponse
+from app.llm_cache import flush_llm_cache
+from app.llm_pool import pool_stats
+from app.llm_scheduler import get_scheduler
+from app.metrics import render_metrics
+from app.routes import router, session_store
+from app.score_store import close_score_store
+import asyncio
+import importlib
+import logging
+import math
 import os
 
-# Load environment variables
-load_dotenv()
+# Log level is set here rather than on import, for the app only
+logging.basicConfig(
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+# The HTTP and Google client libraries log every request at INFO, which
+# would add lines to every LLM call; LIBRARY_LOG_LEVEL=INFO brings them back
+for library in ("httpx", "httpcore", "urllib3", "google", "grpc"):
+    logging.getLogger(library).setLevel(os.getenv('LIBRARY_LOG_LEVEL', 'WARNING').upper())
 
-# Configure Google Gemini
-GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
-genai.configure(api_key=GOOGLE_API_KEY)
+logger = logging.getLogger(__name__)
+
+# Imported on first use by the app; preloaded in the background after startup
+# so the first interview doesn't pay for them (WARM_IMPORTS=false to skip)
+WARM_MODULES = ("langchain_google_genai", "langchain.text_splitter")
 
 app = FastAPI(
     title="HR Interview Bot API",
@@ -30,6 +53,86 @@ app.add_middleware(
 # Include routes
 app.include_router(router, prefix="/api/v1")
 
+def _import_warm_modules():
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logger.warning(f"Could not preload {name}: {str(e)}")
+
+@app.on_event("startup")
+async def warm_imports():
+    """Load heavy client libraries off the event loop once the app is serving"""
+    if os.getenv('WARM_IMPORTS', 'true').lower() in ('0', 'false', 'no'):
+        return
+    asyncio.get_running_loop().run_in_executor(None, _import_warm_modules)
+
+@app.on_event("startup")
+async def restore_sessions():
+    """Bring back the sessions saved by the last drain (SESSION_SNAPSHOT_PATH)"""
+    await session_store.restore()
+
+@app.on_event("shutdown")
+async def drain_sessions():
+    """
+    Runs after uvicorn has stopped accepting connections and finished the
+    requests in flight (up to DRAIN_TIMEOUT_SECONDS), so no turn is cut off
+    """
+    await session_store.drain(float(os.getenv('DRAIN_TIMEOUT_SECONDS', '30')))
+
+@app.on_event("shutdown")
+def flush_scores():
+    """Write evaluations still queued for the score store"""
+    close_score_store()
+
+@app.on_event("shutdown")
+def flush_llm_cache_writes():
+    """Commit LLM cache entries still queued for the SQLite tier"""
+    flush_llm_cache()
+
+def _llm_saturation():
+    """(retry-after seconds or None, LLM load details)"""
+    scheduler = get_scheduler()
+    pools = pool_stats()
+    retry_after = scheduler.saturation()
+    if retry_after is None and any(pool["saturated"] for pool in pools.values()):
+        retry_after = 1.0
+    return retry_after, {"scheduler": scheduler.stats(), "pools": pools}
+
+@app.get("/health", include_in_schema=False)
+async def health():
+    """
+    Liveness check; answers as soon as the app is imported. A saturated LLM
+    is reported but stays 200, since restarting the worker wouldn't help.
+    """
+    retry_after, _ = _llm_saturation()
+    return {"status": "ok", "llm_saturated": retry_after is not None}
+
+@app.get("/ready", include_in_schema=False)
+async def ready():
+    """Readiness check; 503 while new interviews would be refused for lack of LLM capacity"""
+    retry_after, load = _llm_saturation()
+    if retry_after is not None:
+        return JSONResponse({"status": "saturated", **load}, status_code=503,
+                            headers={"Retry-After": str(math.ceil(retry_after))})
+    return {"status": "ready", **load}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of per-call spans"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    workers = int(os.getenv('WORKERS', '1'))
+    if workers > 1 and not os.getenv('SESSION_STORE_URL'):
+        # uvicorn balances connections across workers, not sessions; run one
+        # process per NODE_ID behind a sticky load balancer instead
+        raise Exception("WORKERS > 1 needs SESSION_STORE_URL, since in-memory sessions are per process")
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host=os.getenv('HOST', '0.0.0.0'),
+        port=int(os.getenv('PORT', '8000')),
+        workers=workers,
+        timeout_graceful_shutdown=float(os.getenv('DRAIN_TIMEOUT_SECONDS', '30'))
+    )